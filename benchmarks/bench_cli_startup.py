@@ -0,0 +1,182 @@
+"""명령줄 도구 시작 시간 벤치마크
+
+sheet_calendar_sync.cli의 --help와 plan --offline(캘린더 사본과 시트 스냅샷만
+사용)을 별도 프로세스로 실행해 걸린 시간과 모듈 import 시간을 측정합니다. import 시간은
+-X importtime 출력에서 빈 인터프리터(python -c pass)도 불러오는 모듈을 뺀 합계이고,
+예산(--budget-ms)을 넘거나 구글 API 클라이언트 등 무거운 모듈을 불러오면 종료
+코드 1로 끝납니다. 저장소 루트에서 실행합니다.
+
+    python -m benchmarks.bench_cli_startup
+    python -m benchmarks.bench_cli_startup --rows 20000 --budget-ms 100
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Set, Tuple
+from benchmarks.synthetic_data import generate_dataset
+from sheet_calendar_sync.calendar_mirror import CalendarMirror
+from sheet_calendar_sync.sheet_manager import GoogleSheetManager
+from sheet_calendar_sync.sheet_snapshot import SheetSnapshot
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CALENDAR_ID = "bench@group.calendar.google.com"
+SHEET_TAB = "bench"
+SHEET_RANGE = "E5:M"
+CLI_MODULE = "sheet_calendar_sync.cli"
+# --help와 plan --offline에서 불러오면 안 되는 모듈 (패키지 이름이면 하위 모듈 포함)
+HEAVY_MODULES = (
+    "googleapiclient",
+    "google",
+    "httplib2",
+    "rich",
+    "dateutil",
+    "sheet_calendar_sync.daemon",
+    "sheet_calendar_sync.sheet_manager",
+)
+
+
+def prepare_cache(rows: int, work_dir: str) -> Dict[str, str]:
+    """합성 데이터로 캘린더 사본과 시트 스냅샷을 만들고 plan --offline에 쓸
+    환경 변수를 반환합니다."""
+    dataset = generate_dataset(rows)
+    mirror_path = os.path.join(work_dir, "mirror.sqlite3")
+    snapshot_path = os.path.join(work_dir, "snapshot.json")
+
+    mirror = CalendarMirror(CALENDAR_ID, mirror_path)
+    mirror.apply_events(dataset.events)
+    mirror.close()
+
+    snapshot = SheetSnapshot(snapshot_path, f"{SHEET_TAB}!{SHEET_RANGE}")
+    delta = snapshot.diff(dataset.rows, 5)
+    snapshot.update(delta, GoogleSheetManager.transform_sheet_delta(delta))
+    snapshot.save()
+
+    return dict(
+        os.environ,
+        SYNC_PAIRS_CONFIG="",
+        SHEET_ID="bench-sheet",
+        CALENDAR_ID=CALENDAR_ID,
+        SHEET_TABS=SHEET_TAB,
+        CALENDAR_MIRROR_PATH=mirror_path,
+        SHEET_SNAPSHOT_PATH=snapshot_path,
+    )
+
+
+def is_heavy(module: str) -> bool:
+    """--help와 plan --offline에서 불러오면 안 되는 모듈인지 확인합니다."""
+    return module in HEAVY_MODULES or module.split(".")[0] in HEAVY_MODULES
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """-X importtime 출력에서 최상위 import별 누적 시간(마이크로초)을 구합니다."""
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not name.startswith("  "):
+            imports[name.strip()] = int(cumulative)
+    return imports
+
+
+def measure(
+    command: List[str], env: Dict[str, str], repeat: int
+) -> Tuple[float, Dict[str, int], Set[str]]:
+    """명령을 repeat번 실행한 중앙값(초)과 마지막 실행의 import 시간, 불러온 모듈
+    목록을 반환합니다."""
+    elapsed = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *command],
+            cwd=ROOT_DIR,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+        elapsed.append(time.perf_counter() - started)
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *command],
+        cwd=ROOT_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    imports = parse_importtime(process.stderr)
+    modules = {
+        line.rsplit("|", 1)[1].strip()
+        for line in process.stderr.splitlines()
+        if line.startswith("import time:") and "cumulative" not in line
+    }
+    return statistics.median(elapsed), imports, modules
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--budget-ms", type=float, default=100.0, help="명령별 import 시간 예산"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench-cli-") as work_dir:
+        env = prepare_cache(args.rows, work_dir)
+        baseline, baseline_imports, baseline_modules = measure(
+            ["-c", "pass"], env, args.repeat
+        )
+        commands = {
+            "--help": ["-m", CLI_MODULE, "--help"],
+            "plan --offline": ["-m", CLI_MODULE, "plan", "--offline"],
+            # 비교용 (구글 API 클라이언트를 불러옴)
+            "import main": ["-c", "import sheet_calendar_sync.main"],
+        }
+
+        print(f"python -c pass: {baseline * 1000:.1f}ms ({args.rows} rows)")
+        print(f"{'command':<16} {'wall(ms)':>9} {'+wall(ms)':>10} {'import(ms)':>11}")
+        over_budget = []
+        for label, command in commands.items():
+            elapsed, imports, modules = measure(command, env, args.repeat)
+            import_ms = (
+                sum(
+                    cumulative
+                    for name, cumulative in imports.items()
+                    if name not in baseline_imports
+                )
+                / 1000
+            )
+            extra_ms = (elapsed - baseline) * 1000
+            print(
+                f"{label:<16} {elapsed * 1000:>9.1f} {extra_ms:>10.1f}"
+                f" {import_ms:>11.1f}"
+            )
+            if label == "import main":
+                continue
+            heavy = sorted(
+                module
+                for module in modules
+                if is_heavy(module) and module not in baseline_modules
+            )
+            if heavy:
+                over_budget.append(f"{label}: 무거운 모듈을 불러옴 {heavy[:5]}")
+            if import_ms > args.budget_ms:
+                over_budget.append(
+                    f"{label}: import {import_ms:.1f}ms > {args.budget_ms:.0f}ms"
+                )
+
+    for message in over_budget:
+        print(message)
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run()
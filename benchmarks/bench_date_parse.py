@@ -0,0 +1,90 @@
+"""날짜 파싱 마이크로 벤치마크
+
+dateutil.parser.parse를 매번 호출하던 기존 방식과 utils의 빠른 경로(정규식 +
+캐시)를 비교합니다. 캘린더 날짜는 CalendarEvent.from_events가 사용하는 열 단위
+변환도 측정합니다. 저장소 루트에서 실행합니다.
+
+    python -m benchmarks.bench_date_parse
+"""
+
+import random
+import time
+from datetime import date, timedelta
+from typing import Callable, List
+from dateutil.parser import parse
+from sheet_calendar_sync import utils
+
+SIZE = 100_000
+# 1년치 날짜가 반복되는 실제 데이터와 비슷하게 365일 범위에서 생성
+DAYS = 365
+
+
+def generate_values(size: int, seed: int = 0) -> List[List[str]]:
+    """캘린더 date/dateTime 값과 시트 기간 값을 만듭니다."""
+    rng = random.Random(seed)
+    base = date(2025, 1, 1)
+    dates, date_times, ranges = [], [], []
+    for _ in range(size):
+        day = base + timedelta(days=rng.randrange(DAYS))
+        # 체험 기간은 보통 1주/2주/한 달 단위
+        end = day + timedelta(days=rng.choice([0, 6, 13, 29]))
+        dates.append(day.isoformat())
+        date_times.append(f"{day.isoformat()}T{rng.randrange(24):02d}:00:00+09:00")
+        ranges.append(f"{day:%Y.%m.%d} ~ {end:%Y.%m.%d}")
+    return [dates, date_times, ranges]
+
+
+def legacy_datetime(value: str) -> str:
+    return parse(value).date().isoformat()
+
+
+def legacy_range(value: str) -> str:
+    """기존 transform_range_date_to_date의 처리 방식을 재현합니다."""
+    cleaned = utils.remove_non_words(value).replace(" ", "").replace("  ", "")
+    parts = cleaned.split("~")
+    if len(parts) > 1 and parts[0] > parts[1]:
+        raise ValueError("시작 날짜가 종료 날짜보다 늦습니다.")
+    return parts[-1].replace(".", "-")
+
+
+def measure(func: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def clear_caches() -> None:
+    utils.parse_date.cache_clear()
+    utils.transform_range_date_to_date.cache_clear()
+
+
+def run() -> None:
+    dates, date_times, ranges = generate_values(SIZE)
+    cases = [
+        ("date", dates, legacy_datetime, utils.transform_datetime_to_date,
+         utils.transform_datetimes_to_dates),
+        ("dateTime", date_times, legacy_datetime, utils.transform_datetime_to_date,
+         utils.transform_datetimes_to_dates),
+        # 시트 행은 행 단위로 변환 오류를 처리하므로 열 단위 변환을 쓰지 않음
+        ("sheet range", ranges, legacy_range, utils.transform_range_date_to_date,
+         None),
+    ]
+    print(f"{SIZE:,} values each")
+    print(f"{'input':>12} {'legacy(s)':>10} {'per-value(s)':>13} {'column(s)':>10}")
+    for name, values, legacy, per_value, column in cases:
+        legacy_elapsed = measure(lambda: [legacy(value) for value in values])
+        clear_caches()
+        per_value_elapsed = measure(lambda: [per_value(value) for value in values])
+        column_elapsed = "-"
+        if column is not None:
+            clear_caches()
+            column_elapsed = f"{measure(lambda: column(values)):.3f}"
+            assert column(values) == [per_value(value) for value in values]
+        print(
+            f"{name:>12} {legacy_elapsed:>10.3f} {per_value_elapsed:>13.3f}"
+            f" {column_elapsed:>10}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,195 @@
+"""가짜 API 서버를 상대로 한 전체 동기화 벤치마크
+
+synthetic_data로 만든 시트/캘린더를 fake_google 서버에 올리고, main.main을 별도
+프로세스로 실행해 실제 실행과 같은 경로(인증, 조회, 비교, 배치 반영)를 측정합니다.
+실행마다 걸린 시간, HTTP 요청 수, API 메서드별 호출 수, 주고받은 바이트 수,
+프로세스 최대 RSS를 출력합니다. 저장소 루트에서 실행합니다.
+
+    python -m benchmarks.bench_end_to_end
+    python -m benchmarks.bench_end_to_end --sizes 1000 10000 100000 --latency 0.05
+    python -m benchmarks.bench_end_to_end --mode snapshot --error-rate 0.01
+    python -m benchmarks.bench_end_to_end --bandwidth 1000000 --sheet-chunk-rows 2000
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+import rsa
+from benchmarks.fake_google import FakeGoogleServer, FakeGoogleState
+from benchmarks.synthetic_data import generate_dataset
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SHEET_ID = "bench-sheet"
+CALENDAR_ID = "bench@group.calendar.google.com"
+SHEET_TAB = "bench"
+# mirror/snapshot 모드는 두 번째 실행부터 변경분만 처리하므로 두 번 실행
+RUNS = {"full": 1, "snapshot": 2, "mirror": 2}
+
+
+def write_service_account(path: str, token_uri: str) -> None:
+    """가짜 서버에서 token을 발급받는 서비스 계정 키 파일을 만듭니다."""
+    _, key = rsa.newkeys(2048)
+    private_key = key.save_pkcs1().decode()
+    info = {
+        "type": "service_account",
+        "project_id": "bench",
+        "private_key_id": "bench",
+        "private_key": private_key,
+        "client_email": "bench@bench.iam.gserviceaccount.com",
+        "client_id": "0",
+        "token_uri": token_uri,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(info, f)
+
+
+def run_main(env: Dict[str, str], log_path: str) -> Dict:
+    """main.main을 별도 프로세스로 실행하고 걸린 시간과 최대 RSS를 반환합니다."""
+    with open(log_path, "w", encoding="utf-8") as log:
+        started = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-c", "from sheet_calendar_sync import main; main.main()"],
+            cwd=ROOT_DIR,
+            env=env,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+        _, status, usage = os.wait4(process.pid, 0)
+        elapsed = time.perf_counter() - started
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return {
+        "seconds": elapsed,
+        "exit_code": process.returncode,
+        # Linux의 ru_maxrss 단위는 KiB
+        "peak_rss_mib": usage.ru_maxrss / 1024,
+    }
+
+
+def run_scenario(size: int, args: argparse.Namespace, work_dir: str) -> List[Dict]:
+    dataset = generate_dataset(size, args.seed)
+    state = FakeGoogleState(
+        sheets={SHEET_ID: {SHEET_TAB: dataset.rows}},
+        calendars={CALENDAR_ID: dataset.events},
+    )
+    results = []
+    with FakeGoogleServer(
+        state,
+        latency=args.latency,
+        bandwidth=args.bandwidth,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    ) as server:
+        key_path = os.path.join(work_dir, "service_account.json")
+        write_service_account(key_path, f"{server.root_url}token")
+        env = dict(
+            os.environ,
+            CLIENT_SECRET_FILE=key_path,
+            SHEET_ID=SHEET_ID,
+            CALENDAR_ID=CALENDAR_ID,
+            SHEET_TABS=SHEET_TAB,
+            GOOGLE_API_ROOT=server.root_url,
+            QUOTA_RATES=f"calendar={args.rate},sheets={args.rate}",
+            WRITE_CONCURRENCY=str(args.concurrency),
+            LIST_CONCURRENCY=str(args.list_concurrency),
+            SHEET_CHUNK_ROWS=str(args.sheet_chunk_rows),
+            TOKEN_CACHE_PATH="",
+            SYNC_JOURNAL_PATH="",
+            CALENDAR_MIRROR_PATH=(
+                os.path.join(work_dir, f"mirror-{size}.sqlite3")
+                if args.mode == "mirror"
+                else ""
+            ),
+            SHEET_SNAPSHOT_PATH=(
+                os.path.join(work_dir, f"snapshot-{size}.json")
+                if args.mode == "snapshot"
+                else ""
+            ),
+        )
+        for run in range(1, RUNS[args.mode] + 1):
+            before = server.stats()
+            log_path = os.path.join(work_dir, f"main-{size}-{run}.log")
+            result = run_main(env, log_path)
+            after = server.stats()
+            result.update(
+                size=size,
+                run=run,
+                events=len(dataset.events),
+                http_requests=after["http_requests"] - before["http_requests"],
+                api_calls={
+                    name: count - before["api_calls"].get(name, 0)
+                    for name, count in after["api_calls"].items()
+                    if count - before["api_calls"].get(name, 0)
+                },
+                bytes_in=after["bytes_in"] - before["bytes_in"],
+                bytes_out=after["bytes_out"] - before["bytes_out"],
+                log_path=log_path,
+            )
+            results.append(result)
+    return results
+
+
+def print_results(results: List[Dict]) -> None:
+    print(
+        f"{'rows':>7} {'run':>3} {'seconds':>8} {'http':>6} {'sent(KiB)':>10}"
+        f" {'recv(KiB)':>10} {'rss(MiB)':>9} {'exit':>4}"
+    )
+    for result in results:
+        print(
+            f"{result['size']:>7} {result['run']:>3} {result['seconds']:>8.2f}"
+            f" {result['http_requests']:>6} {result['bytes_in'] / 1024:>10.0f}"
+            f" {result['bytes_out'] / 1024:>10.0f} {result['peak_rss_mib']:>9.1f}"
+            f" {result['exit_code']:>4}"
+        )
+    print()
+    for result in results:
+        print(f"{result['size']:>7} {result['run']:>3}  {result['api_calls']}")
+        if result["exit_code"] != 0:
+            print(f"        main 실행 실패: {result['log_path']}")
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--mode", choices=sorted(RUNS), default="full")
+    parser.add_argument("--latency", type=float, default=0.0, help="요청당 지연(초)")
+    parser.add_argument(
+        "--bandwidth", type=float, default=0.0, help="응답당 전송 속도(바이트/초)"
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=429)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument(
+        "--list-concurrency", type=int, default=0, help="이벤트 목록 동시 조회 수"
+    )
+    parser.add_argument(
+        "--sheet-chunk-rows", type=int, default=0, help="시트를 나눠 읽을 행 수"
+    )
+    parser.add_argument(
+        "--rate", type=float, default=1000.0, help="API별 초당 요청 수 제한"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench-e2e-") as work_dir:
+        for size in args.sizes:
+            results.extend(run_scenario(size, args, work_dir))
+        print_results(results)
+        if any(result["exit_code"] for result in results):
+            failed = next(result for result in results if result["exit_code"])
+            with open(failed["log_path"], encoding="utf-8") as f:
+                print(f.read()[-3000:])
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,140 @@
+"""lean(fields 마스크) 모드와 전체 응답 모드의 전송량/파싱 시간 벤치마크
+
+기록된 events.list / values.get 응답(benchmarks/fixtures)을 이벤트 수만큼 복제한 뒤,
+서버가 fields 마스크를 적용한 것과 같은 응답을 만들어 바이트 수(원본, gzip)와
+json 파싱 시간을 비교합니다. 저장소 루트에서 실행합니다.
+
+    python -m benchmarks.bench_lean_wire
+"""
+
+import copy
+import gzip
+import json
+import os
+import time
+from typing import Dict, List, Tuple
+from sheet_calendar_sync.calendar_manager import LEAN_LIST_FIELDS
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+EVENT_COUNTS = [1_000, 10_000]
+PAGE_SIZE = 250
+SHEET_ROWS = 5_000
+
+
+def parse_field_mask(mask: str) -> Dict:
+    """"a,b(c,d)" 형식의 fields 마스크를 {"a": {}, "b": {"c": {}, "d": {}}}로
+    변환합니다."""
+    tree: Dict = {}
+    stack = [tree]
+    name = ""
+    for char in mask + ",":
+        if char == "(":
+            child: Dict = {}
+            stack[-1][name.strip()] = child
+            stack.append(child)
+            name = ""
+        elif char in ",)":
+            if name.strip():
+                stack[-1][name.strip()] = {}
+            name = ""
+            if char == ")":
+                stack.pop()
+        else:
+            name += char
+    return tree
+
+
+def apply_field_mask(value, tree: Dict):
+    """fields 마스크 트리를 응답 값에 적용합니다. 하위 필드가 없으면 값 전체를
+    유지합니다."""
+    if not tree:
+        return value
+    if isinstance(value, list):
+        return [apply_field_mask(item, tree) for item in value]
+    if isinstance(value, dict):
+        return {
+            key: apply_field_mask(value[key], subtree)
+            for key, subtree in tree.items()
+            if key in value
+        }
+    return value
+
+
+def load_fixture(name: str) -> Dict:
+    with open(os.path.join(FIXTURE_DIR, name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def build_calendar_pages(event_count: int) -> List[Dict]:
+    """기록된 events.list 응답을 event_count개 이벤트, PAGE_SIZE 단위 페이지로
+    복제합니다."""
+    fixture = load_fixture("calendar_events_list.json")
+    templates = fixture["items"]
+    pages = []
+    for start in range(0, event_count, PAGE_SIZE):
+        page = copy.deepcopy(fixture)
+        page["items"] = []
+        for index in range(start, min(start + PAGE_SIZE, event_count)):
+            item = copy.deepcopy(templates[index % len(templates)])
+            item["id"] = f"{item['id']}{index:06d}"
+            item["iCalUID"] = f"{item['id']}@google.com"
+            item["summary"] = f"{item['summary']}{index}"
+            page["items"].append(item)
+        if start + PAGE_SIZE >= event_count:
+            page.pop("nextPageToken", None)
+            page["nextSyncToken"] = "CPDAlvWDx70CEPDAlvWDx70CGAU="
+        pages.append(page)
+    return pages
+
+
+def build_sheet_response(row_count: int) -> Dict:
+    fixture = load_fixture("sheet_values_get.json")
+    template = fixture["values"][0]
+    fixture["values"] = [
+        template[:3] + [f"{template[3]}{index}"] + template[4:]
+        for index in range(row_count)
+    ]
+    return fixture
+
+
+def measure(payloads: List[Dict]) -> Tuple[int, int, float]:
+    """응답 목록의 바이트 수, gzip 바이트 수, json 파싱 시간을 측정합니다."""
+    encoded = [
+        json.dumps(payload, ensure_ascii=False).encode("utf-8") for payload in payloads
+    ]
+    raw_bytes = sum(len(body) for body in encoded)
+    gzip_bytes = sum(len(gzip.compress(body)) for body in encoded)
+    started = time.perf_counter()
+    for body in encoded:
+        json.loads(body)
+    return raw_bytes, gzip_bytes, time.perf_counter() - started
+
+
+def report(label: str, full: List[Dict], lean: List[Dict]) -> None:
+    full_raw, full_gzip, full_parse = measure(full)
+    lean_raw, lean_gzip, lean_parse = measure(lean)
+    print(
+        f"{label:<22} {'full':>5} raw={full_raw:>11,} gzip={full_gzip:>9,}"
+        f" parse={full_parse * 1000:>8.1f}ms"
+    )
+    print(
+        f"{'':<22} {'lean':>5} raw={lean_raw:>11,} gzip={lean_gzip:>9,}"
+        f" parse={lean_parse * 1000:>8.1f}ms"
+        f"  ({lean_raw / full_raw:.0%} of full)"
+    )
+
+
+def run() -> None:
+    list_mask = parse_field_mask(LEAN_LIST_FIELDS)
+    for event_count in EVENT_COUNTS:
+        pages = build_calendar_pages(event_count)
+        lean_pages = [apply_field_mask(page, list_mask) for page in pages]
+        report(f"events.list {event_count:,}", pages, lean_pages)
+
+    sheet = build_sheet_response(SHEET_ROWS)
+    lean_sheet = apply_field_mask(sheet, parse_field_mask("values"))
+    report(f"values.get {SHEET_ROWS:,}", [sheet], [lean_sheet])
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,155 @@
+"""페이지 조회부터 인덱싱까지의 최대 메모리 벤치마크
+
+기존 방식(전체 페이지를 모은 뒤 dict 목록으로 변환하고 인덱싱)과 레코드 +
+제너레이터 파이프라인(페이지 하나씩 변환하여 바로 인덱싱)의 tracemalloc 최대
+메모리를 비교합니다. 저장소 루트에서 실행합니다.
+
+    python -m benchmarks.bench_pipeline_memory
+"""
+
+import random
+import tracemalloc
+from datetime import date, timedelta
+from typing import Callable, Dict, Iterator, List, Tuple
+from sheet_calendar_sync.calendar_manager import GoogleCalendarManager
+from sheet_calendar_sync.event_handler import EventSynchronizer
+from sheet_calendar_sync.reconciler import Reconciler
+from sheet_calendar_sync.sheet_manager import GoogleSheetManager
+from sheet_calendar_sync.event_body import get_content_hash
+from sheet_calendar_sync.utils import (
+    remove_non_words,
+    transform_datetime_to_date,
+    transform_range_date_to_date,
+)
+
+SIZES = [10_000, 50_000]
+PAGE_SIZE = 250
+
+
+def fake_pages(size: int, seed: int = 0) -> Iterator[List[Dict]]:
+    """events.list 응답 items와 같은 형식의 이벤트를 페이지 단위로 만듭니다.
+    실제 API처럼 페이지를 요청할 때마다 새 객체가 만들어집니다."""
+    rng = random.Random(seed)
+    base = date(2026, 1, 1)
+    for start in range(0, size, PAGE_SIZE):
+        page = []
+        for i in range(start, min(start + PAGE_SIZE, size)):
+            day = base + timedelta(days=rng.randrange(365))
+            page.append(
+                {
+                    "id": f"evt{i:08d}",
+                    "status": "confirmed",
+                    "summary": f"체험업체 {i}",
+                    "description": (
+                        f"사이트: site{i % 7}\n지역: 서울\n제공내역: {i}원\n비고: 없음"
+                    ),
+                    "start": {"date": day.isoformat()},
+                    "end": {"date": (day + timedelta(days=1)).isoformat()},
+                    "created": "2025-12-01T00:00:00.000Z",
+                    "extendedProperties": {"private": {"syncHash": f"{i:016x}"}},
+                }
+            )
+        yield page
+
+
+def fake_sheet_rows(size: int, seed: int = 1) -> List[List[str]]:
+    rng = random.Random(seed)
+    base = date(2026, 1, 1)
+    rows = []
+    for i in range(size):
+        day = base + timedelta(days=rng.randrange(365))
+        rows.append(
+            [
+                f"site{i % 7}",
+                "구분",
+                "서울",
+                f"체험업체 {i}",
+                f"{day:%Y.%m.%d} ~ {day:%Y.%m.%d}",
+                "",
+                f"{i}원",
+                "",
+                "없음",
+            ]
+        )
+    return rows
+
+
+def legacy_transform_calendar(events: List[Dict]) -> List[Dict]:
+    """기존 transform_calendar_data의 dict 변환을 재현합니다."""
+    transformed = []
+    for item in events:
+        start = item["start"].get("dateTime", item["start"].get("date"))
+        transformed.append(
+            {
+                "event_id": item.get("id"),
+                "summary": remove_non_words(item.get("summary") or ""),
+                "dataTime": transform_datetime_to_date(item["end"]["date"]),
+                "start_date": transform_datetime_to_date(start),
+                "description": item.get("description") or "",
+                "content_hash": get_content_hash(item),
+            }
+        )
+    return transformed
+
+
+def legacy_transform_sheet(rows: List[List[str]]) -> List[Dict]:
+    """기존 transform_sheet_data의 dict 변환을 재현합니다."""
+    return [
+        {
+            "summary": remove_non_words(row[3]),
+            "due_date": transform_range_date_to_date(row[4]),
+            "description": (
+                f"사이트: {row[0]}\n지역: {row[2]}\n제공내역: {row[6]}\n비고: {row[8]}"
+            ),
+        }
+        for row in rows
+    ]
+
+
+def legacy_pipeline(size: int, rows: List[List[str]]) -> Tuple[int, int]:
+    events = [item for page in fake_pages(size) for item in page]
+    calendar_data = legacy_transform_calendar(events)
+    sheet_data = EventSynchronizer.limit_calendar_data_by_datetime(
+        legacy_transform_sheet(rows), 52
+    )
+    sheet_index = Reconciler.index_sheet_data(sheet_data)
+    calendar_index = Reconciler.index_calendar_data(calendar_data)
+    return len(sheet_index), len(calendar_index)
+
+
+def streaming_pipeline(size: int, rows: List[List[str]]) -> Tuple[int, int]:
+    events = (item for page in fake_pages(size) for item in page)
+    calendar_data = GoogleCalendarManager.iter_transform_calendar_data(events)
+    sheet_data = EventSynchronizer.iter_limited_by_datetime(
+        GoogleSheetManager.iter_transform_sheet_data(rows), 52
+    )
+    sheet_index = Reconciler.index_sheet_data(sheet_data)
+    calendar_index = Reconciler.index_calendar_data(calendar_data)
+    return len(sheet_index), len(calendar_index)
+
+
+def peak_memory(func: Callable[[], Tuple[int, int]]) -> Tuple[float, Tuple[int, int]]:
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024, result
+
+
+def run() -> None:
+    print(f"{'events':>8} {'legacy(MiB)':>12} {'streaming(MiB)':>15} {'ratio':>6}")
+    for size in SIZES:
+        rows = fake_sheet_rows(size)
+        legacy_peak, legacy_result = peak_memory(lambda: legacy_pipeline(size, rows))
+        streaming_peak, streaming_result = peak_memory(
+            lambda: streaming_pipeline(size, rows)
+        )
+        assert legacy_result == streaming_result
+        print(
+            f"{size:>8} {legacy_peak:>12.1f} {streaming_peak:>15.1f}"
+            f" {streaming_peak / legacy_peak:>6.2f}"
+        )
+
+
+if __name__ == "__main__":
+    run()
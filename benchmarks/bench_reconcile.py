@@ -0,0 +1,88 @@
+"""동기화 계획 생성 벤치마크
+
+기존 check_new_events(리스트 비교 + summary 재탐색) 방식과 Reconciler.build_plan을
+행 수별로 비교합니다. build_plan은 요청 본문 캐시가 빈 상태(cold)와 같은 데이터로
+한 번 더 실행해 캐시에서 본문을 재사용하는 상태(warm, 데몬의 반복 동기화)를 각각
+측정합니다. 저장소 루트에서 실행합니다.
+
+    python -m benchmarks.bench_reconcile
+"""
+
+import random
+import time
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+from sheet_calendar_sync.event_body import EVENT_BODY_CACHE
+from sheet_calendar_sync.reconciler import Reconciler
+
+SIZES = [1_000, 10_000, 100_000]
+# 기존 방식은 O(n·m)이라 이 크기까지만 측정
+LEGACY_MAX_SIZE = 10_000
+
+
+def generate_data(size: int, seed: int = 0) -> Tuple[List[Dict], List[Dict]]:
+    """size개의 시트 행과 그중 90%가 이미 등록된 캘린더 이벤트를 만듭니다."""
+    rng = random.Random(seed)
+    base = date(2025, 1, 1)
+    sheet_data = []
+    calendar_data = []
+    for i in range(size):
+        due_date = (base + timedelta(days=rng.randrange(365))).isoformat()
+        summary = f"체험업체{i}"
+        description = f"사이트: site{i % 7}\n지역: 서울\n제공내역: {i}원\n비고: 없음"
+        sheet_data.append(
+            {"summary": summary, "due_date": due_date, "description": description}
+        )
+        if rng.random() < 0.9:
+            calendar_data.append(
+                {
+                    "event_id": f"evt{i}",
+                    "summary": summary,
+                    "start_date": due_date,
+                    "description": description if rng.random() < 0.95 else "",
+                }
+            )
+    return sheet_data, calendar_data
+
+
+def legacy_plan(sheet_data: List[Dict], calendar_data: List[Dict]) -> int:
+    """기존 check_new_events + insert_events의 비교 방식을 재현합니다."""
+    new_events = [event.get("summary") for event in sheet_data]
+    existing_events = [event.get("summary") for event in calendar_data]
+    new_event_list = [item for item in new_events if item not in existing_events]
+    matched = 0
+    for event in new_event_list:
+        for sheet_item in sheet_data:
+            if event == sheet_item.get("summary"):
+                matched += 1
+    return matched
+
+
+def run() -> None:
+    print(f"{'rows':>8} {'cold(s)':>8} {'warm(s)':>8} {'legacy(s)':>10}  plan")
+    for size in SIZES:
+        sheet_data, calendar_data = generate_data(size)
+
+        EVENT_BODY_CACHE.clear()
+        started = time.perf_counter()
+        plan = Reconciler.build_plan(sheet_data, calendar_data)
+        cold_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        Reconciler.build_plan(sheet_data, calendar_data)
+        warm_elapsed = time.perf_counter() - started
+
+        legacy_elapsed = "-"
+        if size <= LEGACY_MAX_SIZE:
+            started = time.perf_counter()
+            legacy_plan(sheet_data, calendar_data)
+            legacy_elapsed = f"{time.perf_counter() - started:.3f}"
+
+        print(
+            f"{size:>8} {cold_elapsed:>8.3f} {warm_elapsed:>8.3f}"
+            f" {legacy_elapsed:>10}  {plan.counts()}"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,595 @@
+"""구글 Sheets/Calendar API를 흉내 내는 로컬 가짜 서버
+
+오프라인 벤치마크에서 GoogleService(api_root=...)가 요청을 보낼 수 있도록 다음
+엔드포인트를 제공합니다.
+
+- POST token (서비스 계정 access token 발급)
+- GET  v4/spreadsheets/{id} (탭별 행 수 메타데이터)
+- GET  v4/spreadsheets/{id}/values/{range}, v4/spreadsheets/{id}/values:batchGet
+- GET/POST calendar/v3/calendars/{id}/events (list, insert)
+- GET/PUT/PATCH/DELETE calendar/v3/calendars/{id}/events/{eventId}
+- POST batch/calendar/v3 (multipart/mixed 배치)
+- POST calendar/v3/calendars/{id}/events/watch, drive/v3/files/{id}/watch,
+  {calendar,drive}/v3/channels/stop (푸시 알림 채널)
+
+요청마다 지연 시간을 넣을 수 있고, 정해진 비율로 할당량 초과(429 등) 오류를
+돌려줄 수 있습니다. 요청 수와 주고받은 바이트 수를 API 메서드별로 기록합니다.
+
+알림 채널을 만들면 구글처럼 채널 주소로 sync 알림을 보내고, API로 캘린더
+이벤트가 바뀌거나 update_sheet로 시트를 바꾸면 해당 채널 주소로 변경 알림을
+POST합니다. 데몬 모드를 로컬에서 시험할 때 사용합니다.
+
+    with FakeGoogleServer(state, latency=0.05) as server:
+        GoogleService(..., api_root=server.root_url)
+"""
+
+import email.parser
+import json
+import random
+import re
+import threading
+import time
+import urllib.request
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+from benchmarks.bench_lean_wire import apply_field_mask, parse_field_mask
+from sheet_calendar_sync.utils import get_range_start_row
+
+# 처리 결과: (HTTP 상태 코드, 응답 본문, 추가 응답 헤더)
+Response = Tuple[int, Optional[Dict], Dict[str, str]]
+
+DEFAULT_START_ROW = 5
+# 시트 메타데이터의 행 수에 더할 빈 행 수 (실제 시트도 데이터 아래에 빈 행이 있음)
+SPARE_ROWS = 1000
+MAX_LIST_RESULTS = 2500
+
+_SHEET = r"v4/spreadsheets/([^/]+)"
+_EVENTS = r"calendar/v3/calendars/([^/]+)/events"
+# (HTTP 메서드, 경로 패턴, API 메서드 이름, 처리 메서드 이름)
+ROUTES = [
+    ("GET", _SHEET + r"/values:batchGet", "sheets.values.batchGet", "_values_batchget"),
+    ("GET", _SHEET + r"/values/(.+)", "sheets.values.get", "_values_get"),
+    ("GET", _SHEET, "sheets.spreadsheets.get", "_spreadsheets_get"),
+    ("GET", _EVENTS, "calendar.events.list", "_events_list"),
+    ("POST", _EVENTS, "calendar.events.insert", "_events_insert"),
+    ("GET", _EVENTS + r"/([^/]+)", "calendar.events.get", "_events_get"),
+    ("PUT", _EVENTS + r"/([^/]+)", "calendar.events.update", "_events_update"),
+    ("PATCH", _EVENTS + r"/([^/]+)", "calendar.events.patch", "_events_patch"),
+    ("DELETE", _EVENTS + r"/([^/]+)", "calendar.events.delete", "_events_delete"),
+    ("POST", _EVENTS + r"/watch", "calendar.events.watch", "_events_watch"),
+    ("POST", r"drive/v3/files/([^/]+)/watch", "drive.files.watch", "_files_watch"),
+    ("POST", r"(calendar|drive)/v3/channels/stop", "channels.stop", "_channels_stop"),
+]
+# 캘린더 채널에 변경 알림을 보내는 API 메서드
+CALENDAR_MUTATIONS = {
+    "calendar.events.insert",
+    "calendar.events.update",
+    "calendar.events.patch",
+    "calendar.events.delete",
+}
+# 채널 만료 시간을 지정하지 않았을 때의 기본값 (초)
+DEFAULT_CHANNEL_TTL = {"calendar": 7 * 24 * 3600, "drive": 3600}
+
+
+class FakeGoogleState:
+    def __init__(
+        self,
+        sheets: Optional[Dict[str, Dict[str, List[List[str]]]]] = None,
+        calendars: Optional[Dict[str, List[Dict]]] = None,
+        start_row: int = DEFAULT_START_ROW,
+    ):
+        """가짜 서버가 보관하는 시트/캘린더 데이터를 초기화합니다.
+
+        Args:
+            sheets: 시트 ID -> 탭 이름 -> 행 목록 (첫 행이 start_row행)
+            calendars: 캘린더 ID -> events.list 응답 항목 형식의 이벤트 목록
+            start_row: 시트 데이터의 첫 행 번호
+        """
+        self.sheets = sheets or {}
+        self.start_row = start_row
+        self.events: Dict[str, Dict[str, Dict]] = {}
+        self.changed_at: Dict[str, Dict[str, int]] = {}
+        self.seq = 0
+        self._ordered: Dict[str, Optional[List[Dict]]] = {}
+        for calendar_id, events in (calendars or {}).items():
+            for event in events:
+                self.store(calendar_id, dict(event))
+
+    def calendar_events(self, calendar_id: str) -> Dict[str, Dict]:
+        return self.events.setdefault(calendar_id, {})
+
+    def active_events(self, calendar_id: str) -> List[Dict]:
+        """취소되지 않은 이벤트를 시작일 순으로 반환합니다 (변경 전까지 캐시)."""
+        ordered = self._ordered.get(calendar_id)
+        if ordered is None:
+            ordered = sorted(
+                (
+                    event
+                    for event in self.calendar_events(calendar_id).values()
+                    if event.get("status") != "cancelled"
+                ),
+                key=lambda event: (_event_date(event.get("start")), event["id"]),
+            )
+            self._ordered[calendar_id] = ordered
+        return ordered
+
+    def store(self, calendar_id: str, event: Dict) -> Dict:
+        """이벤트를 저장하고 변경 순번을 기록합니다."""
+        self.seq += 1
+        event.setdefault("status", "confirmed")
+        self.calendar_events(calendar_id)[event["id"]] = event
+        self.changed_at.setdefault(calendar_id, {})[event["id"]] = self.seq
+        self._ordered[calendar_id] = None
+        return event
+
+
+class FakeGoogleServer:
+    def __init__(
+        self,
+        state: FakeGoogleState,
+        latency: float = 0.0,
+        bandwidth: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 429,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """가짜 API 서버를 초기화합니다.
+
+        Args:
+            state: 서버가 보관할 시트/캘린더 데이터
+            latency: 요청마다 응답 전에 기다릴 시간 (초)
+            bandwidth: 요청 하나의 응답 전송 속도 (바이트/초, 0이면 제한 없음).
+                응답이 클수록 오래 걸리는 조회를 흉내 냄
+            error_rate: 오류를 돌려줄 요청 비율 (0~1, token 요청 제외)
+            error_status: 주입할 오류의 HTTP 상태 코드 (429, 403, 503 등)
+            seed: 오류 주입 난수 시드
+            host: 바인드할 주소
+            port: 바인드할 포트 (0이면 빈 포트 사용)
+        """
+        self.state = state
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.random = random.Random(seed)
+        self.channels: Dict[str, Dict] = {}
+        self.notifications: Counter = Counter()
+        self.calls: Counter = Counter()
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def root_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "FakeGoogleServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeGoogleServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def stats(self) -> Dict:
+        """HTTP 요청 수(token 발급 제외), API 메서드별 호출 수, 주고받은 바이트 수를
+        반환합니다."""
+        with self.lock:
+            calls = dict(self.calls)
+        http_requests = sum(
+            count
+            for name, count in calls.items()
+            if name.startswith("http:") and name != "http:token"
+        )
+        return {
+            "http_requests": http_requests,
+            "api_calls": {
+                name: count
+                for name, count in calls.items()
+                if not name.startswith("http:")
+            },
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+        }
+
+    def update_sheet(self, sheet_id: str, tab: str, rows: List[List[str]]) -> None:
+        """시트 탭의 행을 바꾸고 시트 파일을 구독 중인 채널에 변경 알림을 보냅니다."""
+        with self.lock:
+            self.state.sheets.setdefault(sheet_id, {})[tab] = rows
+            self._notify("drive", sheet_id)
+
+    def handle(
+        self, method: str, target: str, headers, body: bytes
+    ) -> Tuple[int, bytes, Dict[str, str]]:
+        """HTTP 요청 하나를 처리하고 (상태 코드, 응답 본문, 헤더)를 반환합니다."""
+        if self.latency:
+            time.sleep(self.latency)
+        path = urlsplit(target).path.lstrip("/")
+        if path.startswith("batch/"):
+            self._count("http:batch", len(body))
+            status, payload, extra = self._handle_batch(
+                headers.get("Content-Type", ""), body
+            )
+        else:
+            self._count("http:" + path.split("/", 1)[0], len(body))
+            status, payload, extra = self.dispatch(method, target, body)
+        if isinstance(payload, bytes):
+            content = payload
+        else:
+            content = json.dumps(payload).encode() if payload is not None else b""
+            extra = {"Content-Type": "application/json; charset=UTF-8", **extra}
+        with self.lock:
+            self.bytes_out += len(content)
+        if self.bandwidth:
+            time.sleep(len(content) / self.bandwidth)
+        return status, content, extra
+
+    def dispatch(self, method: str, target: str, body: bytes) -> Response:
+        """API 요청 하나를 처리합니다 (배치 안의 개별 요청 포함)."""
+        parts = urlsplit(target)
+        path = unquote(parts.path).lstrip("/")
+        query = parse_qs(parts.query)
+
+        if path == "token":
+            self._count("token")
+            return 200, {
+                "access_token": f"fake-{uuid.uuid4().hex}",
+                "expires_in": 3600,
+                "token_type": "Bearer",
+            }, {}
+
+        name, handler, args = self._route(method, path)
+        self._count(name)
+        if handler is None:
+            return _error(404, "notFound", f"{method} {path}")
+        try:
+            payload = json.loads(body) if body.strip() else None
+        except ValueError:
+            return _error(400, "parseError", "Parse Error")
+        with self.lock:
+            inject = self.error_rate and self.random.random() < self.error_rate
+        if inject:
+            return self._injected_error()
+
+        with self.lock:
+            status, result, extra = handler(*args, query, payload)
+            if status < 300 and name in CALENDAR_MUTATIONS:
+                self._notify("calendar", args[0])
+        fields = _first(query, "fields")
+        if fields and result is not None and status < 300:
+            result = apply_field_mask(result, parse_field_mask(fields))
+        return status, result, extra
+
+    def _route(self, method: str, path: str):
+        for route_method, pattern, name, handler_name in ROUTES:
+            match = re.fullmatch(pattern, path)
+            if match and route_method == method:
+                return name, getattr(self, handler_name), match.groups()
+        return f"unknown:{method} {path}", None, ()
+
+    # Sheets
+
+    def _spreadsheets_get(self, sheet_id: str, query, payload) -> Response:
+        sheets = [
+            {
+                "properties": {
+                    "title": tab,
+                    "gridProperties": {
+                        "rowCount": self.state.start_row - 1 + len(rows) + SPARE_ROWS,
+                        "columnCount": 26,
+                    },
+                }
+            }
+            for tab, rows in self.state.sheets.get(sheet_id, {}).items()
+        ]
+        return 200, {"spreadsheetId": sheet_id, "sheets": sheets}, {}
+
+    def _values_get(self, sheet_id: str, sheet_range: str, query, payload) -> Response:
+        return 200, self._value_range(sheet_id, sheet_range, query), {}
+
+    def _values_batchget(self, sheet_id: str, query, payload) -> Response:
+        value_ranges = [
+            self._value_range(sheet_id, sheet_range, query)
+            for sheet_range in query.get("ranges", [])
+        ]
+        return 200, {"spreadsheetId": sheet_id, "valueRanges": value_ranges}, {}
+
+    def _value_range(self, sheet_id: str, sheet_range: str, query) -> Dict:
+        tab, _, cells = sheet_range.rpartition("!")
+        rows = self.state.sheets.get(sheet_id, {}).get(tab.strip("'"), [])
+        start = max(get_range_start_row(cells) - self.state.start_row, 0)
+        end_match = re.search(r":[A-Za-z]*(\d+)$", cells)
+        end = int(end_match.group(1)) - self.state.start_row + 1 if end_match else None
+        values = rows[start:end]
+        while values and not values[-1]:
+            values = values[:-1]
+        value_range = {"range": sheet_range, "majorDimension": "ROWS"}
+        if values:
+            value_range["values"] = values
+        return value_range
+
+    # Calendar
+
+    def _events_list(self, calendar_id: str, query, payload) -> Response:
+        sync_token = _first(query, "syncToken")
+        max_results = min(int(_first(query, "maxResults") or 250), MAX_LIST_RESULTS)
+        offset = int(_first(query, "pageToken") or 0)
+
+        if sync_token:
+            if not sync_token.startswith("s") or not sync_token[1:].isdigit():
+                return _error(410, "fullSyncRequired", "Sync token is no longer valid")
+            since = int(sync_token[1:])
+            changed = self.state.changed_at.get(calendar_id, {})
+            events = self.state.calendar_events(calendar_id)
+            items = [
+                events[event_id]
+                for event_id, seq in sorted(changed.items(), key=lambda item: item[1])
+                if seq > since
+            ]
+        else:
+            items = self.state.active_events(calendar_id)
+            time_min = (_first(query, "timeMin") or "")[:10]
+            time_max = (_first(query, "timeMax") or "")[:10]
+            if time_min or time_max:
+                items = [
+                    event
+                    for event in items
+                    if (not time_min or _event_date(event.get("end")) >= time_min)
+                    and (not time_max or _event_date(event.get("start")) < time_max)
+                ]
+
+        page = items[offset : offset + max_results]
+        result: Dict = {"kind": "calendar#events", "items": page}
+        if offset + max_results < len(items):
+            result["nextPageToken"] = str(offset + max_results)
+        else:
+            result["nextSyncToken"] = f"s{self.state.seq}"
+        return 200, result, {}
+
+    def _events_get(self, calendar_id: str, event_id: str, query, payload) -> Response:
+        event = self.state.calendar_events(calendar_id).get(event_id)
+        if event is None:
+            return _error(404, "notFound", "Not Found")
+        return 200, event, {}
+
+    def _events_insert(self, calendar_id: str, query, payload) -> Response:
+        events = self.state.calendar_events(calendar_id)
+        event_id = (payload or {}).get("id") or uuid.uuid4().hex
+        if event_id in events:
+            return _error(409, "duplicate", "The requested identifier already exists.")
+        now = _now()
+        event = dict(payload or {}, id=event_id, created=now, updated=now)
+        return 200, self.state.store(calendar_id, event), {}
+
+    def _events_update(
+        self, calendar_id: str, event_id: str, query, payload
+    ) -> Response:
+        previous = self.state.calendar_events(calendar_id).get(event_id)
+        if previous is None or previous.get("status") == "cancelled":
+            return _error(404, "notFound", "Not Found")
+        event = dict(payload or {}, id=event_id, created=previous.get("created"))
+        event["updated"] = _now()
+        return 200, self.state.store(calendar_id, event), {}
+
+    def _events_patch(
+        self, calendar_id: str, event_id: str, query, payload
+    ) -> Response:
+        previous = self.state.calendar_events(calendar_id).get(event_id)
+        # 삭제된 이벤트는 status를 confirmed로 patch할 때만 되살아남
+        if previous is None or (
+            previous.get("status") == "cancelled"
+            and (payload or {}).get("status") != "confirmed"
+        ):
+            return _error(404, "notFound", "Not Found")
+        event = dict(previous)
+        for key, value in (payload or {}).items():
+            if isinstance(value, dict) and isinstance(event.get(key), dict):
+                value = {**event[key], **value}
+            event[key] = value
+        event["updated"] = _now()
+        return 200, self.state.store(calendar_id, event), {}
+
+    def _events_delete(
+        self, calendar_id: str, event_id: str, query, payload
+    ) -> Response:
+        previous = self.state.calendar_events(calendar_id).get(event_id)
+        if previous is None:
+            return _error(404, "notFound", "Not Found")
+        if previous.get("status") == "cancelled":
+            return _error(410, "deleted", "Resource has been deleted")
+        self.state.store(calendar_id, {"id": event_id, "status": "cancelled"})
+        return 204, None, {}
+
+    # Push notifications
+
+    def _events_watch(self, calendar_id: str, query, payload) -> Response:
+        return self._watch("calendar", calendar_id, payload)
+
+    def _files_watch(self, file_id: str, query, payload) -> Response:
+        return self._watch("drive", file_id, payload)
+
+    def _watch(self, api: str, resource: str, payload: Optional[Dict]) -> Response:
+        payload = payload or {}
+        if payload.get("type") != "web_hook" or not payload.get("address"):
+            return _error(400, "invalid", "type과 address가 필요합니다.")
+        ttl = (payload.get("params") or {}).get("ttl")
+        if payload.get("expiration"):
+            expiration = int(payload["expiration"])
+        else:
+            seconds = int(ttl) if ttl else DEFAULT_CHANNEL_TTL[api]
+            expiration = int((time.time() + seconds) * 1000)
+        channel = {
+            "kind": "api#channel",
+            "id": payload.get("id") or uuid.uuid4().hex,
+            "resourceId": f"{api}-{uuid.uuid4().hex[:12]}",
+            "resourceUri": f"{self.root_url}{api}/{resource}",
+            "token": payload.get("token"),
+            "expiration": str(expiration),
+        }
+        self.channels[channel["id"]] = dict(
+            channel, api=api, resource=resource, address=payload["address"], number=0
+        )
+        self._post(self.channels[channel["id"]], "sync")
+        return 200, channel, {}
+
+    def _channels_stop(self, api: str, query, payload) -> Response:
+        channel = self.channels.get((payload or {}).get("id"))
+        if channel is None or channel["resourceId"] != payload.get("resourceId"):
+            return _error(404, "notFound", "Channel not found")
+        del self.channels[channel["id"]]
+        return 204, None, {}
+
+    def _notify(self, api: str, resource: str) -> None:
+        """resource를 구독 중인 만료되지 않은 채널에 변경 알림을 보냅니다."""
+        now = time.time() * 1000
+        for channel in list(self.channels.values()):
+            if channel["api"] != api or channel["resource"] != resource:
+                continue
+            if int(channel["expiration"]) <= now:
+                del self.channels[channel["id"]]
+                continue
+            self._post(channel, "exists" if api == "calendar" else "update")
+
+    def _post(self, channel: Dict, resource_state: str) -> None:
+        """채널 주소로 알림을 POST합니다. 응답을 기다리지 않도록 별도 스레드에서
+        보냅니다."""
+        channel["number"] += 1
+        headers = {
+            "X-Goog-Channel-ID": channel["id"],
+            "X-Goog-Channel-Expiration": channel["expiration"],
+            "X-Goog-Message-Number": str(channel["number"]),
+            "X-Goog-Resource-ID": channel["resourceId"],
+            "X-Goog-Resource-State": resource_state,
+            "X-Goog-Resource-URI": channel["resourceUri"],
+        }
+        if channel.get("token"):
+            headers["X-Goog-Channel-Token"] = channel["token"]
+        self.notifications[resource_state] += 1
+        threading.Thread(
+            target=_deliver, args=(channel["address"], headers), daemon=True
+        ).start()
+
+    # Batch
+
+    def _handle_batch(
+        self, content_type: str, body: bytes
+    ) -> Tuple[int, bytes, Dict[str, str]]:
+        """multipart/mixed 배치 요청을 나누어 처리하고 multipart 응답을 만듭니다."""
+        message = email.parser.BytesParser().parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + body
+        )
+        boundary = f"batch_{uuid.uuid4().hex}"
+        chunks = []
+        for part in message.get_payload():
+            content_id = (part["Content-ID"] or "").strip("<>")
+            request_line, _, rest = part.get_payload().partition("\n")
+            method, target, _ = request_line.strip().split(" ", 2)
+            request_body = re.split(r"\r?\n\r?\n", rest, 1)
+            inner_body = request_body[1] if len(request_body) > 1 else ""
+            status, payload, _ = self.dispatch(method, target, inner_body.encode())
+            content = json.dumps(payload) if payload is not None else ""
+            chunks.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id}>\r\n\r\n"
+                f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                "Content-Type: application/json; charset=UTF-8\r\n"
+                f"Content-Length: {len(content.encode())}\r\n\r\n"
+                f"{content}\r\n"
+            )
+        chunks.append(f"--{boundary}--\r\n")
+        return (
+            200,
+            "".join(chunks).encode(),
+            {"Content-Type": f"multipart/mixed; boundary={boundary}"},
+        )
+
+    def _injected_error(self) -> Response:
+        if self.error_status in (403, 429):
+            return _error(self.error_status, "rateLimitExceeded", "Rate Limit Exceeded")
+        return _error(self.error_status, "backendError", "Backend Error")
+
+    def _count(self, name: str, request_bytes: int = 0) -> None:
+        with self.lock:
+            self.calls[name] += 1
+            self.bytes_in += request_bytes
+
+
+def _make_handler(server: FakeGoogleServer):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _handle(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+            status, content, headers = server.handle(
+                self.command, self.path, self.headers, body
+            )
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    return Handler
+
+
+def _deliver(address: str, headers: Dict[str, str]) -> None:
+    request = urllib.request.Request(address, data=b"", headers=headers, method="POST")
+    try:
+        urllib.request.urlopen(request, timeout=10).close()
+    except OSError:
+        # 구글처럼 전달에 실패한 알림은 버림
+        pass
+
+
+def _error(status: int, reason: str, message: str) -> Response:
+    return (
+        status,
+        {
+            "error": {
+                "code": status,
+                "message": message,
+                "errors": [{"reason": reason, "message": message}],
+            }
+        },
+        {},
+    )
+
+
+def _first(query: Dict[str, List[str]], name: str) -> Optional[str]:
+    values = query.get(name)
+    return values[0] if values else None
+
+
+def _event_date(event_time: Optional[Dict]) -> str:
+    event_time = event_time or {}
+    return (event_time.get("date") or event_time.get("dateTime") or "")[:10]
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
@@ -0,0 +1,122 @@
+"""벤치마크용 시트/캘린더 합성 데이터 생성기
+
+시트 E:M 열 구성과 같은 행과, 그중 일부가 이미 동기화된 캘린더 이벤트를 만듭니다.
+날짜는 main의 조회 기간(과거 25주 ~ 미래 52주) 안에 오도록 오늘 기준으로 만듭니다.
+
+    python -m benchmarks.synthetic_data 10000
+"""
+
+import random
+import sys
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, NamedTuple, Optional
+from sheet_calendar_sync.event_body import create_event_body
+from sheet_calendar_sync.sheet_manager import GoogleSheetManager
+
+SITES = ["레뷰", "강남맛집", "리뷰노트", "디너의여왕", "모두의블로그", "서울오빠", "티블"]
+REGIONS = ["서울", "경기", "인천", "부산", "대구", "광주", "대전"]
+PERIODS = [0, 6, 13, 29]
+
+
+class Dataset(NamedTuple):
+    """시트 행과 캘린더 이벤트 합성 데이터"""
+
+    rows: List[List[str]]
+    events: List[Dict]
+
+
+def generate_sheet_rows(
+    size: int, seed: int = 0, today: Optional[date] = None
+) -> List[List[str]]:
+    """시트 E:M 열 구성의 행을 size개 만듭니다.
+
+    Args:
+        size: 행 수
+        seed: 난수 시드
+        today: 기준 날짜 (기본값: 오늘)
+
+    Returns:
+        [사이트, 구분, 지역, 체험 업체명, 기간, 방문일, 제공내역, 추가결재, 비고] 행 목록
+    """
+    rng = random.Random(seed)
+    today = today or date.today()
+    rows = []
+    for i in range(size):
+        end = today + timedelta(days=rng.randrange(-20 * 7, 30 * 7))
+        start = end - timedelta(days=rng.choice(PERIODS))
+        rows.append(
+            [
+                rng.choice(SITES),
+                rng.choice(["방문형", "배송형"]),
+                rng.choice(REGIONS),
+                f"체험업체 {i}",
+                f"{start:%Y.%m.%d} ~ {end:%Y.%m.%d}",
+                "",
+                f"{rng.randrange(1, 20) * 10000}원",
+                "",
+                rng.choice(["없음", "주차 가능", "2인 기준", "사진 10장 이상"]),
+            ]
+        )
+    return rows
+
+
+def generate_calendar_events(
+    rows: List[List[str]],
+    synced: float = 0.9,
+    changed: float = 0.05,
+    orphans: float = 0.02,
+    seed: int = 0,
+) -> List[Dict]:
+    """시트 행 중 일부가 이미 등록된 캘린더 이벤트를 만듭니다.
+
+    Args:
+        rows: generate_sheet_rows로 만든 시트 행
+        synced: 캘린더에 이미 등록된 행 비율
+        changed: 등록된 행 중 시트 내용이 바뀌어 수정이 필요한 비율
+        orphans: 시트에 없는 이벤트 수 (행 수 대비 비율)
+        seed: 난수 시드
+
+    Returns:
+        events.list 응답 항목 형식의 이벤트 목록
+    """
+    rng = random.Random(seed)
+    created = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    events = []
+
+    def add_event(row: List[str]) -> None:
+        body = create_event_body(GoogleSheetManager.transform_sheet_row(row))
+        timestamp = (created + timedelta(seconds=len(events))).isoformat()
+        events.append(
+            dict(
+                body,
+                id=f"evt{len(events):08d}",
+                status="confirmed",
+                created=timestamp,
+                updated=timestamp,
+            )
+        )
+
+    for row in rows:
+        if rng.random() >= synced:
+            continue
+        if rng.random() < changed:
+            row = row[:8] + ["이전 비고"]
+        add_event(row)
+    for i in range(int(len(rows) * orphans)):
+        row = list(rng.choice(rows))
+        row[3] = f"삭제된 업체 {i}"
+        add_event(row)
+    return events
+
+
+def generate_dataset(size: int, seed: int = 0) -> Dataset:
+    """size개 시트 행과 그에 맞는 캘린더 이벤트를 만듭니다."""
+    rows = generate_sheet_rows(size, seed)
+    return Dataset(rows, generate_calendar_events(rows, seed=seed))
+
+
+if __name__ == "__main__":
+    dataset = generate_dataset(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000)
+    print(f"rows: {len(dataset.rows)}, events: {len(dataset.events)}")
+    print(dataset.rows[0])
+    print(dataset.events[0])
@@ -0,0 +1 @@
+"""구글 시트의 체험단 일정을 구글 캘린더와 동기화합니다."""
@@ -0,0 +1,147 @@
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from googleapiclient.errors import BatchError, HttpError
+from googleapiclient.http import HttpRequest
+from sheet_calendar_sync.quota_governor import QuotaGovernor
+
+# 구글 API 배치 요청 한 번에 담을 수 있는 최대 요청 수
+MAX_BATCH_SIZE = 50
+
+
+class MutationResult(NamedTuple):
+    """배치로 실행된 개별 요청의 결과"""
+
+    key: str
+    response: Optional[Dict]
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BatchExecutor:
+    def __init__(
+        self,
+        service,
+        batch_size: int = MAX_BATCH_SIZE,
+        http: Any = None,
+        governor: Optional[QuotaGovernor] = None,
+        api: str = "calendar",
+    ):
+        """배치 실행기를 초기화합니다.
+
+        Args:
+            service: 구글 API 서비스 인스턴스
+            batch_size: 배치 한 번에 담을 요청 수 (최대 50)
+            http: 배치 전송에 사용할 http 객체 (선택 사항, 오프라인 테스트용
+                HttpMockSequence 등). 지정하지 않으면 요청의 http 객체를 사용
+            governor: 요청 속도 조절/재시도에 사용할 할당량 관리자 (선택 사항)
+            api: 할당량 관리자에 기록할 API 이름
+        """
+        if not 0 < batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size는 1~{MAX_BATCH_SIZE} 사이여야 합니다.")
+        self.service = service
+        self.batch_size = batch_size
+        self.http = http
+        self.governor = governor
+        self.api = api
+
+    def execute(self, requests: List[Tuple[str, HttpRequest]]) -> List[MutationResult]:
+        """요청 목록을 batch_size 단위로 묶어 실행합니다.
+
+        한 요청이 실패해도 같은 배치의 다른 요청에는 영향을 주지 않습니다.
+        할당량 관리자가 있으면 배치 전송 전에 요청 수만큼 속도 제한을 적용하고,
+        할당량 초과나 일시적 오류로 실패한 요청만 모아 백오프 후 다시 보냅니다.
+
+        Args:
+            requests: (식별용 key, HttpRequest) 목록
+
+        Returns:
+            입력 순서와 같은 순서의 요청별 결과 목록
+        """
+        results: List[Optional[MutationResult]] = [None] * len(requests)
+        pending = list(range(len(requests)))
+        attempt = 0
+
+        while pending:
+            for start in range(0, len(pending), self.batch_size):
+                self._execute_batch(
+                    requests, pending[start : start + self.batch_size], results
+                )
+            if self.governor is None:
+                break
+
+            retry = [
+                index
+                for index in pending
+                if not results[index].ok
+                and self.governor.is_retryable(results[index].error)
+            ]
+            if attempt >= self.governor.max_retries:
+                retry = []
+            retry_set = set(retry)
+            for index in pending:
+                if results[index].ok:
+                    self.governor.record_success(self.api)
+                elif index not in retry_set:
+                    self.governor.record_failure(self.api)
+            if not retry:
+                break
+
+            errors = [results[index].error for index in retry]
+            self.governor.record_retries(self.api, errors)
+            self.governor.sleep(self.governor.retry_delay(attempt, errors[0]))
+            pending = retry
+            attempt += 1
+
+        return results  # type: ignore[return-value]
+
+    def _execute_batch(
+        self,
+        requests: List[Tuple[str, HttpRequest]],
+        indices: List[int],
+        results: List[Optional[MutationResult]],
+    ) -> None:
+        """indices에 해당하는 요청을 배치 하나로 보내고 결과를 results에 기록합니다.
+        응답에 결과가 없는 요청은 실패로 기록해 결과가 항상 요청과 1:1이 되게
+        합니다 (호출하는 쪽은 결과를 작업 목록과 순서대로 짝지음)."""
+        if self.governor is not None:
+            self.governor.acquire(self.api, len(indices))
+
+        batch = self.service.new_batch_http_request(
+            callback=self._make_callback(requests, results)
+        )
+        for index in indices:
+            # 재시도할 때 이전 결과가 남아 있지 않도록 비움
+            results[index] = None
+            batch.add(requests[index][1], request_id=str(index))
+
+        try:
+            batch.execute(http=self.http)
+        except (BatchError, HttpError, KeyError) as error:
+            # 배치 요청 자체가 실패했거나 응답에 빠진 요청이 있어 콜백이 하나도
+            # 실행되지 않은 경우(KeyError) 이번 배치의 항목 모두 실패 처리
+            if isinstance(error, KeyError):
+                error = BatchError(f"배치 응답에 요청 {error}의 결과가 없습니다.")
+            for index in indices:
+                results[index] = MutationResult(requests[index][0], None, error)
+            return
+
+        for index in indices:
+            if results[index] is None:
+                results[index] = MutationResult(
+                    requests[index][0],
+                    None,
+                    RuntimeError("배치 응답에 이 요청의 결과가 없습니다."),
+                )
+
+    @staticmethod
+    def _make_callback(
+        requests: List[Tuple[str, HttpRequest]],
+        results: List[Optional[MutationResult]],
+    ) -> Callable:
+        def callback(request_id: str, response: Optional[Dict], exception) -> None:
+            index = int(request_id)
+            results[index] = MutationResult(requests[index][0], response, exception)
+
+        return callback
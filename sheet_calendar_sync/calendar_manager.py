@@ -0,0 +1,726 @@
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+from rich import print
+from datetime import datetime, timedelta, timezone
+from itertools import chain, islice
+from typing import Any, Union, Dict, Iterable, Iterator, List, Optional, Tuple
+from google.oauth2 import service_account
+from googleapiclient.errors import HttpError
+from googleapiclient.discovery import build
+from sheet_calendar_sync.service import GoogleService
+from sheet_calendar_sync.batch_executor import (
+    MAX_BATCH_SIZE,
+    BatchExecutor,
+    MutationResult,
+)
+from sheet_calendar_sync.concurrent_executor import ConcurrentExecutor
+from sheet_calendar_sync.reconciler import INSERT, UPDATE, DELETE, SyncPlan
+from sheet_calendar_sync.event_body import create_event_bodies, create_event_body
+from sheet_calendar_sync.calendar_mirror import CalendarMirror
+from sheet_calendar_sync.deduper import DedupePlan, Deduper
+from sheet_calendar_sync.records import CalendarEvent
+from sheet_calendar_sync.sync_journal import DONE, FAILED, SyncJournal, make_event_id
+
+# lean 모드에서 events.list에 요청하는 필드 (transform_calendar_data, 캘린더 사본,
+# 중복 제거에서 사용하는 필드만 포함)
+LEAN_EVENT_FIELDS = (
+    "id,status,summary,description,start,end,created,"
+    "recurringEventId,extendedProperties"
+)
+LEAN_LIST_FIELDS = f"nextPageToken,nextSyncToken,items({LEAN_EVENT_FIELDS})"
+LIST_PAGE_SIZE = 250
+# 나눠 조회할 때의 페이지 크기 (API 최대값). 이벤트는 끝 시각이 조회 시작 시각
+# 이후이면 모두 포함되므로 조각을 잘게 나눌수록 여러 날에 걸친 이벤트를 중복해서
+# 받게 됨. 한 달 조각이 대부분 한 페이지에 들어가도록 크게 잡음
+SHARD_PAGE_SIZE = 2500
+# 조각 목록이 한 페이지를 넘으면 남은 기간을 최대 MAX_SHARD_SPLIT개로 나누되,
+# 남은 기간이 MIN_SHARD_SPAN보다 짧으면 나누지 않고 다음 페이지를 이어서 조회
+MIN_SHARD_SPAN = timedelta(days=2)
+MAX_SHARD_SPLIT = 8
+# 캘린더 이벤트를 이 수만큼씩 모아 날짜 열을 한 번에 변환 (events.list 최대 페이지)
+TRANSFORM_BATCH_SIZE = 2500
+
+
+class GoogleCalendarManager:
+    def __init__(
+        self,
+        google_service: GoogleService,
+        calendar_id: str,
+        http: Any = None,
+        lean: bool = True,
+        concurrency: int = 0,
+        list_concurrency: int = 0,
+    ):
+        """구글 캘린더 관리자를 초기화합니다.
+
+        Args:
+            google_service: 구글 서비스 인스턴스
+            calendar_id: 구글 캘린더 ID
+            http: 인증 대신 사용할 http 객체 (선택 사항, 오프라인 테스트용)
+            lean: True이면 events.list에 fields 마스크를 지정해 필요한 필드만 받음
+            concurrency: 1 이상이면 이벤트 추가/수정/삭제 배치를 이 수만큼의
+                스레드에서 동시에 실행 (0이면 배치를 순서대로 실행). http를
+                지정하면 http 객체를 스레드 간에 나눠 쓸 수 없으므로 순서대로 실행
+            list_concurrency: 1 이상이면 이벤트 목록 조회 기간을 월 단위로 나눠
+                이 수만큼의 스레드에서 동시에 조회 (0이면 페이지를 순서대로 조회)
+        """
+        self.SCOPE = ["https://www.googleapis.com/auth/calendar"]
+        self.API_SERVICE_NAME = "calendar"
+        self.API_VERSION = "v3"
+        self.calendar_id = calendar_id
+        self.list_fields = LEAN_LIST_FIELDS if lean else None
+        self.list_concurrency = list_concurrency
+        self.governor = google_service.governor
+        self.service = google_service.create_service(
+            self.API_SERVICE_NAME, self.API_VERSION, self.SCOPE, http=http
+        )
+        if concurrency > 0 and http is None:
+            self.executor = ConcurrentExecutor(
+                self.service,
+                google_service.create_authorized_http,
+                concurrency,
+                batch_size=MAX_BATCH_SIZE,
+                governor=self.governor,
+                api=self.API_SERVICE_NAME,
+            )
+        else:
+            self.executor = BatchExecutor(
+                self.service, governor=self.governor, api=self.API_SERVICE_NAME
+            )
+
+    def get_calendar_data(self, min_week: int) -> List[Dict]:
+        """캘린더에서 이벤트를 가져옵니다.
+
+        Args:
+            min_week: 현재 시점에서 과거로 몇 주 전까지의 데이터를 가져올지 지정
+
+        Returns:
+            캘린더에서 가져온 이벤트 목록
+        """
+        return [item for page in self.iter_calendar_data(min_week) for item in page]
+
+    def iter_calendar_data(self, min_week: int) -> Iterator[List[Dict]]:
+        """캘린더 이벤트를 페이지 단위로 가져옵니다. 다음 페이지는 이전 페이지를
+        모두 처리한 뒤에 요청하므로 전체 목록을 한 번에 메모리에 두지 않습니다.
+        list_concurrency가 있으면 iter_calendar_data_sharded를 사용합니다.
+
+        Args:
+            min_week: 현재 시점에서 과거로 몇 주 전까지의 데이터를 가져올지 지정
+
+        Yields:
+            페이지별 단발성 이벤트 목록
+        """
+        time_min, time_max = self._list_window(min_week)
+        if self.list_concurrency > 0:
+            yield from self.iter_calendar_data_sharded(
+                time_min, time_max, self.list_concurrency
+            )
+            return
+
+        page_token = None
+
+        while True:
+            events_result = self._list_page(
+                time_min, time_max, page_token, LIST_PAGE_SIZE
+            )
+
+            items = events_result.get("items", [])
+            # 반복 일정(recurringEventId가 있는 항목)을 제외한 단발성 이벤트만 필터링
+            yield [item for item in items if "recurringEventId" not in item]
+            page_token = events_result.get("nextPageToken")
+
+            if not page_token:
+                break
+
+    def iter_calendar_data_sharded(
+        self, time_min: datetime, time_max: datetime, max_workers: int
+    ) -> Iterator[List[Dict]]:
+        """조회 기간을 월 단위 조각으로 나눠 동시에 조회하고 시작 시각 순서대로
+        합쳐 반환합니다.
+
+        조각의 결과가 한 페이지를 넘으면 받은 페이지 이후의 남은 기간을 다시 둘로
+        나눠 동시에 조회하므로, 전체 조회 시간은 모든 페이지 요청 시간의 합이 아니라
+        가장 오래 걸리는 조각의 시간에 가깝습니다. 여러 조각에 걸친 이벤트는
+        처음 나온 한 번만 반환합니다.
+
+        Args:
+            time_min: 조회 시작 시각 (timezone 포함)
+            time_max: 조회 끝 시각 (timezone 포함)
+            max_workers: 동시에 조회할 조각 수
+
+        Yields:
+            조각(페이지)별 단발성 이벤트 목록. 앞 조각을 모두 받은 뒤에 반환하므로
+            순서는 순차 조회와 같습니다.
+        """
+        pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="list")
+
+        def submit(start: datetime, end: datetime, page_token: Optional[str] = None):
+            shard = _Shard(start, end, page_token)
+            shard.future = pool.submit(fetch, shard)
+            return shard
+
+        def fetch(shard: "_Shard") -> List[Dict]:
+            events_result = self._list_page(
+                shard.start, shard.end, shard.page_token, SHARD_PAGE_SIZE
+            )
+            items = events_result.get("items", [])
+            page_token = events_result.get("nextPageToken")
+            if page_token:
+                # 결과를 기다리는 쪽이 하위 조각을 바로 찾을 수 있도록 반환 전에 등록
+                shard.children = [
+                    submit(*child)
+                    for child in _split_shard(shard, items, page_token)
+                ]
+            return items
+
+        seen = set()
+        try:
+            # 앞 조각부터 요청하고 스택에는 뒤집어 넣어 앞 조각부터 꺼냄
+            slices = _month_slices(time_min, time_max)
+            stack = [submit(start, end) for start, end in slices][::-1]
+            while stack:
+                shard = stack.pop()
+                items = shard.future.result()
+                stack.extend(reversed(shard.children))
+                page = []
+                for item in items:
+                    if item["id"] in seen or "recurringEventId" in item:
+                        continue
+                    seen.add(item["id"])
+                    page.append(item)
+                yield page
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _list_window(self, min_week: int) -> Tuple[datetime, datetime]:
+        """조회 기간 (과거 min_week주 ~ 미래 52주)"""
+        now = datetime.now()
+        return (
+            (now - timedelta(weeks=min_week)).replace(tzinfo=timezone.utc),
+            (now + timedelta(weeks=52)).replace(tzinfo=timezone.utc),
+        )
+
+    def _list_page(
+        self,
+        time_min: datetime,
+        time_max: datetime,
+        page_token: Optional[str],
+        page_size: int,
+    ) -> Dict:
+        """기간 안의 이벤트 목록 한 페이지를 시작 시각 순서로 조회합니다."""
+        request = self.service.events().list(
+            calendarId=self.calendar_id,
+            timeMin=_rfc3339(time_min),
+            timeMax=_rfc3339(time_max),
+            timeZone="Asia/Seoul",
+            maxResults=page_size,
+            singleEvents=True,
+            orderBy="startTime",
+            pageToken=page_token,
+            fields=self.list_fields,
+        )
+        return self.governor.execute(request, self.API_SERVICE_NAME)
+
+    def get_calendar_data_incremental(
+        self, mirror: CalendarMirror, min_week: int
+    ) -> List[Dict]:
+        """sync token으로 변경분만 받아 로컬 사본을 갱신한 뒤 이벤트를 반환합니다.
+
+        저장된 sync token이 없으면 전체 목록을 한 번 받아 사본을 만들고, 이후
+        실행에서는 변경/취소된 이벤트만 받습니다. sync token이 만료되어 410 Gone이
+        반환되면 사본을 비우고 전체 동기화를 다시 수행합니다.
+
+        Args:
+            mirror: 캘린더 로컬 사본
+            min_week: 현재 시점에서 과거로 몇 주 전까지의 데이터를 가져올지 지정
+
+        Returns:
+            get_calendar_data와 같은 기간의 단발성 이벤트 목록
+        """
+        try:
+            next_sync_token = self._sync_mirror(mirror, mirror.get_sync_token())
+        except HttpError as error:
+            if getattr(error, "resp", None) is None or error.resp.status != 410:
+                raise
+            print("sync token이 만료되어 전체 동기화를 다시 수행합니다.")
+            mirror.reset()
+            next_sync_token = self._sync_mirror(mirror, None)
+        mirror.set_sync_token(next_sync_token)
+        return mirror.get_single_events(min_week)
+
+    def _sync_mirror(
+        self, mirror: CalendarMirror, sync_token: Optional[str]
+    ) -> Optional[str]:
+        """events.list를 페이지 단위로 호출해 사본에 반영하고 nextSyncToken을
+        반환합니다. syncToken과 함께 쓸 수 없는 timeMin/timeMax/orderBy는 전체
+        동기화에서도 사용하지 않습니다."""
+        page_token = None
+        while True:
+            request = self.service.events().list(
+                calendarId=self.calendar_id,
+                timeZone="Asia/Seoul",
+                maxResults=250,
+                singleEvents=True,
+                pageToken=page_token,
+                fields=self.list_fields,
+                syncToken=sync_token,
+            )
+            events_result = self.governor.execute(request, self.API_SERVICE_NAME)
+            mirror.apply_events(events_result.get("items", []))
+            page_token = events_result.get("nextPageToken")
+
+            if not page_token:
+                return events_result.get("nextSyncToken")
+
+    def watch_events(
+        self, channel_id: str, address: str, token: str, ttl: int
+    ) -> Dict:
+        """캘린더 이벤트가 바뀌면 address로 푸시 알림을 보내는 채널을 만듭니다.
+
+        Args:
+            channel_id: 새 채널 ID (UUID 등 고유한 값)
+            address: 알림을 받을 HTTPS 주소
+            token: 알림마다 X-Goog-Channel-Token 헤더로 돌려받을 값
+            ttl: 채널 유지 시간 (초)
+
+        Returns:
+            id, resourceId, expiration(밀리초 문자열)을 담은 채널 정보
+        """
+        request = self.service.events().watch(
+            calendarId=self.calendar_id,
+            body={
+                "id": channel_id,
+                "type": "web_hook",
+                "address": address,
+                "token": token,
+                "params": {"ttl": str(ttl)},
+            },
+        )
+        return self.governor.execute(request, self.API_SERVICE_NAME)
+
+    def stop_channel(self, channel_id: str, resource_id: str) -> None:
+        """푸시 알림 채널을 닫습니다."""
+        request = self.service.channels().stop(
+            body={"id": channel_id, "resourceId": resource_id}
+        )
+        self.governor.execute(request, self.API_SERVICE_NAME)
+
+    @staticmethod
+    def transform_calendar_data(
+        calendar_events: Iterable[Dict],
+    ) -> List[CalendarEvent]:
+        """Transform calendar events into structured format."""
+        return list(GoogleCalendarManager.iter_transform_calendar_data(calendar_events))
+
+    @staticmethod
+    def iter_transform_calendar_data(
+        calendar_events: Iterable[Dict],
+    ) -> Iterator[CalendarEvent]:
+        """캘린더 이벤트를 비교용 레코드로 변환합니다. 들어오는 이벤트를
+        TRANSFORM_BATCH_SIZE개씩 모아 변환하므로 원본 목록을 모두 보관하지 않아도
+        됩니다."""
+        events = (item for item in calendar_events if "end" in item)
+        while True:
+            batch = list(islice(events, TRANSFORM_BATCH_SIZE))
+            if not batch:
+                return
+            yield from CalendarEvent.from_events(batch)
+
+    def update_event_description(
+        self, existing_events: List, existing_event_id: List, sheet_data: List[Dict]
+    ) -> List[MutationResult]:
+        """기존 캘린더 이벤트의 설명을 업데이트합니다.
+
+        Args:
+            existing_events: 기존 이벤트 목록
+            existing_event_id: 기존 이벤트 ID 목록
+            sheet_data: 시트에서 가져온 최신 데이터
+
+        Returns:
+            이벤트별 업데이트 결과 목록
+        """
+        sheet_index = self._index_by_summary(sheet_data)
+        matches = [
+            (event, sheet_item)
+            for event in zip(existing_events, existing_event_id)
+            for sheet_item in sheet_index.get(event[0], [])
+        ]
+        bodies = create_event_bodies([sheet_item for _, sheet_item in matches])
+        requests = []
+        for (event, _), request_body in zip(matches, bodies):
+            request = self.service.events().update(
+                calendarId=self.calendar_id,
+                eventId=event[1],
+                body=request_body,
+            )
+            requests.append((str(event), request))
+
+        results = self.executor.execute(requests)
+        for result in results:
+            if result.ok:
+                print(f"이벤트 {result.key}의 description이 업데이트되었습니다.")
+            else:
+                print(f"An error occurred: {result.error}")
+        return results
+
+    def insert_events(
+        self, new_events: List, sheet_data: List[Dict]
+    ) -> List[MutationResult]:
+        """새로운 이벤트를 캘린더에 추가합니다.
+
+        Args:
+            new_events: 추가할 새로운 이벤트 목록
+            sheet_data: 시트에서 가져온 이벤트 데이터
+
+        Returns:
+            이벤트별 생성 결과 목록
+        """
+        sheet_index = self._index_by_summary(sheet_data)
+        matches = [
+            (event, sheet_item)
+            for event in new_events
+            for sheet_item in sheet_index.get(event, [])
+        ]
+        bodies = create_event_bodies([sheet_item for _, sheet_item in matches])
+        requests = []
+        for (event, _), request_body in zip(matches, bodies):
+            request = self.service.events().insert(
+                calendarId=self.calendar_id, body=request_body
+            )
+            requests.append((event, request))
+
+        results = self.executor.execute(requests)
+        for result in results:
+            if result.ok:
+                print(f"이벤트 <{result.key}>이(가) 생성되었습니다.")
+            else:
+                print(f"An error occurred: {result.error}")
+        return results
+
+    def plan_duplicate_removal(
+        self, min_week: int, mirror: Optional[CalendarMirror] = None
+    ) -> DedupePlan:
+        """중복 이벤트 제거 계획을 만듭니다 (실제로 삭제하지 않음).
+
+        Args:
+            min_week: 현재 시점에서 과거로 몇 주 전까지의 데이터를 검사할지 지정
+            mirror: 캘린더 로컬 사본 (선택 사항, 지정하면 변경분만 받아 사본에서 검사)
+
+        Returns:
+            summary, 시작일, description이 같은 이벤트 중 가장 먼저 만들어진 것만
+            남기는 중복 제거 계획
+        """
+        if mirror is not None:
+            events = self.get_calendar_data_incremental(mirror, min_week)
+        else:
+            events = chain.from_iterable(self.iter_calendar_data(min_week))
+        return Deduper.build_plan(events)
+
+    def remove_duplicate_events(
+        self,
+        min_week: int,
+        mirror: Optional[CalendarMirror] = None,
+        dry_run: bool = False,
+        journal: Optional[SyncJournal] = None,
+    ) -> List[MutationResult]:
+        """중복된 캘린더 이벤트를 제거합니다.
+
+        Args:
+            min_week: 현재 시점에서 과거로 몇 주 전까지의 데이터를 검사할지 지정
+            mirror: 캘린더 로컬 사본 (선택 사항)
+            dry_run: True이면 계획만 출력하고 삭제하지 않음
+            journal: 작업 기록 (선택 사항)
+
+        Returns:
+            이벤트별 삭제 결과 목록 (dry_run이면 빈 목록)
+        """
+        plan = self.plan_duplicate_removal(min_week, mirror)
+        print(plan.describe())
+        if dry_run:
+            return []
+
+        operations = [
+            self._operation(DELETE, event["id"], event.get("summary"), None)
+            for event in plan.deletes
+        ]
+        if journal is not None:
+            journal.record_planned(operations)
+        return self.execute_operations(operations, journal)
+
+    def apply_plan(
+        self,
+        plan: SyncPlan,
+        update: bool = True,
+        delete: bool = False,
+        journal: Optional[SyncJournal] = None,
+    ) -> List[MutationResult]:
+        """동기화 계획을 배치 요청으로 캘린더에 반영합니다.
+
+        Args:
+            plan: Reconciler.build_plan으로 만든 동기화 계획
+            update: 수정 항목 반영 여부
+            delete: 삭제 항목 반영 여부 (시트에 없는 캘린더 이벤트 삭제)
+            journal: 작업 기록 (선택 사항, 지정하면 보내기 전/후 상태를 기록)
+
+        Returns:
+            항목별 실행 결과 목록
+        """
+        operations = self.plan_operations(plan, update, delete)
+        if journal is not None:
+            journal.record_planned(operations)
+        return self.execute_operations(operations, journal)
+
+    def resume_journal(self, journal: SyncJournal) -> List[MutationResult]:
+        """이전 실행에서 끝나지 않은 작업만 이어서 실행합니다.
+
+        Args:
+            journal: 작업 기록
+
+        Returns:
+            작업별 실행 결과 목록
+        """
+        operations = journal.pending(self.calendar_id)
+        if operations:
+            print(f"이전 실행에서 끝나지 않은 작업 {len(operations)}건을 이어서 실행합니다.")
+        return self.execute_operations(operations, journal)
+
+    def plan_operations(
+        self, plan: SyncPlan, update: bool = True, delete: bool = False
+    ) -> List[Dict]:
+        """동기화 계획을 작업 기록에 남길 수 있는 작업 목록으로 변환합니다.
+
+        추가 작업에는 캘린더와 매칭 키로 만든 고정 이벤트 ID를 지정하므로 같은
+        작업을 다시 보내도 이벤트가 중복 생성되지 않습니다. 같은 ID의 이벤트가
+        삭제된 상태로 남아 있으면 실행할 때 되살립니다.
+
+        Args:
+            plan: 동기화 계획
+            update: 수정 항목 포함 여부
+            delete: 삭제 항목 포함 여부
+
+        Returns:
+            op_id, action, calendar_id, event_id, summary, body를 담은 작업 목록
+        """
+        operations = []
+        for item in plan.inserts:
+            body = dict(item.body or self._create_event_body(item.sheet_item))
+            body["id"] = make_event_id(self.calendar_id, item.key)
+            operations.append(
+                self._operation(INSERT, body["id"], body.get("summary"), body)
+            )
+        if update:
+            # 내용 해시가 달라진 이벤트만 변경된 필드로 patch
+            for item in plan.updates:
+                event_id = item.calendar_item.get("event_id")
+                summary = item.sheet_item.get("summary")
+                operations.append(
+                    self._operation(UPDATE, event_id, summary, item.body)
+                )
+        if delete:
+            for item in plan.deletes:
+                event_id = item.calendar_item.get("event_id")
+                summary = item.calendar_item.get("summary")
+                operations.append(self._operation(DELETE, event_id, summary, None))
+        return operations
+
+    def execute_operations(
+        self, operations: List[Dict], journal: Optional[SyncJournal] = None
+    ) -> List[MutationResult]:
+        """작업 목록을 실행하고 결과를 작업 기록에 남깁니다.
+
+        Args:
+            operations: plan_operations로 만든 작업 목록
+            journal: 작업 기록 (선택 사항)
+
+        Returns:
+            작업별 실행 결과 목록
+        """
+        requests = [
+            (operation["op_id"], self._build_request(operation))
+            for operation in operations
+        ]
+        results = [
+            self._resolve_replay(operation, result)
+            for operation, result in zip(operations, self.executor.execute(requests))
+        ]
+
+        for operation, result in zip(operations, results):
+            if result.ok:
+                print(f"이벤트 <{operation['summary']}>이(가) 반영되었습니다.")
+            else:
+                print(f"An error occurred: {result.error}")
+        if journal is not None:
+            journal.record_results(
+                (result.key, DONE if result.ok else FAILED, str(result.error or ""))
+                for result in results
+            )
+        return results
+
+    def _operation(
+        self, action: str, event_id: str, summary: Optional[str], body: Optional[Dict]
+    ) -> Dict:
+        return {
+            "op_id": f"{action}:{event_id}",
+            "action": action,
+            "calendar_id": self.calendar_id,
+            "event_id": event_id,
+            "summary": summary,
+            "body": body,
+        }
+
+    def _build_request(self, operation: Dict):
+        events = self.service.events()
+        action = operation["action"]
+        if action == INSERT:
+            return events.insert(calendarId=self.calendar_id, body=operation["body"])
+        if action == UPDATE:
+            return events.patch(
+                calendarId=self.calendar_id,
+                eventId=operation["event_id"],
+                body=operation["body"],
+            )
+        return events.delete(calendarId=self.calendar_id, eventId=operation["event_id"])
+
+    def _resolve_replay(
+        self, operation: Dict, result: MutationResult
+    ) -> MutationResult:
+        """재실행으로 이미 반영된 작업(추가 409, 삭제 404/410)은 성공으로 처리합니다.
+
+        캘린더는 삭제한 이벤트의 ID를 cancelled 상태로 남겨 두므로, 추가가 409로
+        실패하면 이벤트를 조회해 삭제된 이벤트는 계획한 본문으로 되살립니다.
+        """
+        if result.ok or not isinstance(result.error, HttpError):
+            return result
+        # resp가 없는 오류(BatchError 등)는 재실행 여부를 알 수 없으므로 실패로 둠
+        resp = getattr(result.error, "resp", None)
+        if resp is None:
+            return result
+        status = resp.status
+        if operation["action"] == INSERT and status == 409:
+            return self._restore_event(operation, result)
+        if operation["action"] == DELETE and status in (404, 410):
+            return MutationResult(result.key, None, None)
+        return result
+
+    def _restore_event(
+        self, operation: Dict, result: MutationResult
+    ) -> MutationResult:
+        """고정 ID로 추가하려던 이벤트가 이미 있을 때 살아 있으면 재실행으로 보고,
+        삭제(cancelled)된 상태이면 confirmed로 patch해 되살립니다."""
+        events = self.service.events()
+        try:
+            event = self.governor.execute(
+                events.get(calendarId=self.calendar_id, eventId=operation["event_id"]),
+                self.API_SERVICE_NAME,
+            )
+            if event.get("status") != "cancelled":
+                return MutationResult(result.key, None, None)
+            body = dict(operation["body"], status="confirmed")
+            body.pop("id", None)
+            restored = self.governor.execute(
+                events.patch(
+                    calendarId=self.calendar_id,
+                    eventId=operation["event_id"],
+                    body=body,
+                ),
+                self.API_SERVICE_NAME,
+            )
+        except HttpError as e:
+            return MutationResult(result.key, None, e)
+        return MutationResult(result.key, restored, None)
+
+    @staticmethod
+    def _index_by_summary(sheet_data: List[Dict]) -> Dict[str, List[Dict]]:
+        """시트 데이터를 summary 기준으로 묶어 조회용 인덱스를 만듭니다."""
+        sheet_index: Dict[str, List[Dict]] = {}
+        for sheet_item in sheet_data:
+            sheet_index.setdefault(sheet_item.get("summary"), []).append(sheet_item)
+        return sheet_index
+
+    @staticmethod
+    def _create_event_body(event_data: Dict[str, str]) -> Dict:
+        """Create event body for calendar API requests."""
+        return create_event_body(event_data)
+
+
+class _Shard:
+    """동시 조회할 기간 조각. children은 결과가 한 페이지를 넘을 때 남은 기간을
+    나눈 하위 조각입니다."""
+
+    __slots__ = ("start", "end", "page_token", "future", "children")
+
+    def __init__(self, start: datetime, end: datetime, page_token: Optional[str]):
+        self.start = start
+        self.end = end
+        self.page_token = page_token
+        self.future = None
+        self.children: List["_Shard"] = []
+
+
+def _month_slices(
+    time_min: datetime, time_max: datetime
+) -> List[Tuple[datetime, datetime]]:
+    """[time_min, time_max) 기간을 매월 1일 경계로 나눕니다."""
+    slices = []
+    start = time_min
+    while start < time_max:
+        # 29~31일에서 바로 다음 달로 바꾸면 없는 날짜가 되므로 1일로 먼저 맞춤
+        month_start = start.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        if start.month == 12:
+            boundary = month_start.replace(year=start.year + 1, month=1)
+        else:
+            boundary = month_start.replace(month=start.month + 1)
+        end = min(boundary, time_max)
+        slices.append((start, end))
+        start = end
+    return slices
+
+
+def _split_shard(
+    shard: _Shard, items: List[Dict], page_token: str
+) -> List[Tuple[datetime, datetime, Optional[str]]]:
+    """한 페이지를 넘은 조각의 남은 부분을 하위 조각으로 나눕니다.
+
+    결과는 시작 시각 순서이므로 아직 받지 못한 이벤트는 마지막 이벤트의 시작 시각
+    이후에 시작합니다. 종일 이벤트와 timezone 차이를 감안해 하루 앞에서부터 다시
+    조회하고 (겹친 이벤트는 ID로 걸러짐), 받은 페이지의 이벤트 밀도로 남은 이벤트
+    수를 추정해 한 조각이 대략 한 페이지가 되도록 나눕니다. 남은 기간이 짧으면
+    다음 페이지를 이어서 조회합니다.
+
+    Returns:
+        (시작 시각, 끝 시각, 페이지 토큰) 목록
+    """
+    last_start = _event_start(items[-1]) if items else None
+    if last_start is not None:
+        rest_start = max(shard.start, last_start - timedelta(days=1))
+        rest = shard.end - rest_start
+        if rest_start > shard.start and rest >= MIN_SHARD_SPAN:
+            estimated = len(items) * (rest / (last_start - shard.start))
+            pieces = min(
+                MAX_SHARD_SPLIT,
+                int(rest / (MIN_SHARD_SPAN / 2)),
+                max(2, math.ceil(estimated / SHARD_PAGE_SIZE)),
+            )
+            bounds = [rest_start + rest * i / pieces for i in range(pieces)]
+            bounds.append(shard.end)
+            return [(bounds[i], bounds[i + 1], None) for i in range(pieces)]
+    return [(shard.start, shard.end, page_token)]
+
+
+def _event_start(item: Dict) -> Optional[datetime]:
+    """이벤트 시작 시각 (UTC). 종일 이벤트는 시작일 0시 UTC로 봅니다."""
+    start = item.get("start") or {}
+    value = start.get("dateTime") or start.get("date")
+    if not value:
+        return None
+    moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def _rfc3339(moment: datetime) -> str:
+    """API 요청용 UTC RFC3339 문자열 (예: 2025-01-01T00:00:00Z)"""
+    return moment.astimezone(timezone.utc).replace(tzinfo=None).isoformat() + "Z"
@@ -0,0 +1,155 @@
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    calendar_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    summary TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    raw TEXT NOT NULL,
+    PRIMARY KEY (calendar_id, id)
+);
+CREATE INDEX IF NOT EXISTS idx_events_summary_end
+    ON events (calendar_id, summary, end_date);
+CREATE INDEX IF NOT EXISTS idx_events_end_date
+    ON events (calendar_id, end_date);
+CREATE TABLE IF NOT EXISTS sync_state (
+    calendar_id TEXT PRIMARY KEY,
+    sync_token TEXT,
+    updated_at TEXT
+);
+"""
+
+
+def _event_date(event_time: Dict) -> Optional[str]:
+    """이벤트 start/end 값에서 YYYY-MM-DD 날짜를 꺼냅니다."""
+    value = event_time.get("date") or event_time.get("dateTime")
+    return value[:10] if value else None
+
+
+class CalendarMirror:
+    def __init__(self, calendar_id: str, db_path: str = "calendar_mirror.sqlite3"):
+        """캘린더 이벤트의 로컬 SQLite 사본을 초기화합니다.
+
+        Args:
+            calendar_id: 구글 캘린더 ID
+            db_path: SQLite 파일 경로
+        """
+        self.calendar_id = calendar_id
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.executescript(SCHEMA)
+
+    def get_sync_token(self) -> Optional[str]:
+        """마지막으로 저장된 nextSyncToken을 반환합니다."""
+        row = self.connection.execute(
+            "SELECT sync_token FROM sync_state WHERE calendar_id = ?",
+            (self.calendar_id,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_sync_token(self, sync_token: Optional[str]) -> None:
+        """nextSyncToken을 저장합니다."""
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO sync_state"
+                " (calendar_id, sync_token, updated_at) VALUES (?, ?, ?)",
+                (self.calendar_id, sync_token, datetime.now().isoformat()),
+            )
+
+    def apply_events(self, items: Iterable[Dict]) -> int:
+        """events.list 응답 항목을 사본에 반영합니다. 취소된 이벤트는 삭제합니다.
+
+        Args:
+            items: events.list 응답의 items
+
+        Returns:
+            반영한 항목 수
+        """
+        count = 0
+        with self.connection:
+            for item in items:
+                count += 1
+                if item.get("status") == "cancelled":
+                    self.connection.execute(
+                        "DELETE FROM events WHERE calendar_id = ? AND id = ?",
+                        (self.calendar_id, item["id"]),
+                    )
+                    continue
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO events"
+                    " (calendar_id, id, summary, start_date, end_date, raw)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        self.calendar_id,
+                        item["id"],
+                        item.get("summary"),
+                        _event_date(item.get("start", {})),
+                        _event_date(item.get("end", {})),
+                        json.dumps(item, ensure_ascii=False),
+                    ),
+                )
+        return count
+
+    def reset(self) -> None:
+        """이 캘린더의 사본과 sync token을 모두 지웁니다 (전체 재동기화용)."""
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM events WHERE calendar_id = ?", (self.calendar_id,)
+            )
+            self.connection.execute(
+                "DELETE FROM sync_state WHERE calendar_id = ?", (self.calendar_id,)
+            )
+
+    def get_events(self, min_date: str, max_date: str) -> List[Dict]:
+        """기간과 겹치는 이벤트를 시작일 순으로 반환합니다.
+
+        Args:
+            min_date: 조회 시작일 (YYYY-MM-DD)
+            max_date: 조회 종료일 (YYYY-MM-DD)
+
+        Returns:
+            events.list 응답 항목과 같은 형식의 이벤트 목록
+        """
+        rows = self.connection.execute(
+            "SELECT raw FROM events WHERE calendar_id = ?"
+            " AND end_date >= ? AND start_date <= ? ORDER BY start_date, id",
+            (self.calendar_id, min_date, max_date),
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    def get_single_events(self, min_week: int, max_week: int = 52) -> List[Dict]:
+        """현재 시점 기준 기간과 겹치는 단발성 이벤트를 반환합니다. API를 호출하지
+        않으므로 마지막으로 동기화한 시점의 내용입니다.
+
+        Args:
+            min_week: 현재 시점에서 과거로 몇 주 전까지의 이벤트를 반환할지 지정
+            max_week: 현재 시점에서 미래로 몇 주 후까지의 이벤트를 반환할지 지정
+
+        Returns:
+            반복 이벤트의 개별 일정을 제외한 이벤트 목록
+        """
+        now = datetime.now()
+        min_date = (now - timedelta(weeks=min_week)).date().isoformat()
+        max_date = (now + timedelta(weeks=max_week)).date().isoformat()
+        return [
+            item
+            for item in self.get_events(min_date, max_date)
+            if "recurringEventId" not in item
+        ]
+
+    def find_by_summary(self, summary: str) -> List[Dict]:
+        """summary가 일치하는 이벤트를 종료일 순으로 반환합니다."""
+        rows = self.connection.execute(
+            "SELECT raw FROM events WHERE calendar_id = ? AND summary = ?"
+            " ORDER BY end_date",
+            (self.calendar_id, summary),
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    def close(self) -> None:
+        self.connection.close()
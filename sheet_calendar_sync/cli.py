@@ -0,0 +1,243 @@
+"""시트-캘린더 동기화 명령줄 도구
+
+    sheet-calendar-sync sync [--config pairs.toml] [--tabs 2025년] [--min-week 26]
+    sheet-calendar-sync plan [--offline]
+    sheet-calendar-sync dedupe [--dry-run]
+    sheet-calendar-sync bench end_to_end --sizes 1000 --latency 0.05
+
+설정은 sheet_calendar_sync.main과 같은 환경 변수(.env)를 읽고, 옵션으로 지정한 값이 우선합니다.
+구글 API 클라이언트는 불러오는 데 오래 걸리므로 필요한 명령에서만 불러옵니다.
+--help와 plan --offline(캘린더 사본과 시트 스냅샷만 사용)은 API 클라이언트를
+불러오지 않습니다.
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional, Tuple
+
+BENCH_PREFIX = "bench_"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="sheet-calendar-sync", description=__doc__.splitlines()[0]
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    pair_options = argparse.ArgumentParser(add_help=False)
+    pair_options.add_argument(
+        "--config", help="pair 설정 파일 (기본값: SYNC_PAIRS_CONFIG 또는 SHEET_ID 등)"
+    )
+    pair_options.add_argument(
+        "--pair", action="append", dest="pairs", help="동기화할 pair 이름 (반복 가능)"
+    )
+    pair_options.add_argument(
+        "--tabs", nargs="+", help="시트 탭 (기본값: 올해 탭, 1월에는 작년 탭 포함)"
+    )
+    pair_options.add_argument("--range", dest="sheet_range", help="셀 범위 (예: E5:M)")
+    pair_options.add_argument(
+        "--min-week", type=int, help="현재 시점에서 과거로 몇 주 전까지 비교할지"
+    )
+
+    commands.add_parser(
+        "sync", parents=[pair_options], help="시트 내용을 캘린더에 동기화"
+    )
+    plan = commands.add_parser(
+        "plan", parents=[pair_options], help="동기화 계획만 출력 (캘린더를 바꾸지 않음)"
+    )
+    plan.add_argument(
+        "--offline",
+        action="store_true",
+        help="API를 호출하지 않고 캘린더 사본과 시트 스냅샷으로 계획",
+    )
+    dedupe = commands.add_parser(
+        "dedupe", parents=[pair_options], help="중복된 캘린더 이벤트 삭제"
+    )
+    dedupe.add_argument(
+        "--dry-run", action="store_true", help="삭제할 이벤트만 출력"
+    )
+    bench = commands.add_parser("bench", help="benchmarks의 벤치마크 실행")
+    bench.add_argument("name", help="벤치마크 이름 (예: end_to_end, cli_startup)")
+    bench.add_argument(
+        "args", nargs=argparse.REMAINDER, help="벤치마크에 넘길 옵션"
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == "bench":
+        return run_bench(args.name, args.args)
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    pairs, max_workers, multi_pair = select_pairs(args)
+    if args.command == "plan" and args.offline:
+        return plan_offline(pairs)
+
+    if args.command == "dedupe":
+        return dedupe(pairs, args.dry_run)
+
+    from sheet_calendar_sync import main as sync_main
+
+    sync_main.run(pairs, max_workers, multi_pair, dry_run=args.command == "plan")
+    return 0
+
+
+def select_pairs(args: argparse.Namespace) -> Tuple[List, int, bool]:
+    """설정 파일이나 환경 변수에서 pair를 읽고 옵션으로 지정한 값을 덮어씁니다.
+
+    Returns:
+        (pair 목록, 동시에 동기화할 최대 pair 수, 여러 pair 모드 여부)
+    """
+    from sheet_calendar_sync.sync_config import load_pairs, load_pairs_from_env
+
+    config = args.config or os.getenv("SYNC_PAIRS_CONFIG")
+    pairs, max_workers = load_pairs(config) if config else load_pairs_from_env()
+    if args.pairs:
+        unknown = set(args.pairs) - {pair.name for pair in pairs}
+        if unknown:
+            raise SystemExit(f"설정에 없는 pair입니다: {', '.join(sorted(unknown))}")
+        pairs = [pair for pair in pairs if pair.name in args.pairs]
+
+    overrides = {}
+    if args.tabs:
+        overrides["sheet_tabs"] = tuple(args.tabs)
+    if args.sheet_range:
+        overrides["sheet_range"] = args.sheet_range
+    if args.min_week is not None:
+        overrides["min_week"] = args.min_week
+    pairs = [pair._replace(**overrides) for pair in pairs]
+    return pairs, max_workers, bool(config)
+
+
+def plan_offline(pairs: List) -> int:
+    """캘린더 사본과 시트 스냅샷만으로 동기화 계획을 출력합니다. 둘 다 마지막으로
+    조회한 시점의 내용이므로, 캘린더에서 직접 지우거나 바꾼 이벤트처럼 둘 사이의
+    차이를 API 호출 없이 확인할 때 사용합니다."""
+    from datetime import datetime, timedelta
+    from sheet_calendar_sync.calendar_mirror import CalendarMirror
+    from sheet_calendar_sync.fuzzy_matcher import FuzzyMatcher
+    from sheet_calendar_sync.records import CalendarEvent
+    from sheet_calendar_sync.reconciler import Reconciler
+    from sheet_calendar_sync.sheet_snapshot import SheetSnapshot
+    from sheet_calendar_sync.sync_config import default_sheet_tabs
+
+    status = 0
+    for pair in pairs:
+        if not (pair.mirror_path and pair.snapshot_path):
+            print(
+                f"[{pair.name}] --offline에는 mirror_path와 snapshot_path가 "
+                "필요합니다.",
+                file=sys.stderr,
+            )
+            status = 1
+            continue
+
+        snapshot_items = [
+            item
+            for tab in pair.sheet_tabs or default_sheet_tabs(datetime.now())
+            for item in SheetSnapshot(
+                pair.snapshot_path, f"{tab}!{pair.sheet_range}"
+            ).items()
+        ]
+        if not snapshot_items:
+            print(
+                f"[{pair.name}] 시트 스냅샷이 비어 있습니다. 먼저 sync를 실행하세요.",
+                file=sys.stderr,
+            )
+            status = 1
+            continue
+
+        mirror = CalendarMirror(pair.calendar_id, pair.mirror_path)
+        calendar_data = CalendarEvent.from_events(
+            [item for item in mirror.get_single_events(pair.min_week) if "end" in item]
+        )
+        mirror.close()
+
+        # 동기화와 같이 캘린더 조회 기간보다 한 주 짧은 기간의 행만 비교
+        min_date = (
+            (datetime.now() - timedelta(weeks=pair.min_week - 1)).date().isoformat()
+        )
+        sheet_data = [
+            item for item in snapshot_items if item.get("due_date", "") >= min_date
+        ]
+        matcher = FuzzyMatcher(pair.fuzzy_threshold) if pair.fuzzy_threshold else None
+        plan = Reconciler.build_plan(sheet_data, calendar_data, matcher)
+        # 동기화는 시트에서 지운 행의 이벤트만 삭제하는데, 지운 행은 스냅샷에 남아
+        # 있지 않아 알 수 없으므로 시트에 없는 이벤트는 계획에서 뺌
+        plan.deletes.clear()
+        print(f"[{pair.name}]")
+        print(plan.describe())
+    return status
+
+
+def dedupe(pairs: List, dry_run: bool) -> int:
+    """pair마다 캘린더의 중복 이벤트를 삭제합니다."""
+    from rich import print
+    from sheet_calendar_sync.calendar_manager import GoogleCalendarManager
+    from sheet_calendar_sync.calendar_mirror import CalendarMirror
+    from sheet_calendar_sync.sync_journal import SyncJournal
+    from sheet_calendar_sync import main as sync_main
+
+    google_service = sync_main.create_google_service()
+    failed = 0
+    for pair in pairs:
+        print(f"[{pair.name}]")
+        calendar_manager = GoogleCalendarManager(
+            google_service, pair.calendar_id, concurrency=pair.write_concurrency
+        )
+        mirror = (
+            CalendarMirror(pair.calendar_id, pair.mirror_path)
+            if pair.mirror_path
+            else None
+        )
+        journal = None
+        if pair.journal_path and not dry_run:
+            journal = SyncJournal(pair.journal_path)
+        results = calendar_manager.remove_duplicate_events(
+            pair.min_week, mirror, dry_run=dry_run, journal=journal
+        )
+        failed += sum(1 for result in results if not result.ok)
+        if journal is not None:
+            journal.compact()
+    sync_main.report_metrics(google_service)
+    return 1 if failed else 0
+
+
+def run_bench(name: str, args: List[str]) -> int:
+    """benchmarks/bench_<name>.py의 run()을 실행합니다. 벤치마크는 패키지에
+    포함되지 않으므로 저장소 루트에서 실행해야 합니다."""
+    import importlib
+
+    module_name = f"benchmarks.{BENCH_PREFIX}{name}"
+    try:
+        module = importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        if e.name not in ("benchmarks", module_name):
+            raise
+        print(f"벤치마크 {module_name}을(를) 찾을 수 없습니다.", file=sys.stderr)
+        print(f"사용 가능한 벤치마크: {', '.join(list_benchmarks())}", file=sys.stderr)
+        return 2
+    sys.argv = [f"{sys.argv[0]} bench {name}", *args]
+    module.run()
+    return 0
+
+
+def list_benchmarks() -> List[str]:
+    # 벤치마크는 패키지 디렉터리 옆(저장소 루트)에 있음
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    directory = os.path.join(root, "benchmarks")
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        filename[len(BENCH_PREFIX) : -len(".py")]
+        for filename in os.listdir(directory)
+        if filename.startswith(BENCH_PREFIX) and filename.endswith(".py")
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
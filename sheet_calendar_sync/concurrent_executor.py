@@ -0,0 +1,106 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+from sheet_calendar_sync.batch_executor import BatchExecutor, MutationResult
+from sheet_calendar_sync.quota_governor import QuotaGovernor
+
+
+class ConcurrentExecutor:
+    def __init__(
+        self,
+        service,
+        http_factory: Callable[[], Any],
+        max_workers: int = 4,
+        batch_size: int = 1,
+        governor: Optional[QuotaGovernor] = None,
+        api: str = "calendar",
+    ):
+        """요청을 여러 스레드에서 동시에 실행하는 실행기를 초기화합니다.
+
+        httplib2 객체는 스레드 간에 공유할 수 없으므로 스레드마다
+        http_factory로 http 객체를 하나씩 만들어 재사용하고, execute가 끝나면
+        연결을 닫습니다.
+
+        Args:
+            service: 구글 API 서비스 인스턴스
+            http_factory: 호출할 때마다 새 http 객체를 만드는 함수 (예:
+                GoogleService.create_authorized_http). 만든 객체는 실행기가 닫으므로
+                다른 곳에서 쓰는 객체를 반환하면 안 됨
+            max_workers: 동시에 실행할 스레드 수
+            batch_size: 스레드 하나가 한 번에 보낼 요청 수. 1보다 크면 스레드마다
+                배치 요청으로 보냄 (최대 50)
+            governor: 요청 속도 조절/재시도에 사용할 할당량 관리자 (선택 사항)
+            api: 할당량 관리자에 기록할 API 이름
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers는 1 이상이어야 합니다.")
+        self.service = service
+        self.http_factory = http_factory
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.governor = governor
+        self.api = api
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._https: List[Any] = []
+
+    def execute(self, requests: List[Tuple[str, HttpRequest]]) -> List[MutationResult]:
+        """요청 목록을 동시에 실행합니다.
+
+        Args:
+            requests: (식별용 key, HttpRequest) 목록
+
+        Returns:
+            완료 순서와 관계없이 입력 순서와 같은 순서의 요청별 결과 목록
+        """
+        chunks = [
+            requests[start : start + self.batch_size]
+            for start in range(0, len(requests), self.batch_size)
+        ]
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                chunk_results = list(pool.map(self._execute_chunk, chunks))
+        finally:
+            # 스레드는 실행마다 새로 만들어지므로 연결을 남겨 두지 않음
+            self._close_https()
+        return [result for results in chunk_results for result in results]
+
+    def _get_http(self):
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self.http_factory()
+            self._local.http = http
+            with self._lock:
+                self._https.append(http)
+        return http
+
+    def _close_https(self) -> None:
+        with self._lock:
+            https, self._https = self._https, []
+        for http in https:
+            http.close()
+        self._local = threading.local()
+
+    def _execute_chunk(
+        self, chunk: List[Tuple[str, HttpRequest]]
+    ) -> List[MutationResult]:
+        http = self._get_http()
+        if self.batch_size > 1:
+            executor = BatchExecutor(
+                self.service, self.batch_size, http, self.governor, self.api
+            )
+            return executor.execute(chunk)
+
+        results = []
+        for key, request in chunk:
+            try:
+                if self.governor is not None:
+                    response = self.governor.execute(request, self.api, http=http)
+                else:
+                    response = request.execute(http=http)
+                results.append(MutationResult(key, response, None))
+            except HttpError as error:
+                results.append(MutationResult(key, None, error))
+        return results
@@ -0,0 +1,335 @@
+import secrets
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+import httplib2
+from google.auth.exceptions import RefreshError, TransportError
+from googleapiclient.errors import HttpError
+from rich import print
+from sheet_calendar_sync.service import GoogleService
+from sheet_calendar_sync.calendar_manager import GoogleCalendarManager
+from sheet_calendar_sync.drive_manager import GoogleDriveManager
+from sheet_calendar_sync.pair_sync import results_table, sync_pairs
+from sheet_calendar_sync.sync_config import SyncPair
+
+CALENDAR = "calendar"
+DRIVE = "drive"
+# 채널 유지 시간 (초). 드라이브 파일 채널은 최대 1일까지만 유지됨
+DEFAULT_CHANNEL_TTL = {CALENDAR: 7 * 24 * 3600, DRIVE: 24 * 3600}
+# 채널 갱신에 실패했을 때 다시 시도하기까지 기다릴 시간 (초)
+RENEW_RETRY_DELAY = 60.0
+# 데몬을 멈추지 않고 기록한 뒤 다시 시도할 오류 (API 오류, 네트워크 오류
+# (socket.timeout, ConnectionError 등 OSError 포함), 토큰 발급 실패)
+RETRYABLE_ERRORS = (
+    HttpError,
+    httplib2.HttpLib2Error,
+    OSError,
+    TransportError,
+    RefreshError,
+)
+
+
+class WatchChannel(NamedTuple):
+    """구독 중인 푸시 알림 채널"""
+
+    pair: str
+    kind: str
+    channel_id: str
+    resource_id: str
+    # 만료 시각 (epoch 초)
+    expiration: float
+
+
+class SyncDaemon:
+    def __init__(
+        self,
+        google_service: GoogleService,
+        pairs: List[SyncPair],
+        address: str,
+        listen: Tuple[str, int] = ("0.0.0.0", 8080),
+        debounce: float = 10.0,
+        max_wait: float = 60.0,
+        max_workers: int = 1,
+        renew_margin: float = 600.0,
+        resync_interval: float = 3600.0,
+        channel_ttl: Optional[Dict[str, int]] = None,
+    ):
+        """푸시 알림을 받을 때만 동기화하는 데몬을 초기화합니다.
+
+        pair마다 캘린더 events.watch와 시트 파일의 드라이브 files.watch 채널을
+        만들고, 내장 웹훅 서버로 받은 알림을 모아 debounce초 동안 추가 알림이
+        없으면 해당 pair만 동기화합니다. 채널은 만료 renew_margin초 전에 새로 만들고
+        이전 채널을 닫습니다. 알림이 유실될 수 있으므로 resync_interval마다 모든
+        pair를 한 번씩 동기화합니다.
+
+        변경분만 조회/비교하도록 pair마다 mirror_path와 snapshot_path를 지정해 두는
+        것이 좋습니다. 동기화로 캘린더를 바꾸면 그 알림으로 한 번 더 동기화하지만
+        이때는 바뀐 행이 없어 조회만 합니다.
+
+        Args:
+            google_service: 구글 서비스 인스턴스
+            pairs: 동기화할 pair 목록
+            address: 구글이 알림을 보낼 HTTPS 주소 (리버스 프록시 등을 거쳐 listen
+                주소로 전달되어야 함)
+            listen: 웹훅 서버가 바인드할 (주소, 포트)
+            debounce: 마지막 알림 후 동기화까지 기다릴 시간 (초)
+            max_wait: 알림이 계속 와도 첫 알림 후 이 시간 안에는 동기화 (초)
+            max_workers: 동시에 동기화할 최대 pair 수
+            renew_margin: 채널 만료 몇 초 전에 새 채널을 만들지
+            resync_interval: 알림과 관계없이 모든 pair를 동기화할 간격 (초, 0이면
+                사용 안 함)
+            channel_ttl: 채널 종류("calendar", "drive")별 유지 시간 (초)
+        """
+        self.channel_ttl = dict(DEFAULT_CHANNEL_TTL, **(channel_ttl or {}))
+        if renew_margin >= min(self.channel_ttl.values()):
+            raise ValueError("renew_margin은 채널 유지 시간보다 짧아야 합니다.")
+        self.google_service = google_service
+        self.pairs = {pair.name: pair for pair in pairs}
+        self.address = address
+        self.debounce = debounce
+        self.max_wait = max_wait
+        self.max_workers = max_workers
+        self.renew_margin = renew_margin
+        self.resync_interval = resync_interval
+        # 알림 헤더로 돌려받아 다른 곳에서 보낸 요청과 구분하는 값
+        self.token = secrets.token_urlsafe(24)
+        self.channels: Dict[str, WatchChannel] = {}
+        # 구독에 실패해 다시 만들어야 하는 (pair 이름, 채널 종류)
+        self._unwatched: Set[Tuple[str, str]] = set()
+        self.notifications = 0
+        self._due: Dict[str, float] = {}
+        self._first_notified: Dict[str, float] = {}
+        self._next_resync = time.monotonic() + resync_interval
+        self._renew_retry_at = 0.0
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._server = ThreadingHTTPServer(listen, _make_handler(self))
+        self._server.daemon_threads = True
+
+    @property
+    def listen_address(self) -> Tuple[str, int]:
+        return self._server.server_address[:2]
+
+    def run(self) -> None:
+        """stop이 호출될 때까지 알림을 받아 동기화합니다. 끝나면 채널을 모두
+        닫습니다."""
+        for pair in self.pairs.values():
+            if not (pair.mirror_path and pair.snapshot_path):
+                print(
+                    f"[{pair.name}] mirror_path/snapshot_path가 없어 알림마다 "
+                    "전체 데이터를 조회/비교합니다."
+                )
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        print(f"웹훅 서버 {self.listen_address}, 알림 주소 {self.address}")
+        try:
+            # 구독 후 한 번 동기화해 구독 전에 바뀐 내용을 반영
+            for pair in self.pairs.values():
+                self._watch_pair(pair)
+            self._sync(list(self.pairs))
+            while True:
+                names = self._wait_due()
+                if names is None:
+                    break
+                if names:
+                    self._sync(names)
+                self._renew_channels()
+                if self.resync_interval and time.monotonic() >= self._next_resync:
+                    self._next_resync = time.monotonic() + self.resync_interval
+                    for name in self.pairs:
+                        self.schedule(name, 0.0)
+        finally:
+            self._stop_channels()
+            self._server.shutdown()
+            self._server.server_close()
+
+    def stop(self) -> None:
+        """run을 끝냅니다. 다른 스레드나 시그널 핸들러에서 호출합니다."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+    def schedule(self, name: str, delay: Optional[float] = None) -> None:
+        """pair 동기화를 예약합니다. 예약된 동기화가 있으면 delay(기본값:
+        debounce)만큼 미루되 첫 예약 후 max_wait를 넘기지 않습니다."""
+        now = time.monotonic()
+        delay = self.debounce if delay is None else delay
+        with self._condition:
+            first = self._first_notified.setdefault(name, now)
+            self._due[name] = min(now + delay, first + self.max_wait)
+            self._condition.notify_all()
+
+    def handle_notification(self, headers) -> int:
+        """웹훅으로 받은 알림 하나를 처리하고 응답할 HTTP 상태 코드를 반환합니다.
+
+        Args:
+            headers: 알림 요청 헤더 (X-Goog-Channel-ID 등)
+
+        Returns:
+            응답 상태 코드 (토큰이 다르면 403, 모르는 채널이면 404)
+        """
+        if headers.get("X-Goog-Channel-Token") != self.token:
+            return 403
+        with self._condition:
+            channel = self.channels.get(headers.get("X-Goog-Channel-ID", ""))
+        if channel is None:
+            return 404
+        # 채널을 만들 때 오는 첫 알림은 변경 알림이 아님
+        if headers.get("X-Goog-Resource-State") != "sync":
+            with self._condition:
+                self.notifications += 1
+            self.schedule(channel.pair)
+        return 200
+
+    def _wait_due(self) -> Optional[List[str]]:
+        """동기화할 pair가 생기거나 채널 갱신/정기 동기화 시각이 될 때까지
+        기다립니다. stop이 호출되면 None을 반환합니다."""
+        with self._condition:
+            while not self._stopped:
+                now = time.monotonic()
+                due = [name for name, at in self._due.items() if at <= now]
+                if due:
+                    for name in due:
+                        del self._due[name]
+                        del self._first_notified[name]
+                    return due
+                wake_at = min([*self._due.values(), self._next_housekeeping()])
+                if wake_at <= now:
+                    return []
+                self._condition.wait(wake_at - now)
+            return None
+
+    def _next_housekeeping(self) -> float:
+        """다음 채널 갱신 또는 정기 동기화 시각 (monotonic)"""
+        offset = time.monotonic() - time.time()
+        times = [
+            max(channel.expiration - self.renew_margin + offset, self._renew_retry_at)
+            for channel in self.channels.values()
+        ]
+        if self._unwatched:
+            times.append(self._renew_retry_at)
+        if self.resync_interval:
+            times.append(self._next_resync)
+        return min(times, default=time.monotonic() + 60)
+
+    def _sync(self, names: List[str]) -> None:
+        pairs = [self.pairs[name] for name in names]
+        try:
+            self.google_service.ensure_token()
+            results = sync_pairs(self.google_service, pairs, self.max_workers)
+        except RETRYABLE_ERRORS as e:
+            # 토큰 발급, 서비스 준비 중 네트워크 오류 등. max_wait 후 다시 동기화
+            print(f"동기화 준비 실패: {e!r}")
+            for name in names:
+                self.schedule(name, self.max_wait)
+            return
+        print(results_table(results))
+        # 실패한 pair는 max_wait 후 다시 동기화 (알림은 다시 오지 않으므로)
+        for result in results:
+            if not result.ok:
+                self.schedule(result.name, self.max_wait)
+
+    def _watch_pair(
+        self, pair: SyncPair, kinds: Tuple[str, ...] = (CALENDAR, DRIVE)
+    ) -> None:
+        """pair의 알림 채널을 만듭니다. 실패한 채널은 RENEW_RETRY_DELAY 후 채널
+        갱신 때 다시 만듭니다."""
+        for kind in kinds:
+            try:
+                channel = self._watch(pair, kind)
+            except RETRYABLE_ERRORS as e:
+                print(f"[{pair.name}] {kind} 알림 구독 실패: {e!r}")
+                self._unwatched.add((pair.name, kind))
+                self._renew_retry_at = time.monotonic() + RENEW_RETRY_DELAY
+                continue
+            self._unwatched.discard((pair.name, kind))
+            with self._condition:
+                self.channels[channel.channel_id] = channel
+
+    def _watch(self, pair: SyncPair, kind: str) -> WatchChannel:
+        channel_id = str(uuid.uuid4())
+        ttl = self.channel_ttl[kind]
+        if kind == CALENDAR:
+            manager = GoogleCalendarManager(self.google_service, pair.calendar_id)
+            response = manager.watch_events(channel_id, self.address, self.token, ttl)
+        else:
+            response = GoogleDriveManager(self.google_service).watch_file(
+                pair.sheet_id, channel_id, self.address, self.token, ttl
+            )
+        return WatchChannel(
+            pair.name,
+            kind,
+            response["id"],
+            response["resourceId"],
+            int(response["expiration"]) / 1000,
+        )
+
+    def _renew_channels(self) -> None:
+        """만료가 가까운 채널을 새로 만든 뒤 이전 채널을 닫습니다. 새 채널을 먼저
+        만들어 알림이 끊기는 구간이 없게 합니다."""
+        if time.monotonic() < self._renew_retry_at:
+            return
+        for name, kind in sorted(self._unwatched):
+            self._watch_pair(self.pairs[name], (kind,))
+        renew_before = time.time() + self.renew_margin
+        with self._condition:
+            expiring = [
+                channel
+                for channel in self.channels.values()
+                if channel.expiration <= renew_before
+            ]
+        for channel in expiring:
+            try:
+                renewed = self._watch(self.pairs[channel.pair], channel.kind)
+            except RETRYABLE_ERRORS as e:
+                print(f"[{channel.pair}] {channel.kind} 알림 채널 갱신 실패: {e!r}")
+                # 잠시 후 다시 시도하고, 이미 만료된 채널은 목록에서 빼고 새로 구독
+                self._renew_retry_at = time.monotonic() + RENEW_RETRY_DELAY
+                if channel.expiration <= time.time():
+                    with self._condition:
+                        del self.channels[channel.channel_id]
+                    self._unwatched.add((channel.pair, channel.kind))
+                continue
+            with self._condition:
+                self.channels[renewed.channel_id] = renewed
+                del self.channels[channel.channel_id]
+            self._stop_channel(channel)
+
+    def _stop_channels(self) -> None:
+        with self._condition:
+            channels, self.channels = list(self.channels.values()), {}
+        for channel in channels:
+            self._stop_channel(channel)
+
+    def _stop_channel(self, channel: WatchChannel) -> None:
+        try:
+            if channel.kind == CALENDAR:
+                manager = GoogleCalendarManager(
+                    self.google_service, self.pairs[channel.pair].calendar_id
+                )
+            else:
+                manager = GoogleDriveManager(self.google_service)
+            manager.stop_channel(channel.channel_id, channel.resource_id)
+        except RETRYABLE_ERRORS as e:
+            # 이미 만료된 채널, 네트워크 오류 등. 닫지 못해도 만료되면 알림이 끊김
+            print(f"[{channel.pair}] {channel.kind} 알림 채널 닫기 실패: {e!r}")
+
+
+def _make_handler(daemon: SyncDaemon):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                self.rfile.read(length)
+            status = daemon.handle_notification(self.headers)
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    return Handler
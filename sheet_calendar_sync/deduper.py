@@ -0,0 +1,131 @@
+import hashlib
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from sheet_calendar_sync.utils import remove_non_words, transform_datetime_to_date
+
+# (정규화된 summary, 시작일 YYYY-MM-DD 또는 UTC 시작 시각, description 해시)
+Fingerprint = Tuple[str, str, str]
+
+
+class DuplicateGroup(NamedTuple):
+    """지문이 같은 이벤트 묶음. keep은 가장 먼저 만들어진 이벤트입니다."""
+
+    fingerprint: Fingerprint
+    keep: Dict
+    duplicates: List[Dict]
+
+
+class DedupePlan(NamedTuple):
+    """중복 제거 계획"""
+
+    groups: List[DuplicateGroup]
+    scanned: int
+
+    @property
+    def deletes(self) -> List[Dict]:
+        return [event for group in self.groups for event in group.duplicates]
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            "scanned": self.scanned,
+            "groups": len(self.groups),
+            "delete": sum(len(group.duplicates) for group in self.groups),
+        }
+
+    def describe(self) -> str:
+        """검토용으로 묶음마다 남길 이벤트와 삭제할 이벤트를 나열합니다."""
+        lines = []
+        for group in self.groups:
+            summary, date, _ = group.fingerprint
+            lines.append(f"{date} {group.keep.get('summary') or summary}")
+            lines.append(f"  keep   {group.keep['id']} ({group.keep.get('created')})")
+            for event in group.duplicates:
+                lines.append(f"  delete {event['id']} ({event.get('created')})")
+        lines.append(str(self.counts()))
+        return "\n".join(lines)
+
+
+def make_fingerprint(event: Dict) -> Optional[Fingerprint]:
+    """이벤트의 중복 판별 지문을 만듭니다. 시작일이 없으면 None을 반환합니다.
+
+    summary와 description은 공백/줄바꿈을 모두 제거하고 비교하므로 공백만 다른
+    이벤트도 같은 이벤트로 봅니다. 종일 이벤트는 시작일로, 시간 지정 이벤트는
+    시작 시각까지 비교하므로 같은 날 시간이 다른 같은 이름의 일정은 중복이
+    아닙니다.
+
+    Args:
+        event: events.list 응답 항목 형식의 이벤트
+
+    Returns:
+        (정규화된 summary, 시작일 또는 시작 시각, description 해시) 또는 None
+    """
+    start = event.get("start") or {}
+    if start.get("date"):
+        start_key = transform_datetime_to_date(start["date"])
+    elif start.get("dateTime"):
+        start_key = _utc_datetime(start["dateTime"])
+    else:
+        return None
+    description = remove_non_words(event.get("description") or "")
+    return (
+        remove_non_words(event.get("summary") or "").casefold(),
+        start_key,
+        hashlib.sha1(description.encode("utf-8")).hexdigest()[:16],
+    )
+
+
+class Deduper:
+    @staticmethod
+    def build_plan(events: Iterable[Dict]) -> DedupePlan:
+        """이벤트를 한 번만 훑어 지문이 같은 이벤트 중 가장 먼저 만들어진 것만
+        남기는 중복 제거 계획을 만듭니다.
+
+        Args:
+            events: events.list 응답 항목 또는 캘린더 사본의 이벤트
+
+        Returns:
+            중복 묶음과 삭제할 이벤트를 담은 계획
+        """
+        groups: Dict[Fingerprint, Tuple[Dict, List[Dict]]] = {}
+        scanned = 0
+        for event in events:
+            if event.get("status") == "cancelled" or "recurringEventId" in event:
+                continue
+            fingerprint = make_fingerprint(event)
+            if fingerprint is None:
+                continue
+            scanned += 1
+            if fingerprint not in groups:
+                groups[fingerprint] = (event, [])
+                continue
+            keep, duplicates = groups[fingerprint]
+            if _age_key(event) < _age_key(keep):
+                keep, event = event, keep
+                groups[fingerprint] = (keep, duplicates)
+            duplicates.append(event)
+
+        return DedupePlan(
+            [
+                DuplicateGroup(fingerprint, keep, duplicates)
+                for fingerprint, (keep, duplicates) in groups.items()
+                if duplicates
+            ],
+            scanned,
+        )
+
+
+def _utc_datetime(date_time: str) -> str:
+    """시간대 표기가 달라도 같은 시각이면 같은 문자열이 되도록 UTC로 바꿉니다."""
+    try:
+        parsed = datetime.fromisoformat(date_time)
+    except ValueError:
+        return date_time
+    if parsed.tzinfo is None:
+        return parsed.isoformat()
+    return parsed.astimezone(timezone.utc).isoformat()
+
+
+def _age_key(event: Dict) -> Tuple[str, str]:
+    """만든 시각이 빠른 순서. created가 같으면 ID로 정해 항상 같은 이벤트를
+    남깁니다. (created는 항상 UTC RFC3339 형식이라 문자열로 비교 가능)"""
+    return event.get("created") or "9999", event.get("id") or ""
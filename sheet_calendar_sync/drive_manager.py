@@ -0,0 +1,55 @@
+import time
+from typing import Any, Dict
+from sheet_calendar_sync.service import GoogleService
+
+
+class GoogleDriveManager:
+    def __init__(self, google_service: GoogleService, http: Any = None):
+        """구글 드라이브 관리자를 초기화합니다. 시트 파일의 변경 알림 구독에만
+        사용하므로 메타데이터 읽기 권한만 요청합니다.
+
+        Args:
+            google_service: 구글 서비스 인스턴스
+            http: 인증 대신 사용할 http 객체 (선택 사항, 오프라인 테스트용)
+        """
+        self.SCOPE = ["https://www.googleapis.com/auth/drive.metadata.readonly"]
+        self.API_SERVICE_NAME = "drive"
+        self.API_VERSION = "v3"
+        self.governor = google_service.governor
+        self.service = google_service.create_service(
+            self.API_SERVICE_NAME, self.API_VERSION, self.SCOPE, http=http
+        )
+
+    def watch_file(
+        self, file_id: str, channel_id: str, address: str, token: str, ttl: int
+    ) -> Dict:
+        """파일(시트)이 바뀌면 address로 푸시 알림을 보내는 채널을 만듭니다.
+
+        Args:
+            file_id: 드라이브 파일 ID (시트 ID)
+            channel_id: 새 채널 ID (UUID 등 고유한 값)
+            address: 알림을 받을 HTTPS 주소
+            token: 알림마다 X-Goog-Channel-Token 헤더로 돌려받을 값
+            ttl: 채널 유지 시간 (초, 드라이브는 최대 1일)
+
+        Returns:
+            id, resourceId, expiration(밀리초 문자열)을 담은 채널 정보
+        """
+        request = self.service.files().watch(
+            fileId=file_id,
+            body={
+                "id": channel_id,
+                "type": "web_hook",
+                "address": address,
+                "token": token,
+                "expiration": str(int((time.time() + ttl) * 1000)),
+            },
+        )
+        return self.governor.execute(request, self.API_SERVICE_NAME)
+
+    def stop_channel(self, channel_id: str, resource_id: str) -> None:
+        """푸시 알림 채널을 닫습니다."""
+        request = self.service.channels().stop(
+            body={"id": channel_id, "resourceId": resource_id}
+        )
+        self.governor.execute(request, self.API_SERVICE_NAME)
@@ -0,0 +1,220 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Dict, Hashable, Iterable, List, Optional
+from sheet_calendar_sync.utils import normalize_date_str, transform_datetime_to_date
+
+# extendedProperties.private에 저장하는 내용 해시 키
+CONTENT_HASH_KEY = "syncHash"
+TIME_ZONE = "Asia/Seoul"
+# 렌더링한 요청 본문 캐시 크기. 동기화하는 전체 행 수보다 커야 반복 실행에서 모두
+# 재사용됨 (본문 하나에 약 1KB)
+BODY_CACHE_SIZE = 50_000
+
+
+def compute_content_hash(body: Dict) -> str:
+    """이벤트 본문의 내용 해시를 계산합니다. extendedProperties는 제외합니다.
+
+    Args:
+        body: 캘린더 이벤트 요청 본문
+
+    Returns:
+        16자리 hex 문자열
+    """
+    content = {key: value for key, value in body.items() if key != "extendedProperties"}
+    serialized = json.dumps(content, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()[:16]
+
+
+def create_event_body(event_data: Dict[str, str]) -> Dict:
+    """캘린더 API 요청 본문을 만들고 내용 해시를 extendedProperties에 기록합니다.
+
+    Args:
+        event_data: transform_sheet_data로 변환된 시트 항목
+
+    Returns:
+        캘린더 이벤트 요청 본문
+    """
+    due_date = event_data.get("due_date")
+    if due_date is None:
+        raise ValueError("due_date값은 필수 입니다.")
+    return _render_body(
+        event_data.get("summary"),
+        due_date,
+        transform_datetime_to_date(due_date, 1),
+        event_data.get("description"),
+    )
+
+
+def render_event_bodies(items: Iterable[Dict]) -> List[Dict]:
+    """여러 시트 항목의 요청 본문을 한 번에 만듭니다. create_event_body와 결과가
+    같지만, 종료일은 항목마다 문자열을 파싱하지 않고 같은 날짜끼리 한 번만 하루를
+    더해 구합니다.
+
+    Args:
+        items: transform_sheet_data로 변환된 시트 항목
+
+    Returns:
+        입력 순서와 같은 요청 본문 목록
+    """
+    end_dates: Dict[str, str] = {}
+    bodies = []
+    for item in items:
+        due_date = item.get("due_date")
+        if due_date is None:
+            raise ValueError("due_date값은 필수 입니다.")
+        end_date = end_dates.get(due_date)
+        if end_date is None:
+            end_date = end_dates[due_date] = _next_day(due_date)
+        bodies.append(
+            _render_body(
+                item.get("summary"), due_date, end_date, item.get("description")
+            )
+        )
+    return bodies
+
+
+class EventBodyCache:
+    def __init__(self, maxsize: int = BODY_CACHE_SIZE):
+        """행 내용별로 렌더링한 요청 본문을 보관하는 LRU 캐시를 초기화합니다.
+
+        데몬/여러 pair 모드처럼 한 프로세스에서 동기화를 반복하면 바뀌지 않은
+        행은 description 조합, 날짜 계산, 내용 해시 계산 없이 이전 본문을
+        재사용합니다. 여러 스레드에서 함께 사용할 수 있습니다.
+
+        Args:
+            maxsize: 보관할 최대 본문 수 (넘으면 가장 오래 쓰지 않은 본문부터 삭제)
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._bodies: "OrderedDict[Hashable, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._bodies)
+
+    def get_many(self, items: List[Dict]) -> List[Dict]:
+        """항목별 요청 본문을 반환합니다. 캐시에 없는 항목만 render_event_bodies로
+        한 번에 만듭니다. 반환된 본문은 캐시와 공유하므로 수정하면 안 됩니다.
+
+        Args:
+            items: transform_sheet_data로 변환된 시트 항목
+
+        Returns:
+            입력 순서와 같은 요청 본문 목록
+        """
+        keys = [_body_key(item) for item in items]
+        bodies: List[Optional[Dict]] = [None] * len(items)
+        missing = []
+        with self._lock:
+            for position, key in enumerate(keys):
+                body = self._bodies.get(key)
+                if body is None:
+                    missing.append(position)
+                else:
+                    self._bodies.move_to_end(key)
+                    bodies[position] = body
+            self.hits += len(items) - len(missing)
+            self.misses += len(missing)
+        if not missing:
+            return bodies  # type: ignore[return-value]
+
+        rendered = render_event_bodies([items[position] for position in missing])
+        with self._lock:
+            for position, body in zip(missing, rendered):
+                bodies[position] = body
+                self._bodies[keys[position]] = body
+                self._bodies.move_to_end(keys[position])
+            while len(self._bodies) > self.maxsize:
+                self._bodies.popitem(last=False)
+        return bodies  # type: ignore[return-value]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bodies.clear()
+            self.hits = self.misses = 0
+
+
+# 프로세스 전체에서 함께 쓰는 캐시 (pair, 반복 실행 간 공유)
+EVENT_BODY_CACHE = EventBodyCache()
+
+
+def create_event_bodies(items: List[Dict]) -> List[Dict]:
+    """여러 시트 항목의 요청 본문을 공유 캐시를 거쳐 한 번에 만듭니다.
+
+    Args:
+        items: transform_sheet_data로 변환된 시트 항목
+
+    Returns:
+        입력 순서와 같은 요청 본문 목록 (캐시와 공유하므로 수정하면 안 됨)
+    """
+    return EVENT_BODY_CACHE.get_many(items)
+
+
+def get_content_hash(body: Dict) -> Optional[str]:
+    """이벤트 본문(또는 캘린더 이벤트)에 기록된 내용 해시를 반환합니다."""
+    private = (body.get("extendedProperties") or {}).get("private") or {}
+    return private.get(CONTENT_HASH_KEY)
+
+
+def create_patch_body(body: Dict, calendar_item: Dict) -> Dict:
+    """기존 캘린더 이벤트와 달라진 필드만 담은 patch 요청 본문을 만듭니다.
+
+    Args:
+        body: create_event_body로 만든 새 요청 본문
+        calendar_item: transform_calendar_data로 변환된 기존 캘린더 이벤트
+
+    Returns:
+        변경된 필드와 새 내용 해시만 담은 요청 본문
+    """
+    patch: Dict = {}
+    if (body.get("summary") or "") != (calendar_item.get("summary") or ""):
+        patch["summary"] = body.get("summary")
+    if (body.get("description") or "") != (calendar_item.get("description") or ""):
+        patch["description"] = body.get("description")
+    if normalize_date_str(body["start"]["date"]) != calendar_item.get("start_date"):
+        patch["start"] = body["start"]
+        patch["end"] = body["end"]
+    patch["extendedProperties"] = body["extendedProperties"]
+    return patch
+
+
+def _render_body(
+    summary: Optional[str], due_date: str, end_date: str, description: Optional[str]
+) -> Dict:
+    body = {
+        "summary": summary,
+        "start": {
+            "date": due_date,
+            "timeZone": TIME_ZONE,
+        },
+        "end": {
+            "date": end_date,
+            "timeZone": TIME_ZONE,
+        },
+        "description": description,
+    }
+    body["extendedProperties"] = {
+        "private": {CONTENT_HASH_KEY: compute_content_hash(body)}
+    }
+    return body
+
+
+def _next_day(due_date: str) -> str:
+    """종일 이벤트의 종료일 (시작일 다음 날). YYYY-MM-DD는 바로 계산하고 그 밖의
+    형식만 문자열을 파싱합니다."""
+    try:
+        return (date.fromisoformat(due_date) + timedelta(days=1)).isoformat()
+    except ValueError:
+        return transform_datetime_to_date(due_date, 1)
+
+
+def _body_key(item: Dict) -> Hashable:
+    """요청 본문 캐시 키. SheetRow처럼 튜플인 항목은 행 내용 자체를, dict 항목은
+    본문에 들어가는 필드를 키로 씁니다 (description을 만들지 않고 비교)."""
+    if isinstance(item, tuple):
+        return item
+    return item.get("summary"), item.get("due_date"), item.get("description")
@@ -0,0 +1,198 @@
+from rich import print
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from sheet_calendar_sync.sheet_manager import GoogleSheetManager
+from sheet_calendar_sync.calendar_manager import GoogleCalendarManager
+from sheet_calendar_sync.batch_executor import MutationResult
+from sheet_calendar_sync.reconciler import Reconciler, SyncPlan, make_key
+from sheet_calendar_sync.fuzzy_matcher import FuzzyMatcher
+from sheet_calendar_sync.sheet_snapshot import RowDelta, SheetSnapshot
+from sheet_calendar_sync.utils import (
+    find_non_matched_items,
+)
+
+
+class EventSynchronizer:
+    def __init__(
+        self,
+        sheet_manager: GoogleSheetManager,
+        calendar_manager: GoogleCalendarManager,
+        matcher: Optional[FuzzyMatcher] = None,
+    ):
+        """이벤트 동기화 관리자를 초기화합니다.
+
+        Args:
+            sheet_manager: 구글 시트 관리자 인스턴스
+            calendar_manager: 구글 캘린더 관리자 인스턴스
+            matcher: 지정하면 이름이 조금 바뀐 시트 행을 새 이벤트로 추가하지 않고
+                기존 이벤트를 수정 (선택 사항)
+        """
+        self.sheet_manager = sheet_manager
+        self.calendar_manager = calendar_manager
+        self.matcher = matcher
+
+    @staticmethod
+    def check_new_events(
+        sheet_events: List[Dict], calendar_events: List[Dict]
+    ) -> Tuple[List, List, List]:
+        """시트와 캘린더의 이벤트를 비교하여 새로운 이벤트를 찾습니다.
+
+        Args:
+            sheet_events: 시트에서 가져온 이벤트 목록
+            calendar_events: 캘린더에서 가져온 이벤트 목록
+
+        Returns:
+            새로운 이벤트 목록, 기존 이벤트 목록, 기존 이벤트 ID 목록을 반환
+        """
+
+        # summary: 이벤트 이름
+        new_events = [event.get("summary") for event in sheet_events]
+        existing_events = [event.get("summary") for event in calendar_events]
+        existing_event_id = [event.get("event_id") for event in calendar_events]
+
+        new_event_list = find_non_matched_items(new_events, existing_events)
+        new_event_list = list(filter(None, new_event_list))
+
+        return new_event_list, existing_events, existing_event_id
+
+    def build_plan(
+        self, sheet_events: Iterable[Dict], calendar_events: Iterable[Dict]
+    ) -> SyncPlan:
+        """시트와 캘린더의 이벤트를 summary + 날짜 기준으로 비교하여 동기화 계획을
+        만듭니다. check_new_events와 달리 양쪽을 한 번씩만 인덱싱하므로 선형 시간에
+        동작하고, 이름이 같은 다른 날짜의 이벤트를 서로 다른 이벤트로 구분합니다.
+
+        Args:
+            sheet_events: 시트에서 가져온 이벤트 목록
+            calendar_events: 캘린더에서 가져온 이벤트 목록
+
+        Returns:
+            추가/수정/삭제/변경없음 항목으로 나뉜 동기화 계획
+        """
+        return Reconciler.build_plan(sheet_events, calendar_events, self.matcher)
+
+    def build_delta_plan(
+        self,
+        snapshot: SheetSnapshot,
+        sheet_events: List,
+        start_row: int,
+        calendar_events: List[Dict],
+        min_week: int,
+        source_tab: Optional[str] = None,
+    ) -> Tuple[SyncPlan, RowDelta]:
+        """지난 실행 이후 추가/변경/삭제된 시트 행만 변환하고 비교하여 동기화
+        계획을 만듭니다. 스냅샷은 메모리에서만 갱신되며, 계획 반영이 끝난 뒤
+        snapshot.save()로 저장해야 합니다.
+
+        Args:
+            snapshot: 시트 스냅샷
+            sheet_events: get_sheet_data로 가져온 원본 행 목록
+            start_row: 첫 행의 시트 행 번호
+            calendar_events: transform_calendar_data로 변환된 캘린더 데이터
+            min_week: 현재 시점에서 과거로 몇 주 전까지의 행을 비교할지 지정
+            source_tab: 데이터를 가져온 탭 이름 (선택 사항)
+
+        Returns:
+            동기화 계획과 행 변경 내역
+        """
+        delta = snapshot.diff(sheet_events, start_row)
+        transformed = self.sheet_manager.transform_sheet_delta(delta, source_tab)
+        stale_items = list(delta.removed.values()) + [
+            snapshot.previous_item(row_number) for row_number in delta.changed
+        ]
+        snapshot.update(delta, transformed)
+
+        dirty_items = self.iter_limited_by_datetime(
+            (item for item in transformed.values() if item), min_week
+        )
+        plan = Reconciler.build_delta_plan(
+            dirty_items,
+            [item for item in stale_items if item],
+            calendar_events,
+            snapshot.items(),
+            self.matcher,
+        )
+        return plan, delta
+
+    @staticmethod
+    def revert_failed_rows(
+        snapshot: SheetSnapshot,
+        plan: SyncPlan,
+        results: List[MutationResult],
+        delete: bool = False,
+    ) -> List[int]:
+        """반영에 실패한 계획 항목의 시트 행을 스냅샷에서 이전 상태로 되돌립니다.
+        성공한 행만 저장되고 실패한 행은 다음 실행에서 다시 비교합니다.
+
+        Args:
+            snapshot: build_delta_plan에 사용한 스냅샷
+            plan: build_delta_plan으로 만든 동기화 계획
+            results: apply_plan 결과 (추가, 수정, 삭제 순서)
+            delete: apply_plan에서 삭제 항목을 반영했는지 여부
+
+        Returns:
+            되돌린 시트 행 번호 목록
+        """
+        items = plan.inserts + plan.updates + (plan.deletes if delete else [])
+        failed_keys = {
+            item.key for item, result in zip(items, results) if not result.ok
+        }
+        if not failed_keys:
+            return []
+        rows = [
+            row_number
+            for row_number, row_items in snapshot.updated_items()
+            if any(
+                make_key(item.get("summary"), item.get("due_date")) in failed_keys
+                for item in row_items
+            )
+        ]
+        snapshot.revert(rows)
+        return rows
+
+    @staticmethod
+    def limit_calendar_data_by_datetime(
+        transformed_list: List[Dict], min_week: int
+    ) -> List[Dict]:
+        """특정 기간 내의 이벤트만 필터링합니다.
+
+        Args:
+            transformed_list: 변환된 이벤트 목록
+            min_week: 현재 시점에서 과거로 몇 주 전까지의 데이터를 가져올지 지정
+
+        Returns:
+            필터링된 이벤트 목록
+        """
+        return list(
+            EventSynchronizer.iter_limited_by_datetime(transformed_list, min_week)
+        )
+
+    @staticmethod
+    def iter_limited_by_datetime(
+        transformed_items: Iterable[Dict], min_week: int
+    ) -> Iterator[Dict]:
+        """limit_calendar_data_by_datetime과 같지만 항목을 하나씩 걸러 내보내므로
+        변환/인덱싱 단계 사이에 목록을 만들지 않습니다.
+
+        Args:
+            transformed_items: 변환된 이벤트
+            min_week: 현재 시점에서 과거로 몇 주 전까지의 데이터를 가져올지 지정
+
+        Yields:
+            기간 안의 이벤트
+        """
+        now = datetime.now()
+        time_min = (now - timedelta(weeks=min_week)).isoformat()
+        time_min = datetime.fromisoformat(time_min).date()
+
+        for item in transformed_items:
+            try:
+                due_date = datetime.strptime(
+                    item.get("due_date"), "%Y-%m-%d"  # type: ignore
+                ).date()
+
+                if due_date >= time_min:
+                    yield item
+            except ValueError as e:
+                print(f"날짜형식 오류 in {item}: {e}")
+                continue
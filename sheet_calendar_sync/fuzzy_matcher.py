@@ -0,0 +1,137 @@
+import re
+from datetime import date
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional
+from sheet_calendar_sync.utils import normalize_date_str
+
+DEFAULT_THRESHOLD = 0.7
+DEFAULT_DATE_WINDOW = 3
+NGRAM_SIZE = 2
+# 괄호, 문장 부호, 공백 등 글자/숫자가 아닌 문자
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+class FuzzyMatch(NamedTuple):
+    """이름이 비슷한 시트 항목과 캘린더 이벤트"""
+
+    sheet_item: Dict
+    calendar_item: Dict
+    score: float
+
+
+def normalize_summary(summary: Optional[str]) -> str:
+    """비교용 이름. 공백, 괄호, 문장 부호를 모두 빼고 소문자로 바꿉니다."""
+    return _NON_WORD.sub("", summary or "").casefold()
+
+
+def char_ngrams(text: str, n: int = NGRAM_SIZE) -> FrozenSet[str]:
+    """글자 n-gram 집합을 만듭니다. 한글은 음절 단위로 자르고, 앞뒤에 경계 문자를
+    붙여 짧은 이름도 n-gram이 여러 개 나오게 합니다.
+
+    Args:
+        text: normalize_summary로 정규화된 이름
+        n: n-gram 길이
+
+    Returns:
+        n-gram 집합 (예: "맛집" -> {"\\x02맛", "맛집", "집\\x03"})
+    """
+    padded = f"\x02{text}\x03"
+    return frozenset(padded[i : i + n] for i in range(len(padded) - n + 1))
+
+
+class FuzzyMatcher:
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        date_window: int = DEFAULT_DATE_WINDOW,
+        n: int = NGRAM_SIZE,
+    ):
+        """시트 항목과 이름이 조금 다른 캘린더 이벤트를 찾는 매칭기를 초기화합니다.
+
+        캘린더 이벤트 이름의 글자 n-gram 역색인을 날짜별로 만들고, 시트 항목마다
+        날짜 범위 안에서 n-gram을 하나 이상 공유하는 이벤트만 후보로 골라 점수를
+        계산하므로 모든 쌍을 비교하지 않습니다.
+
+        Args:
+            threshold: 매칭으로 볼 최소 점수 (n-gram 집합의 Dice 계수, 0~1)
+            date_window: 시트 날짜와 이벤트 시작일이 이 일수 이내일 때만 비교
+            n: n-gram 길이 (한글 이름은 2가 적당)
+        """
+        self.threshold = threshold
+        self.date_window = date_window
+        self.n = n
+
+    def match(
+        self, sheet_items: Iterable[Dict], calendar_items: Iterable[Dict]
+    ) -> List[FuzzyMatch]:
+        """시트 항목과 캘린더 이벤트를 1:1로 매칭합니다. 점수가 높은 쌍부터, 같으면
+        날짜 차이가 작은 쌍부터 정합니다.
+
+        Args:
+            sheet_items: transform_sheet_data로 변환된 시트 항목
+            calendar_items: transform_calendar_data로 변환된 캘린더 이벤트
+
+        Returns:
+            매칭된 (시트 항목, 캘린더 이벤트, 점수) 목록
+        """
+        calendar_list = []
+        # 시작일 -> n-gram -> 캘린더 이벤트 위치
+        index: Dict[int, Dict[str, List[int]]] = {}
+        sizes: List[int] = []
+        for item in calendar_items:
+            day = _ordinal(item.get("start_date"))
+            if day is None:
+                continue
+            grams = char_ngrams(normalize_summary(item.get("summary")), self.n)
+            position = len(calendar_list)
+            calendar_list.append(item)
+            sizes.append(len(grams))
+            postings = index.setdefault(day, {})
+            for gram in grams:
+                postings.setdefault(gram, []).append(position)
+
+        candidates = []
+        sheet_list = []
+        for sheet_item in sheet_items:
+            day = _ordinal(sheet_item.get("due_date"))
+            if day is None:
+                continue
+            grams = char_ngrams(normalize_summary(sheet_item.get("summary")), self.n)
+            sheet_position = len(sheet_list)
+            sheet_list.append(sheet_item)
+            for distance in range(-self.date_window, self.date_window + 1):
+                postings = index.get(day + distance)
+                if not postings:
+                    continue
+                shared: Dict[int, int] = {}
+                for gram in grams:
+                    for position in postings.get(gram, ()):
+                        shared[position] = shared.get(position, 0) + 1
+                for position, count in shared.items():
+                    score = 2 * count / (len(grams) + sizes[position])
+                    if score >= self.threshold:
+                        candidates.append(
+                            (-score, abs(distance), sheet_position, position)
+                        )
+
+        candidates.sort()
+        matched_sheet = set()
+        matched_calendar = set()
+        matches = []
+        for negative_score, _, sheet_position, position in candidates:
+            if sheet_position in matched_sheet or position in matched_calendar:
+                continue
+            matched_sheet.add(sheet_position)
+            matched_calendar.add(position)
+            matches.append(
+                FuzzyMatch(
+                    sheet_list[sheet_position], calendar_list[position], -negative_score
+                )
+            )
+        return matches
+
+
+def _ordinal(date_str: Optional[str]) -> Optional[int]:
+    try:
+        return date.fromisoformat(normalize_date_str(date_str or "")).toordinal()
+    except ValueError:
+        return None
@@ -0,0 +1,281 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+from urllib.parse import urlsplit
+from googleapiclient.http import HttpRequest
+
+# 요청을 보내는 스레드에서 실행 중인 API 메서드 정보 (InstrumentedRequest가 설정)
+_context = threading.local()
+
+
+class CallRecord(NamedTuple):
+    """HTTP 요청 하나의 측정 결과"""
+
+    started_at: float
+    api: str
+    method: str
+    http_method: str
+    status: int
+    latency: float
+    request_bytes: int
+    response_bytes: int
+    retries: int
+    page: int
+
+
+class InstrumentedRequest(HttpRequest):
+    """실행 중인 API 메서드 이름(methodId), 재시도 횟수, 페이지 번호를 전송 계층에
+    알려주는 HttpRequest. build()의 requestBuilder로 사용합니다."""
+
+    def execute(self, http=None, num_retries=0):
+        # 할당량 관리자는 재시도할 때 같은 요청 객체를 다시 실행함
+        self.attempts = getattr(self, "attempts", 0) + 1
+        previous = getattr(_context, "call", None)
+        _context.call = (
+            self.uri,
+            self.methodId,
+            self.attempts - 1,
+            "pageToken=" in self.uri,
+        )
+        try:
+            return super().execute(http=http, num_retries=num_retries)
+        finally:
+            _context.call = previous
+
+
+class InstrumentedHttp:
+    def __init__(self, http: Any, instrumentation: "Instrumentation"):
+        """http 객체를 감싸 요청마다 API 메서드, 상태 코드, 지연 시간, 주고받은
+        바이트 수를 instrumentation에 기록합니다. 그 밖의 속성은 감싼 http 객체에
+        그대로 전달합니다.
+
+        Args:
+            http: httplib2.Http 등 감쌀 http 객체
+            instrumentation: 측정 결과를 기록할 객체
+        """
+        object.__setattr__(self, "http", http)
+        object.__setattr__(self, "instrumentation", instrumentation)
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        call = getattr(_context, "call", None)
+        if call is None or call[0] != uri:
+            # 배치 요청, 또는 요청 도중 인증 정보 갱신 등으로 다른 주소에 보내는 요청
+            method_id, retries, paged = None, 0, False
+        else:
+            _, method_id, retries, paged = call
+        started_at = time.time()
+        started = time.perf_counter()
+        status = 0
+        content = b""
+        try:
+            response, content = self.http.request(
+                uri, method, body=body, headers=headers, **kwargs
+            )
+            status = response.status
+            return response, content
+        finally:
+            api, name = _describe(uri, method_id)
+            self.instrumentation.record(
+                CallRecord(
+                    started_at=started_at,
+                    api=api,
+                    method=name,
+                    http_method=method,
+                    status=status,
+                    latency=time.perf_counter() - started,
+                    request_bytes=len(body or b""),
+                    response_bytes=len(content or b""),
+                    retries=retries,
+                    page=self.instrumentation.next_page(name, paged, retries),
+                )
+            )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.http, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.http, name, value)
+
+
+class Instrumentation:
+    def __init__(self):
+        """구글 API 요청별 측정 결과와 동기화 단계별 소요 시간을 모읍니다."""
+        self.calls: List[CallRecord] = []
+        self.stage_seconds: Dict[str, float] = {}
+        self.lock = threading.Lock()
+        self._local = threading.local()
+
+    def record(self, call: CallRecord) -> None:
+        with self.lock:
+            self.calls.append(call)
+
+    def next_page(self, method: str, paged: bool, retries: int = 0) -> int:
+        """목록 요청의 페이지 번호를 구합니다. pageToken이 없으면 1부터 다시 세고,
+        재시도 요청은 같은 페이지로 봅니다."""
+        pages = self._thread_state("pages", dict)
+        if retries and method in pages:
+            return pages[method]
+        pages[method] = pages.get(method, 0) + 1 if paged else 1
+        return pages[method]
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """블록 실행 시간을 name 단계에 누적합니다. 단계 안에서 다른 단계가 실행되면
+        그 시간은 안쪽 단계에만 더하므로 단계별 시간이 겹치지 않습니다."""
+        stack = self._thread_state("stack", list)
+        self._charge(stack)
+        stack.append(name)
+        try:
+            yield
+        finally:
+            self._charge(stack)
+            stack.pop()
+
+    def timed_iter(self, name: str, iterable: Iterable) -> Iterator:
+        """제너레이터 파이프라인의 한 단계를 감싸 다음 항목을 만드는 데 걸린
+        시간만 name 단계에 누적합니다."""
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def summary(self) -> str:
+        """API 메서드별 요청 수/오류/재시도/지연 시간/응답 크기와 단계별 소요 시간을
+        표 형식 문자열로 반환합니다."""
+        grouped = self._by_method()
+        width = max([len(method) for _, method in grouped] + [len("stage")])
+        lines = [
+            f"{'method':<{width}} {'calls':>5} {'err':>4} {'retry':>5}"
+            f" {'p50ms':>7} {'p95ms':>7} {'recvKiB':>8}"
+        ]
+        for (api, method), calls in sorted(grouped.items()):
+            latencies = sorted(call.latency for call in calls)
+            lines.append(
+                f"{method:<{width}} {len(calls):>5}"
+                f" {sum(1 for call in calls if not 200 <= call.status < 300):>4}"
+                f" {sum(1 for call in calls if call.retries):>5}"
+                f" {_percentile(latencies, 0.5) * 1000:>7.1f}"
+                f" {_percentile(latencies, 0.95) * 1000:>7.1f}"
+                f" {sum(call.response_bytes for call in calls) / 1024:>8.1f}"
+            )
+        with self.lock:
+            stages = dict(self.stage_seconds)
+        if stages:
+            lines.append("")
+            lines.extend(
+                f"{name:<{width}} {seconds * 1000:>9.1f}ms"
+                for name, seconds in stages.items()
+            )
+        return "\n".join(lines)
+
+    def write_jsonl(self, path: str) -> None:
+        """요청별 측정 결과와 단계별 소요 시간을 JSON lines 파일로 저장합니다."""
+        with self.lock:
+            calls = list(self.calls)
+            stages = dict(self.stage_seconds)
+        with open(path, "w", encoding="utf-8") as f:
+            for call in calls:
+                f.write(json.dumps({"type": "call", **call._asdict()}) + "\n")
+            for name, seconds in stages.items():
+                f.write(
+                    json.dumps({"type": "stage", "stage": name, "seconds": seconds})
+                    + "\n"
+                )
+
+    def prometheus_text(self) -> str:
+        """측정 결과를 Prometheus text 형식 스냅샷으로 반환합니다."""
+        metrics = [
+            ("google_api_requests_total", "counter", "API 요청 수"),
+            ("google_api_request_seconds", "summary", "API 요청 지연 시간"),
+            ("google_api_request_bytes_total", "counter", "보낸 요청 바이트 수"),
+            ("google_api_response_bytes_total", "counter", "받은 응답 바이트 수"),
+            ("google_api_retries_total", "counter", "재시도한 요청 수"),
+        ]
+        lines = []
+        grouped = self._by_method()
+        for name, kind, help_text in metrics:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for (api, method), calls in sorted(grouped.items()):
+                labels = f'api="{api}",method="{method}"'
+                if name == "google_api_requests_total":
+                    statuses: Dict[int, int] = {}
+                    for call in calls:
+                        statuses[call.status] = statuses.get(call.status, 0) + 1
+                    for status, count in sorted(statuses.items()):
+                        lines.append(f'{name}{{{labels},status="{status}"}} {count}')
+                elif name == "google_api_request_seconds":
+                    total = sum(call.latency for call in calls)
+                    lines.append(f"{name}_sum{{{labels}}} {total:.6f}")
+                    lines.append(f"{name}_count{{{labels}}} {len(calls)}")
+                elif name == "google_api_request_bytes_total":
+                    total = sum(call.request_bytes for call in calls)
+                    lines.append(f"{name}{{{labels}}} {total}")
+                elif name == "google_api_response_bytes_total":
+                    total = sum(call.response_bytes for call in calls)
+                    lines.append(f"{name}{{{labels}}} {total}")
+                else:
+                    total = sum(1 for call in calls if call.retries)
+                    lines.append(f"{name}{{{labels}}} {total}")
+
+        lines.append("# HELP sync_stage_seconds 동기화 단계별 소요 시간")
+        lines.append("# TYPE sync_stage_seconds gauge")
+        with self.lock:
+            stages = dict(self.stage_seconds)
+        for stage, seconds in stages.items():
+            lines.append(f'sync_stage_seconds{{stage="{stage}"}} {seconds:.6f}')
+        return "\n".join(lines) + "\n"
+
+    def _by_method(self) -> Dict[tuple, List[CallRecord]]:
+        with self.lock:
+            calls = list(self.calls)
+        grouped: Dict[tuple, List[CallRecord]] = {}
+        for call in calls:
+            grouped.setdefault((call.api, call.method), []).append(call)
+        return grouped
+
+    def _charge(self, stack: List[str]) -> None:
+        """마지막 기록 이후 시간을 현재 실행 중인 (가장 안쪽) 단계에 더합니다."""
+        now = time.perf_counter()
+        if stack:
+            with self.lock:
+                self.stage_seconds[stack[-1]] = (
+                    self.stage_seconds.get(stack[-1], 0.0) + now - self._local.mark
+                )
+        self._local.mark = now
+
+    def _thread_state(self, name: str, factory):
+        value = getattr(self._local, name, None)
+        if value is None:
+            value = factory()
+            setattr(self._local, name, value)
+        return value
+
+
+def _describe(uri: str, method_id: Optional[str]) -> tuple:
+    """요청의 (API 이름, API 메서드 이름)을 구합니다. 배치/토큰 요청처럼 methodId가
+    없으면 URL로 추정합니다."""
+    if method_id:
+        return method_id.split(".", 1)[0], method_id
+    parts = urlsplit(uri)
+    path = parts.path.strip("/")
+    if path.startswith("batch"):
+        segments = path.split("/")
+        api = segments[1] if len(segments) > 1 else parts.hostname.split(".", 1)[0]
+        return api, f"{api}.batch"
+    if path.endswith("token"):
+        return "oauth2", "oauth2.token"
+    api = (parts.hostname or "unknown").split(".", 1)[0]
+    return api, f"{api}.{path.split('/', 1)[0] or 'request'}"
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * fraction))]
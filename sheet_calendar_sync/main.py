@@ -0,0 +1,110 @@
+import os
+import signal
+from typing import List
+from dotenv import load_dotenv
+from rich import print
+from sheet_calendar_sync.service import GoogleService
+from sheet_calendar_sync.quota_governor import QuotaGovernor
+from sheet_calendar_sync.daemon import SyncDaemon
+from sheet_calendar_sync.pair_sync import (
+    prepare_service,
+    results_table,
+    sync_pair,
+    sync_pairs,
+)
+from sheet_calendar_sync.sync_config import SyncPair, load_pairs_from_env
+
+
+def main():
+    load_dotenv()
+    pairs, max_workers = load_pairs_from_env()
+    run(pairs, max_workers, multi_pair=bool(os.getenv("SYNC_PAIRS_CONFIG")))
+
+
+def create_google_service() -> GoogleService:
+    """환경 변수 설정으로 구글 서비스 인스턴스를 만듭니다."""
+    # CLIENT_SECRET_FILE이 없으면 CLIENT_SECRET_JSON 환경변수 사용
+    # 인증 정보와 연결은 시트/캘린더가 함께 사용하고 access token은 파일에 캐시
+    # QUOTA_RATES(예: "calendar=10,sheets=1")로 API별 초당 요청 수를 바꿀 수 있고,
+    # GOOGLE_API_ROOT가 있으면 구글 대신 해당 서버로 요청 (벤치마크용 가짜 서버)
+    rates = {}
+    for item in os.getenv("QUOTA_RATES", "").split(","):
+        if "=" in item:
+            api, rate = item.split("=", 1)
+            rates[api.strip()] = float(rate)
+    return GoogleService(
+        os.getenv("CLIENT_SECRET_FILE"),
+        token_cache_path=os.getenv("TOKEN_CACHE_PATH"),
+        governor=QuotaGovernor(rates),
+        api_root=os.getenv("GOOGLE_API_ROOT") or None,
+    )
+
+
+def run(
+    pairs: List[SyncPair],
+    max_workers: int,
+    multi_pair: bool = False,
+    dry_run: bool = False,
+) -> None:
+    """pair를 동기화하고 측정 결과를 출력합니다.
+
+    Args:
+        pairs: 동기화할 pair 목록
+        max_workers: 동시에 동기화할 최대 pair 수
+        multi_pair: True이면 pair별로 오류를 모아 결과 표로 출력
+        dry_run: True이면 계획만 출력 (데몬 모드도 사용하지 않음)
+    """
+    if not pairs:
+        raise ValueError("동기화할 pair가 없습니다.")
+    google_service = create_google_service()
+    prepare_service(google_service, pairs[0])
+    print(google_service.report_startup_timings())
+
+    # DAEMON_WEBHOOK_URL이 있으면 주기적으로 실행하는 대신 계속 실행되면서 캘린더/
+    # 시트 변경 알림을 받을 때만 동기화 (DAEMON_LISTEN 주소로 알림을 받음)
+    webhook_url = None if dry_run else os.getenv("DAEMON_WEBHOOK_URL")
+    if webhook_url:
+        host, _, port = os.getenv("DAEMON_LISTEN", "0.0.0.0:8080").rpartition(":")
+        daemon = SyncDaemon(
+            google_service,
+            pairs,
+            webhook_url,
+            listen=(host, int(port)),
+            debounce=float(os.getenv("DAEMON_DEBOUNCE", "10")),
+            max_workers=max_workers,
+            resync_interval=float(os.getenv("DAEMON_RESYNC_INTERVAL", "3600")),
+        )
+        signal.signal(signal.SIGTERM, lambda *_: daemon.stop())
+        try:
+            daemon.run()
+        except KeyboardInterrupt:
+            pass
+    elif multi_pair or len(pairs) > 1:
+        # 할당량은 모든 pair가 함께 사용하므로 QUOTA_RATES는 전체 요청 속도 제한
+        results = sync_pairs(google_service, pairs, max_workers, dry_run)
+        print(results_table(results))
+    else:
+        sync_pair(google_service, pairs[0], dry_run)
+
+    report_metrics(google_service)
+
+
+def report_metrics(google_service: GoogleService) -> None:
+    """API별 할당량 카운터와 요청별 측정 요약을 출력하고, METRICS_JSONL_PATH /
+    METRICS_PROM_PATH가 있으면 측정 결과를 파일로 저장합니다."""
+    # API별 요청/재시도/할당량 초과 횟수
+    print(google_service.governor.counters())
+    instrumentation = google_service.instrumentation
+    print(instrumentation.summary())
+
+    jsonl_path = os.getenv("METRICS_JSONL_PATH")
+    if jsonl_path:
+        instrumentation.write_jsonl(jsonl_path)
+    prom_path = os.getenv("METRICS_PROM_PATH")
+    if prom_path:
+        with open(prom_path, "w", encoding="utf-8") as f:
+            f.write(instrumentation.prometheus_text())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import chain
+from typing import Dict, List, NamedTuple, Optional
+from rich import print
+from rich.table import Table
+from sheet_calendar_sync.service import GoogleService
+from sheet_calendar_sync.sheet_manager import GoogleSheetManager
+from sheet_calendar_sync.calendar_manager import GoogleCalendarManager
+from sheet_calendar_sync.event_handler import EventSynchronizer
+from sheet_calendar_sync.fuzzy_matcher import FuzzyMatcher
+from sheet_calendar_sync.calendar_mirror import CalendarMirror
+from sheet_calendar_sync.sheet_snapshot import SheetSnapshot
+from sheet_calendar_sync.sync_journal import SyncJournal
+from sheet_calendar_sync.sync_config import SyncPair, default_sheet_tabs
+from sheet_calendar_sync.utils import get_range_start_row
+
+
+class PairResult(NamedTuple):
+    """pair 하나의 동기화 결과"""
+
+    name: str
+    counts: Dict[str, int]
+    failed: int
+    seconds: float
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.failed
+
+
+def prepare_service(google_service: GoogleService, pair: SyncPair) -> None:
+    """시트/캘린더 서비스 인스턴스와 access token을 미리 만들어 둡니다. 이후
+    pair를 동기화하는 스레드에서는 만들어 둔 것을 재사용만 합니다."""
+    GoogleSheetManager(google_service, pair.sheet_id)
+    GoogleCalendarManager(google_service, pair.calendar_id)
+    google_service.ensure_token()
+
+
+def sync_pair(
+    google_service: GoogleService, pair: SyncPair, dry_run: bool = False
+) -> PairResult:
+    """시트 한 개의 데이터를 캘린더 한 개에 동기화합니다.
+
+    Args:
+        google_service: 구글 서비스 인스턴스 (여러 pair가 함께 사용 가능)
+        pair: 동기화할 (시트, 캘린더) 설정
+        dry_run: True이면 계획만 출력하고 캘린더, 스냅샷, 작업 기록은 바꾸지 않음
+            (캘린더 사본은 갱신됨)
+
+    Returns:
+        계획 항목 수와 실패한 요청 수를 담은 동기화 결과
+    """
+    started = time.perf_counter()
+    instrumentation = google_service.instrumentation
+    sheet_range = pair.sheet_range
+    sheet_tabs = list(pair.sheet_tabs) or default_sheet_tabs(datetime.now())
+
+    sheet_manager = GoogleSheetManager(google_service, pair.sheet_id)
+    # write_concurrency가 있으면 이벤트 추가/수정/삭제 배치를 동시에 실행하고,
+    # list_concurrency가 있으면 이벤트 목록을 월 단위로 나눠 동시에 조회
+    calendar_manager = GoogleCalendarManager(
+        google_service,
+        pair.calendar_id,
+        concurrency=pair.write_concurrency,
+        list_concurrency=pair.list_concurrency,
+    )
+    matcher = FuzzyMatcher(pair.fuzzy_threshold) if pair.fuzzy_threshold else None
+    synchronizer = EventSynchronizer(sheet_manager, calendar_manager, matcher)
+    counts: Dict[str, int] = {}
+    failed = 0
+
+    def add_results(plan_counts: Dict[str, int], results: List) -> int:
+        for key, count in plan_counts.items():
+            counts[key] = counts.get(key, 0) + count
+        return sum(1 for result in results if not result.ok)
+
+    # journal_path가 있으면 변경 작업을 기록하고, 이전 실행이 중간에
+    # 종료되었다면 다시 조회하지 않고 끝나지 않은 작업만 이어서 실행
+    journal = (
+        SyncJournal(pair.journal_path) if pair.journal_path and not dry_run else None
+    )
+    if journal is not None and journal.pending(pair.calendar_id):
+        with instrumentation.stage("apply"):
+            results = calendar_manager.resume_journal(journal)
+        journal.compact()
+        failed = add_results({"resume": len(results)}, results)
+        return PairResult(pair.name, counts, failed, time.perf_counter() - started)
+
+    # 캘린더 데이터 json형태로 변환
+    # mirror_path가 있으면 로컬 사본과 sync token으로 변경분만 조회
+    if pair.mirror_path:
+        mirror = CalendarMirror(pair.calendar_id, pair.mirror_path)
+        with instrumentation.stage("fetch_calendar"):
+            calendar_events = calendar_manager.get_calendar_data_incremental(
+                mirror, min_week=pair.min_week
+            )
+    else:
+        # 페이지 단위로 가져와 바로 변환 (전체 원본 목록을 보관하지 않음)
+        calendar_events = instrumentation.timed_iter(
+            "fetch_calendar",
+            chain.from_iterable(
+                calendar_manager.iter_calendar_data(min_week=pair.min_week)
+            ),
+        )
+    calendar_data = instrumentation.timed_iter(
+        "transform_calendar",
+        calendar_manager.iter_transform_calendar_data(calendar_events),
+    )
+
+    # 구글 시트 데이터를 탭별로 한 번에 가져와 변환 후 캘린더와 비교
+    # sheet_chunk_rows가 있으면 행 블록을 동시에 가져오며 받은 순서대로 비교
+    # (이때 fetch_sheet에는 메타데이터 조회만, 블록 조회는 다음 단계에 포함됨)
+    tab_ranges = [(tab, sheet_range) for tab in sheet_tabs]
+    with instrumentation.stage("fetch_sheet"):
+        if pair.sheet_chunk_rows:
+            sheet_results = sheet_manager.get_sheet_data_chunked(
+                tab_ranges, pair.sheet_chunk_rows
+            )
+        else:
+            sheet_results = sheet_manager.get_sheet_data_many(tab_ranges)
+
+    if pair.snapshot_path:
+        # snapshot_path가 있으면 지난 실행 이후 바뀐 행만 변환/비교
+        # (delete_removed가 켜져 있으면 시트에서 삭제된 행의 이벤트도 삭제)
+        calendar_data = list(calendar_data)
+        for tab, sheet_events in sheet_results:
+            full_range = f"{tab}!{sheet_range}"
+            snapshot = SheetSnapshot(pair.snapshot_path, full_range)
+            with instrumentation.stage("diff"):
+                plan, delta = synchronizer.build_delta_plan(
+                    snapshot,
+                    sheet_events,
+                    get_range_start_row(full_range),
+                    calendar_data,
+                    min_week=pair.min_week - 1,
+                    source_tab=tab,
+                )
+            if not pair.delete_removed:
+                plan.deletes.clear()
+            print(pair.name, tab, delta.counts(), plan.counts())
+            if dry_run:
+                print(plan.describe())
+                add_results(plan.counts(), [])
+                continue
+            with instrumentation.stage("apply"):
+                results = calendar_manager.apply_plan(
+                    plan, delete=pair.delete_removed, journal=journal
+                )
+            failed += add_results(plan.counts(), results)
+
+            # 실패한 행은 스냅샷을 되돌려 다음 실행에서 다시 비교하고 나머지는 저장
+            synchronizer.revert_failed_rows(
+                snapshot, plan, results, delete=pair.delete_removed
+            )
+            snapshot.save()
+    else:
+        # 변환 -> 기간 필터 -> 인덱싱을 행 단위로 이어서 처리
+        sheet_data = instrumentation.timed_iter(
+            "transform_sheet",
+            (
+                row
+                for tab, sheet_events in sheet_results
+                for row in sheet_manager.iter_transform_sheet_data(sheet_events, tab)
+            ),
+        )
+        filtered_sheet_data = instrumentation.timed_iter(
+            "filter",
+            synchronizer.iter_limited_by_datetime(sheet_data, pair.min_week - 1),
+        )
+        with instrumentation.stage("diff"):
+            plan = synchronizer.build_plan(filtered_sheet_data, calendar_data)
+        print(pair.name, plan.counts())
+
+        if dry_run:
+            print(plan.describe())
+            add_results(plan.counts(), [])
+        else:
+            # 새 이벤트 추가 및 내용이 바뀐 기존 이벤트만 patch
+            with instrumentation.stage("apply"):
+                results = calendar_manager.apply_plan(plan, journal=journal)
+            failed += add_results(plan.counts(), results)
+
+    if journal is not None:
+        journal.compact()
+    return PairResult(pair.name, counts, failed, time.perf_counter() - started)
+
+
+def sync_pairs(
+    google_service: GoogleService,
+    pairs: List[SyncPair],
+    max_workers: int,
+    dry_run: bool = False,
+) -> List[PairResult]:
+    """여러 pair를 최대 max_workers개씩 동시에 동기화합니다.
+
+    인증 정보, discovery로 만든 서비스 인스턴스, 할당량 관리자는 모든 pair가
+    함께 사용하고 연결은 스레드마다 하나씩 만듭니다. 한 pair가 실패해도 나머지
+    pair는 계속 동기화합니다.
+
+    Args:
+        google_service: 구글 서비스 인스턴스
+        pairs: 동기화할 pair 목록
+        max_workers: 동시에 동기화할 최대 pair 수
+        dry_run: True이면 계획만 출력 (sync_pair 참고)
+
+    Returns:
+        pairs와 같은 순서의 pair별 동기화 결과
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers는 1 이상이어야 합니다.")
+    if not pairs:
+        return []
+
+    prepare_service(google_service, pairs[0])
+
+    def run(pair: SyncPair) -> PairResult:
+        started = time.perf_counter()
+        try:
+            return sync_pair(google_service, pair, dry_run)
+        except Exception as e:
+            print(f"[{pair.name}] 동기화 실패: {e!r}")
+            return PairResult(pair.name, {}, 0, time.perf_counter() - started, repr(e))
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(pairs)), thread_name_prefix="pair"
+    ) as pool:
+        return list(pool.map(run, pairs))
+
+
+def results_table(results: List[PairResult]) -> Table:
+    """pair별 동기화 결과 표를 만듭니다."""
+    keys: List[str] = []
+    for result in results:
+        keys.extend(key for key in result.counts if key not in keys)
+
+    table = Table(title="pair별 동기화 결과")
+    table.add_column("pair")
+    table.add_column("status")
+    for key in keys:
+        table.add_column(key, justify="right")
+    table.add_column("failed", justify="right")
+    table.add_column("seconds", justify="right")
+    for result in results:
+        if result.error:
+            status = f"[red]error[/red] {result.error}"
+        elif result.failed:
+            status = "[yellow]partial[/yellow]"
+        else:
+            status = "[green]ok[/green]"
+        table.add_row(
+            result.name,
+            status,
+            *(str(result.counts.get(key, 0)) for key in keys),
+            str(result.failed),
+            f"{result.seconds:.2f}",
+        )
+    return table
@@ -0,0 +1,244 @@
+import json
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from googleapiclient.errors import HttpError
+
+# API별 기본 초당 요청 수 (Calendar: 사용자당 분당 600회, Sheets 읽기: 사용자당
+# 분당 60회 기본 할당량 기준)
+DEFAULT_RATES = {"calendar": 10.0, "sheets": 1.0}
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """초당 rate개의 토큰이 채워지는 토큰 버킷을 초기화합니다.
+
+        Args:
+            rate: 초당 채워지는 토큰 수
+            capacity: 최대 토큰 수 (기본값: max(1, rate))
+            clock: 현재 시각 함수
+            sleep: 대기 함수
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.updated_at = clock()
+        self.lock = threading.Lock()
+
+    def acquire(self, count: float = 1.0) -> float:
+        """토큰 count개를 얻을 때까지 기다립니다. count가 capacity보다 크면
+        capacity 단위로 나누어 차례로 얻습니다.
+
+        Args:
+            count: 필요한 토큰 수
+
+        Returns:
+            대기한 시간 (초)
+        """
+        waited = 0.0
+        while count > self.capacity:
+            waited += self.acquire(self.capacity)
+            count -= self.capacity
+        while True:
+            with self.lock:
+                now = self.clock()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated_at) * self.rate
+                )
+                self.updated_at = now
+                if self.tokens >= count:
+                    self.tokens -= count
+                    return waited
+                wait = (count - self.tokens) / self.rate
+            self.sleep(wait)
+            waited += wait
+
+
+class QuotaGovernor:
+    def __init__(
+        self,
+        rates: Optional[Dict[str, float]] = None,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 64.0,
+        min_rate: float = 0.2,
+        increase_step: float = 0.05,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """API별 토큰 버킷으로 요청 속도를 조절하고, 할당량 초과 오류를 재시도하는
+        할당량 관리자를 초기화합니다.
+
+        할당량 초과(403 rateLimitExceeded, 429)가 발생하면 해당 API의 속도를 절반으로
+        줄이고, 요청이 성공할 때마다 설정된 최대 속도까지 조금씩 다시 올립니다.
+
+        Args:
+            rates: API별 최대 초당 요청 수 (기본값: DEFAULT_RATES)
+            max_retries: 요청당 최대 재시도 횟수
+            base_delay: 지수 백오프 기본 대기 시간 (초)
+            max_delay: 최대 대기 시간 (초)
+            min_rate: 속도를 줄일 때의 최저 초당 요청 수
+            increase_step: 성공할 때마다 늘리는 초당 요청 수
+            sleep: 대기 함수
+        """
+        self.max_rates = dict(DEFAULT_RATES, **(rates or {}))
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.min_rate = min_rate
+        self.increase_step = increase_step
+        self.sleep = sleep
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self.lock = threading.Lock()
+
+    def bucket(self, api: str) -> TokenBucket:
+        with self.lock:
+            if api not in self.buckets:
+                rate = self.max_rates.setdefault(api, max(self.max_rates.values()))
+                self.buckets[api] = TokenBucket(rate, sleep=self.sleep)
+                self.stats[api] = {
+                    "requests": 0,
+                    "successes": 0,
+                    "throttled": 0,
+                    "retries": 0,
+                    "failures": 0,
+                    "waited_seconds": 0.0,
+                }
+            return self.buckets[api]
+
+    def acquire(self, api: str, count: int = 1) -> None:
+        """요청 count개를 보낼 수 있을 때까지 기다립니다."""
+        waited = self.bucket(api).acquire(count)
+        self._add(api, "requests", count)
+        self._add(api, "waited_seconds", waited)
+
+    def execute(self, request, api: str, http: Any = None) -> Any:
+        """속도 제한과 재시도를 적용해 요청을 실행합니다.
+
+        Args:
+            request: googleapiclient HttpRequest
+            api: API 이름 (예: "calendar", "sheets")
+            http: 요청에 사용할 http 객체 (선택 사항)
+
+        Returns:
+            요청 응답
+
+        Raises:
+            HttpError: 재시도할 수 없는 오류이거나 재시도 횟수를 초과한 경우
+        """
+        attempt = 0
+        while True:
+            self.acquire(api)
+            try:
+                response = request.execute(http=http)
+            except HttpError as error:
+                if not self.is_retryable(error) or attempt >= self.max_retries:
+                    self.record_failure(api)
+                    raise
+                self.record_retry(api, error)
+                self.sleep(self.retry_delay(attempt, error))
+                attempt += 1
+                continue
+            self.record_success(api)
+            return response
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        """재시도로 해결될 수 있는 오류(할당량 초과, 일시적 서버 오류)인지
+        확인합니다."""
+        status = _http_status(error)
+        if status is None:
+            return False
+        if status in RETRYABLE_STATUSES:
+            return True
+        return status == 403 and bool(_error_reasons(error) & RATE_LIMIT_REASONS)
+
+    @staticmethod
+    def is_throttled(error: Exception) -> bool:
+        """할당량 초과 오류인지 확인합니다."""
+        status = _http_status(error)
+        if status is None:
+            return False
+        return status == 429 or (
+            status == 403 and bool(_error_reasons(error) & RATE_LIMIT_REASONS)
+        )
+
+    def retry_delay(self, attempt: int, error: Optional[Exception] = None) -> float:
+        """재시도 전 대기 시간을 계산합니다. Retry-After 헤더가 있으면 따르고,
+        없으면 지터를 적용한 지수 백오프를 사용합니다."""
+        if _http_status(error) is not None:
+            retry_after = error.resp.get("retry-after")
+            if retry_after and retry_after.isdigit():
+                return min(float(retry_after), self.max_delay)
+        delay = min(self.base_delay * (2**attempt), self.max_delay)
+        return random.uniform(0, delay)
+
+    def record_success(self, api: str) -> None:
+        """요청 성공을 기록하고 속도를 조금 올립니다."""
+        self._add(api, "successes", 1)
+        bucket = self.bucket(api)
+        with self.lock:
+            bucket.rate = min(self.max_rates[api], bucket.rate + self.increase_step)
+
+    def record_retry(self, api: str, error: Exception) -> None:
+        """재시도를 기록하고, 할당량 초과였다면 속도를 절반으로 줄입니다."""
+        self.record_retries(api, [error])
+
+    def record_retries(self, api: str, errors: List[Exception]) -> None:
+        """한 번에 재시도하는 요청들을 기록합니다. 배치 안의 여러 요청이 함께
+        할당량 초과로 실패해도 속도는 한 번만 절반으로 줄입니다."""
+        throttled = sum(1 for error in errors if self.is_throttled(error))
+        self._add(api, "retries", len(errors))
+        self._add(api, "throttled", throttled)
+        if throttled:
+            bucket = self.bucket(api)
+            with self.lock:
+                bucket.rate = max(self.min_rate, bucket.rate / 2)
+
+    def record_failure(self, api: str) -> None:
+        self._add(api, "failures", 1)
+
+    def counters(self) -> Dict[str, Dict[str, float]]:
+        """API별 요청/성공/할당량 초과/재시도/실패 횟수와 대기 시간, 현재 속도를
+        반환합니다."""
+        with self.lock:
+            return {
+                api: dict(stats, current_rate=self.buckets[api].rate)
+                for api, stats in self.stats.items()
+            }
+
+    def _add(self, api: str, name: str, value: float) -> None:
+        self.bucket(api)
+        with self.lock:
+            self.stats[api][name] += value
+
+
+def _http_status(error: Optional[Exception]) -> Optional[int]:
+    """HttpError의 HTTP 상태 코드. 응답이 없는 오류(resp가 None인 BatchError 등)나
+    HttpError가 아니면 None을 반환합니다."""
+    if not isinstance(error, HttpError) or getattr(error, "resp", None) is None:
+        return None
+    return error.resp.status
+
+
+def _error_reasons(error: HttpError) -> set:
+    """HttpError 응답 본문에서 error.errors[].reason 값을 꺼냅니다."""
+    try:
+        content = json.loads(error.content)
+    except (TypeError, ValueError):
+        return set()
+    if not isinstance(content, dict):
+        return set()
+    errors = (content.get("error") or {}).get("errors") or []
+    return {item.get("reason") for item in errors if isinstance(item, dict)}
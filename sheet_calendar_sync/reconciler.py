@@ -0,0 +1,231 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from sheet_calendar_sync.utils import normalize_date_str, remove_non_words
+from sheet_calendar_sync.event_body import (
+    create_event_bodies,
+    create_patch_body,
+    get_content_hash,
+)
+from sheet_calendar_sync.fuzzy_matcher import FuzzyMatcher
+
+INSERT = "insert"
+UPDATE = "update"
+DELETE = "delete"
+NOOP = "noop"
+
+# (정규화된 summary, YYYY-MM-DD 날짜)
+EventKey = Tuple[str, str]
+
+
+class PlanItem(NamedTuple):
+    """동기화 계획의 개별 항목
+
+    body는 추가 항목이면 전체 요청 본문, 수정 항목이면 변경된 필드만 담은
+    patch 본문입니다.
+    """
+
+    action: str
+    key: EventKey
+    sheet_item: Optional[Dict]
+    calendar_item: Optional[Dict]
+    body: Optional[Dict] = None
+
+
+class SyncPlan(NamedTuple):
+    """시트와 캘린더를 비교한 동기화 계획"""
+
+    inserts: List[PlanItem]
+    updates: List[PlanItem]
+    deletes: List[PlanItem]
+    noops: List[PlanItem]
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            INSERT: len(self.inserts),
+            UPDATE: len(self.updates),
+            DELETE: len(self.deletes),
+            NOOP: len(self.noops),
+        }
+
+    def describe(self) -> str:
+        """검토용으로 추가/수정/삭제할 항목을 날짜, 이름 순으로 나열합니다."""
+        lines = []
+        for item in self.inserts + self.updates + self.deletes:
+            summary, date = item.key
+            source = item.sheet_item or item.calendar_item
+            name = (source.get("summary") if source else None) or summary
+            lines.append(f"{item.action:<6} {date} {name}")
+            if item.action == UPDATE and item.body:
+                lines.append(f"       fields: {', '.join(sorted(item.body))}")
+        lines.append(str(self.counts()))
+        return "\n".join(lines)
+
+
+def make_key(summary: Optional[str], date_str: Optional[str]) -> EventKey:
+    """summary와 날짜로 이벤트 매칭 키를 만듭니다.
+
+    Args:
+        summary: 이벤트 이름
+        date_str: 이벤트 날짜 문자열 (YYYY-MM-DD 또는 YYYY-M-D)
+
+    Returns:
+        (정규화된 summary, YYYY-MM-DD 날짜) 튜플
+    """
+    return remove_non_words(summary or "").casefold(), normalize_date_str(
+        date_str or ""
+    )
+
+
+class Reconciler:
+    @staticmethod
+    def index_sheet_data(sheet_data: Iterable[Dict]) -> Dict[EventKey, Dict]:
+        """시트 데이터를 매칭 키 기준으로 인덱싱합니다. 같은 키가 여러 번 나오면
+        처음 나온 행을 사용합니다."""
+        index: Dict[EventKey, Dict] = {}
+        for item in sheet_data:
+            if not item.get("summary"):
+                continue
+            index.setdefault(make_key(item.get("summary"), item.get("due_date")), item)
+        return index
+
+    @staticmethod
+    def index_calendar_data(calendar_data: Iterable[Dict]) -> Dict[EventKey, Dict]:
+        """캘린더 데이터를 매칭 키 기준으로 인덱싱합니다. 같은 키의 중복 이벤트는
+        처음 나온 이벤트만 사용합니다 (중복 제거는 deduper 담당)."""
+        index: Dict[EventKey, Dict] = {}
+        for item in calendar_data:
+            key = make_key(item.get("summary"), item.get("start_date"))
+            index.setdefault(key, item)
+        return index
+
+    @classmethod
+    def build_plan(
+        cls,
+        sheet_data: Iterable[Dict],
+        calendar_data: Iterable[Dict],
+        matcher: Optional[FuzzyMatcher] = None,
+    ) -> SyncPlan:
+        """시트와 캘린더 데이터를 한 번씩만 인덱싱하여 동기화 계획을 만듭니다.
+
+        Args:
+            sheet_data: transform_sheet_data로 변환된 시트 데이터
+            calendar_data: transform_calendar_data로 변환된 캘린더 데이터
+            matcher: 지정하면 키가 일치하지 않는 시트 항목과 시트에 없는 캘린더
+                이벤트 중 이름이 비슷한 쌍을 추가/삭제 대신 수정 항목으로 처리
+
+        Returns:
+            추가/수정/삭제/변경없음 항목으로 나뉜 동기화 계획
+        """
+        sheet_index = cls.index_sheet_data(sheet_data)
+        calendar_index = cls.index_calendar_data(calendar_data)
+
+        plan = SyncPlan([], [], [], [])
+        # 요청 본문은 한 번에 만들고, 이전 실행에서 만든 행은 캐시에서 재사용
+        bodies = create_event_bodies(list(sheet_index.values()))
+        for (key, sheet_item), body in zip(sheet_index.items(), bodies):
+            calendar_item = calendar_index.get(key)
+            if calendar_item is None:
+                plan.inserts.append(PlanItem(INSERT, key, sheet_item, None, body))
+            elif cls._needs_update(body, calendar_item):
+                patch = create_patch_body(body, calendar_item)
+                plan.updates.append(
+                    PlanItem(UPDATE, key, sheet_item, calendar_item, patch)
+                )
+            else:
+                plan.noops.append(PlanItem(NOOP, key, sheet_item, calendar_item))
+
+        for key, calendar_item in calendar_index.items():
+            if key not in sheet_index:
+                plan.deletes.append(PlanItem(DELETE, key, None, calendar_item))
+
+        if matcher is not None:
+            orphans = [item.calendar_item for item in plan.deletes]
+            matched = cls._match_fuzzy(plan, matcher, orphans)
+            plan.deletes[:] = [
+                item for item in plan.deletes if id(item.calendar_item) not in matched
+            ]
+        return plan
+
+    @classmethod
+    def build_delta_plan(
+        cls,
+        dirty_items: Iterable[Dict],
+        stale_items: Iterable[Dict],
+        calendar_data: Iterable[Dict],
+        live_items: Iterable[Dict],
+        matcher: Optional[FuzzyMatcher] = None,
+    ) -> SyncPlan:
+        """변경된 시트 행만으로 동기화 계획을 만듭니다.
+
+        Args:
+            dirty_items: 추가/변경된 행의 변환 결과
+            stale_items: 삭제된 행과 변경 전 행의 이전 변환 결과
+            calendar_data: transform_calendar_data로 변환된 캘린더 데이터
+            live_items: 현재 시트의 모든 행 변환 결과 (스냅샷 캐시)
+            matcher: 지정하면 추가 항목 중 현재 시트의 어느 행과도 일치하지 않는
+                캘린더 이벤트와 이름이 비슷한 항목을 수정 항목으로 처리
+
+        Returns:
+            동기화 계획. 삭제 항목은 더 이상 시트에 없는 행과 일치하는 캘린더
+            이벤트뿐입니다.
+        """
+        plan = cls.build_plan(dirty_items, calendar_data)
+        calendar_index = {item.key: item.calendar_item for item in plan.deletes}
+        del plan.deletes[:]
+
+        live_keys = set(cls.index_sheet_data(live_items))
+        matched: Set[int] = set()
+        if matcher is not None:
+            # 다른 행의 이벤트를 가져가지 않도록 현재 시트 행과 일치하지 않는
+            # 이벤트만 후보로 사용
+            orphans = [
+                item for key, item in calendar_index.items() if key not in live_keys
+            ]
+            matched = cls._match_fuzzy(plan, matcher, orphans)
+        for key in cls.index_sheet_data(stale_items):
+            calendar_item = calendar_index.get(key)
+            if (
+                calendar_item is not None
+                and key not in live_keys
+                and id(calendar_item) not in matched
+            ):
+                plan.deletes.append(PlanItem(DELETE, key, None, calendar_item))
+        return plan
+
+    @staticmethod
+    def _match_fuzzy(
+        plan: SyncPlan, matcher: FuzzyMatcher, orphans: List[Dict]
+    ) -> Set[int]:
+        """추가 항목 중 orphans(어느 시트 행과도 일치하지 않는 캘린더 이벤트)와
+        이름이 비슷한 항목을 그 이벤트의 수정 항목으로 바꿉니다.
+
+        Returns:
+            수정 항목으로 매칭된 캘린더 이벤트의 id() 집합
+        """
+        matches = matcher.match(
+            [item.sheet_item for item in plan.inserts],
+            orphans,
+        )
+        by_sheet_item = {id(match.sheet_item): match for match in matches}
+        inserts = []
+        for item in plan.inserts:
+            match = by_sheet_item.get(id(item.sheet_item))
+            if match is None:
+                inserts.append(item)
+                continue
+            patch = create_patch_body(item.body, match.calendar_item)
+            plan.updates.append(
+                PlanItem(UPDATE, item.key, item.sheet_item, match.calendar_item, patch)
+            )
+        plan.inserts[:] = inserts
+        return {id(match.calendar_item) for match in matches}
+
+    @staticmethod
+    def _needs_update(body: Dict, calendar_item: Dict) -> bool:
+        """내용 해시가 다를 때만 수정이 필요합니다. 해시가 기록되지 않은 기존
+        이벤트는 description을 직접 비교합니다."""
+        calendar_hash = calendar_item.get("content_hash")
+        if calendar_hash is not None:
+            return calendar_hash != get_content_hash(body)
+        return (body.get("description") or "") != (
+            calendar_item.get("description") or ""
+        )
@@ -0,0 +1,98 @@
+from typing import Any, Dict, List, NamedTuple, Optional
+from sheet_calendar_sync.event_body import get_content_hash
+from sheet_calendar_sync.utils import remove_non_words, transform_datetimes_to_dates
+
+
+class SheetRow(NamedTuple):
+    """시트 한 행의 변환 결과
+
+    튜플 기반이라 dict보다 메모리를 적게 쓰며, description은 필요할 때 만듭니다.
+    기존 dict 항목을 다루던 코드와 함께 쓸 수 있도록 get()을 제공합니다.
+    """
+
+    summary: str
+    due_date: str
+    review_site: str
+    location: str
+    budget: str
+    notice: str
+    source_tab: Optional[str] = None
+
+    @property
+    def description(self) -> str:
+        return (
+            f"사이트: {self.review_site}\n"
+            f"지역: {self.location}\n"
+            f"제공내역: {self.budget}\n"
+            f"비고: {self.notice}"
+        )
+
+    def get(self, name: str, default: Any = None) -> Any:
+        if name == "description":
+            return self.description
+        if name in self._fields:
+            value = getattr(self, name)
+            return default if value is None else value
+        return default
+
+    def to_dict(self) -> Dict:
+        """스냅샷 저장 등에 쓰는 기존 dict 형식으로 변환합니다."""
+        item = {
+            "summary": self.summary,
+            "due_date": self.due_date,
+            "description": self.description,
+        }
+        if self.source_tab is not None:
+            item["source_tab"] = self.source_tab
+        return item
+
+
+class CalendarEvent(NamedTuple):
+    """캘린더 이벤트 하나의 변환 결과 (비교에 필요한 필드만 보관)"""
+
+    event_id: Optional[str]
+    summary: str
+    end_date: str
+    start_date: Optional[str]
+    description: str
+    content_hash: Optional[str]
+
+    @classmethod
+    def from_event(cls, item: Dict) -> "CalendarEvent":
+        """events.list 응답 항목(end가 있는 이벤트)을 변환합니다."""
+        return cls.from_events([item])[0]
+
+    @classmethod
+    def from_events(cls, items: List[Dict]) -> List["CalendarEvent"]:
+        """events.list 응답 항목(end가 있는 이벤트) 여러 개를 변환합니다. 시작/종료
+        날짜는 열 단위로 한 번에 변환하므로 같은 날짜는 한 번만 파싱합니다."""
+        end_dates = transform_datetimes_to_dates(
+            item["end"].get("dateTime", item["end"].get("date")) for item in items
+        )
+        start_times = [
+            item.get("start", {}).get("dateTime", item.get("start", {}).get("date"))
+            for item in items
+        ]
+        start_dates = iter(
+            transform_datetimes_to_dates(value for value in start_times if value)
+        )
+        return [
+            cls(
+                event_id=item.get("id"),
+                summary=remove_non_words(item.get("summary") or ""),
+                end_date=end_date,
+                start_date=next(start_dates) if start_time else None,
+                description=item.get("description") or "",
+                content_hash=get_content_hash(item),
+            )
+            for item, end_date, start_time in zip(items, end_dates, start_times)
+        ]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        if name in self._fields:
+            value = getattr(self, name)
+            return default if value is None else value
+        return default
+
+    def to_dict(self) -> Dict:
+        return self._asdict()
@@ -0,0 +1,330 @@
+import os
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import httplib2
+import google_auth_httplib2
+from google.oauth2 import service_account
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from sheet_calendar_sync.instrumentation import (
+    InstrumentedHttp,
+    InstrumentedRequest,
+    Instrumentation,
+)
+from sheet_calendar_sync.quota_governor import QuotaGovernor
+
+
+class ThreadLocalHttp:
+    def __init__(self, credentials, http_factory: Callable[[], Any]):
+        """호출한 스레드마다 keep-alive 연결을 가진 인증된 http 객체를 하나씩 만들어
+        사용하는 http 객체. httplib2 객체는 스레드 간에 공유할 수 없으므로 서비스
+        인스턴스 하나를 여러 스레드에서 함께 쓸 때 사용합니다. 인증 정보(access
+        token)는 모든 스레드가 공유합니다.
+
+        Args:
+            credentials: 인증 정보
+            http_factory: 인증 정보가 없는 새 http 객체를 만드는 함수
+        """
+        self.credentials = credentials
+        self.http_factory = http_factory
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._https: List[google_auth_httplib2.AuthorizedHttp] = []
+
+    def request(self, *args, **kwargs):
+        return self._thread_http().request(*args, **kwargs)
+
+    def close(self) -> None:
+        """모든 스레드의 연결을 닫습니다."""
+        with self._lock:
+            https, self._https = self._https, []
+        for http in https:
+            http.close()
+        self._local = threading.local()
+
+    def _thread_http(self) -> google_auth_httplib2.AuthorizedHttp:
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(
+                self.credentials, http=self.http_factory()
+            )
+            self._local.http = http
+            with self._lock:
+                self._https.append(http)
+        elif http.credentials is not self.credentials:
+            # 권한 범위가 추가되어 인증 정보가 교체된 경우
+            http.credentials = self.credentials
+        return http
+
+
+class GoogleService:
+    def __init__(
+        self,
+        client_secret_file: Optional[str] = None,
+        token_cache_path: Optional[str] = None,
+        json_env_var: str = "CLIENT_SECRET_JSON",
+        http_timeout: int = 60,
+        governor: Optional[QuotaGovernor] = None,
+        api_root: Optional[str] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ):
+        """구글 서비스 초기화
+
+        인증 정보와 keep-alive 연결을 가진 http 객체를 하나만 만들어 시트/캘린더
+        클라이언트가 함께 사용합니다. 여러 스레드에서 사용하면 연결은 스레드마다
+        하나씩 만듭니다.
+
+        Args:
+            client_secret_file: 서비스 계정 인증 파일 경로 (선택 사항, 없으면
+                json_env_var 환경변수 사용)
+            token_cache_path: access token 캐시 파일 경로 (선택 사항)
+            json_env_var: JSON 데이터가 저장된 환경변수 키 (기본값: CLIENT_SECRET_JSON)
+            http_timeout: http 요청 타임아웃 (초)
+            governor: 모든 API 요청에 적용할 할당량 관리자 (기본값: 새 QuotaGovernor)
+            api_root: 구글 API 대신 요청을 보낼 루트 URL (선택 사항, 오프라인
+                벤치마크용 가짜 서버 등. 예: "http://127.0.0.1:8080/")
+            instrumentation: 요청별 측정 결과를 기록할 객체 (기본값: 새
+                Instrumentation)
+        """
+        self.client_secret_file = client_secret_file
+        self.token_cache_path = token_cache_path
+        self.json_env_var = json_env_var
+        self.http_timeout = http_timeout
+        self.governor = governor or QuotaGovernor()
+        self.api_root = api_root
+        self.instrumentation = instrumentation or Instrumentation()
+        self.startup_timings: Dict[str, float] = {}
+        self._scopes: List[str] = []
+        self._base_credentials = None
+        self._credentials = None
+        self._http: Optional[ThreadLocalHttp] = None
+        self._services: Dict[Tuple[str, str], Any] = {}
+
+    def create_service(
+        self, api_name: str, api_version: str, scope: List[str], http: Any = None
+    ):
+        """구글 API 서비스 인스턴스를 생성합니다.
+
+        discovery 문서는 라이브러리에 포함된 정적 문서를 사용하고, 같은 API의
+        서비스 인스턴스는 한 번만 만듭니다.
+
+        Args:
+            api_name: API 서비스 이름 (예: "sheets", "calendar")
+            api_version: API 버전
+            scope: API 권한 범위 목록
+            http: 인증 대신 사용할 http 객체 (선택 사항, 오프라인 테스트용
+                HttpMockSequence 등)
+
+        Returns:
+            구글 API 서비스 인스턴스
+        """
+        if http is not None:
+            return build(api_name, api_version, http=http, cache_discovery=False)
+
+        authorized_http = self.get_authorized_http(scope)
+        key = (api_name, api_version)
+        if key not in self._services:
+            with self._timed(f"discovery:{api_name}"):
+                if self.api_root:
+                    self._services[key] = self._build_with_root(
+                        api_name, api_version, authorized_http
+                    )
+                else:
+                    self._services[key] = build(
+                        api_name,
+                        api_version,
+                        http=authorized_http,
+                        cache_discovery=False,
+                        static_discovery=True,
+                        requestBuilder=InstrumentedRequest,
+                    )
+        return self._services[key]
+
+    def _build_with_root(self, api_name: str, api_version: str, http: Any):
+        """discovery 문서의 rootUrl을 api_root로 바꿔 서비스를 만듭니다. 일반 요청과
+        배치 요청 URL이 모두 rootUrl을 기준으로 만들어지므로 둘 다 api_root로
+        전송됩니다."""
+        document = json.loads(get_static_doc(api_name, api_version))
+        document["rootUrl"] = self.api_root
+        return build_from_document(
+            document, http=http, requestBuilder=InstrumentedRequest
+        )
+
+    def create_service_json(
+        self,
+        api_name: str,
+        api_version: str,
+        scope: List[str],
+        json_env_var: str = "CLIENT_SECRET_JSON",
+    ):
+        """구글 API 서비스 인스턴스를 JSON 환경변수로부터 생성합니다.
+
+        Args:
+            api_name: API 서비스 이름
+            api_version: API 버전
+            scope: API 권한 범위 목록
+            json_env_var: JSON 데이터가 저장된 환경변수 키 (기본값: CLIENT_SECRET_JSON)
+
+        Returns:
+            구글 API 서비스 인스턴스
+        """
+        if self.client_secret_file or self.json_env_var != json_env_var:
+            # 다른 계정의 인증 정보를 계속 쓰지 않도록 다음 요청 때 새로 읽음
+            # (서비스 인스턴스는 공유 http 객체를 통해 새 인증 정보를 사용)
+            self._base_credentials = None
+            self._credentials = None
+        self.client_secret_file = None
+        self.json_env_var = json_env_var
+        return self.create_service(api_name, api_version, scope)
+
+    def get_authorized_http(self, scope: List[str]) -> ThreadLocalHttp:
+        """모든 서비스가 함께 쓰는 인증된 http 객체를 반환합니다.
+
+        지금까지 요청된 권한 범위를 모두 포함하는 인증 정보 하나를 사용하므로,
+        새로운 범위가 추가되면 인증 정보만 교체합니다.
+
+        Args:
+            scope: API 권한 범위 목록
+
+        Returns:
+            스레드별 keep-alive 연결을 재사용하는 인증된 http 객체
+        """
+        new_scopes = [item for item in scope if item not in self._scopes]
+        if new_scopes or self._credentials is None:
+            self._scopes.extend(new_scopes)
+            with self._timed("credentials"):
+                self._credentials = self._load_credentials().with_scopes(
+                    list(self._scopes)
+                )
+                self._load_token_cache()
+
+        if self._http is None:
+            self._http = ThreadLocalHttp(self._credentials, self.create_http)
+        else:
+            self._http.credentials = self._credentials
+        return self._http
+
+    def create_authorized_http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """공유 인증 정보를 사용하는 새 http 객체를 만듭니다. httplib2 객체는
+        스레드 간에 공유할 수 없으므로 스레드마다 하나씩 사용합니다."""
+        if self._credentials is None:
+            raise ValueError("create_service로 서비스를 먼저 생성해야 합니다.")
+        return google_auth_httplib2.AuthorizedHttp(
+            self._credentials, http=self.create_http()
+        )
+
+    def create_http(self) -> InstrumentedHttp:
+        """인증 정보가 없는 새 http 객체를 만듭니다. 모든 요청은 instrumentation에
+        기록됩니다."""
+        return InstrumentedHttp(
+            httplib2.Http(timeout=self.http_timeout), self.instrumentation
+        )
+
+    def ensure_token(self) -> None:
+        """access token이 없거나 만료되었으면 미리 발급받고 캐시에 저장합니다."""
+        if self._credentials is None or self._credentials.valid:
+            return
+        with self._timed("token_refresh"):
+            self._credentials.refresh(
+                google_auth_httplib2.Request(self.create_http())
+            )
+        self.save_token_cache()
+
+    def save_token_cache(self) -> None:
+        """현재 access token을 캐시 파일에 저장합니다."""
+        credentials = self._credentials
+        if not self.token_cache_path or credentials is None or not credentials.token:
+            return
+        cache = {
+            "client_email": credentials.service_account_email,
+            "scopes": sorted(self._scopes),
+            "token": credentials.token,
+            "expiry": credentials.expiry.isoformat() if credentials.expiry else None,
+        }
+        # access token이 담기므로 소유자만 읽을 수 있게 만들고, 쓰는 중에 종료되어도
+        # 기존 캐시가 깨지지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = f"{self.token_cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.token_cache_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def report_startup_timings(self) -> str:
+        """시작 단계별 소요 시간을 문자열로 반환합니다."""
+        total = sum(self.startup_timings.values())
+        lines = [
+            f"{name}: {elapsed * 1000:.1f}ms"
+            for name, elapsed in self.startup_timings.items()
+        ]
+        lines.append(f"total: {total * 1000:.1f}ms")
+        return "\n".join(lines)
+
+    def _load_credentials(self):
+        """서비스 계정 인증 정보를 한 번만 읽어옵니다."""
+        if self._base_credentials is not None:
+            return self._base_credentials
+
+        if self.client_secret_file:
+            self._base_credentials = (
+                service_account.Credentials.from_service_account_file(
+                    self.client_secret_file
+                )
+            )
+            return self._base_credentials
+
+        json_string = os.getenv(self.json_env_var)
+        if not json_string:
+            raise ValueError(f"{self.json_env_var} 환경변수가 설정되지 않았습니다.")
+
+        try:
+            service_account_info = json.loads(json_string)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON 파싱 오류: {e}")
+
+        self._base_credentials = service_account.Credentials.from_service_account_info(
+            service_account_info
+        )
+        return self._base_credentials
+
+    def _load_token_cache(self) -> None:
+        """계정과 권한 범위가 같은 캐시된 access token이 있으면 인증 정보에
+        적용합니다."""
+        if not self.token_cache_path or not os.path.exists(self.token_cache_path):
+            return
+        try:
+            with open(self.token_cache_path, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if (
+            cache.get("client_email") != self._credentials.service_account_email
+            or cache.get("scopes") != sorted(self._scopes)
+            or not cache.get("expiry")
+        ):
+            return
+        self._credentials.token = cache["token"]
+        self._credentials.expiry = datetime.fromisoformat(cache["expiry"])
+
+    @contextmanager
+    def _timed(self, name: str) -> Iterator[None]:
+        """블록 실행 시간을 startup_timings[name]에 누적합니다."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.startup_timings[name] = self.startup_timings.get(name, 0.0) + elapsed
+
+
+if __name__ == "__main__":
+    client_secret = GoogleService()
+    print(client_secret)
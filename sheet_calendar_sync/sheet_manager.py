@@ -0,0 +1,338 @@
+from rich import print
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import re
+import traceback
+from sheet_calendar_sync.service import GoogleService
+from sheet_calendar_sync.records import SheetRow
+from sheet_calendar_sync.sheet_snapshot import RowDelta
+from sheet_calendar_sync.utils import (
+    transform_range_date_to_date,
+    remove_non_words,
+)
+
+# 나눠 읽을 때 한 번에 요청할 행 수와 동시에 보낼 요청 수
+DEFAULT_CHUNK_ROWS = 2000
+DEFAULT_CHUNK_WORKERS = 4
+# 셀 범위 (예: "E5:M", "E5:M1000")
+_CELL_RANGE = re.compile(r"([A-Za-z]+)(\d*):([A-Za-z]+)(\d*)")
+
+
+class GoogleSheetManager:
+    def __init__(
+        self,
+        google_service: GoogleService,
+        sheet_id: str,
+        http: Any = None,
+        lean: bool = True,
+    ):
+        """구글 시트 관리자를 초기화합니다.
+            시트의 구성을 편집할때 이 클래에서 편집할 것
+
+        Args:
+            google_service: 구글 서비스 인스턴스
+            sheet_id: 구글 시트 ID
+            http: 인증 대신 사용할 http 객체 (선택 사항, 오프라인 테스트용)
+            lean: True이면 fields 마스크를 지정해 셀 값만 받음
+        """
+        self.SCOPE = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
+        self.API_SERVICE_NAME = "sheets"
+        self.API_VERSION = "v4"
+        self.sheet_id = sheet_id
+        self.lean = lean
+        self.governor = google_service.governor
+        self.service = google_service.create_service(
+            self.API_SERVICE_NAME, self.API_VERSION, self.SCOPE, http=http
+        )
+
+    def get_sheet_data(self, sheet_range: str) -> List:
+        """구글 시트에서 데이터를 가져옵니다.
+
+        Args:
+            sheet_range: 시트 범위 (예: "2025년!C5:K")
+
+        Returns:
+            시트에서 가져온 데이터 목록
+        """
+        sheet = self.service.spreadsheets()
+        request = sheet.values().get(
+            spreadsheetId=self.sheet_id,
+            range=sheet_range,
+            fields="values" if self.lean else None,
+        )
+        event_list = self.governor.execute(request, self.API_SERVICE_NAME)
+        return event_list.get("values", [])
+
+    def get_sheet_data_many(
+        self, tab_ranges: List[Tuple[str, str]]
+    ) -> List[Tuple[str, List]]:
+        """여러 탭/범위의 데이터를 values:batchGet 한 번으로 가져옵니다.
+
+        majorDimension=ROWS는 행 끝의 빈 셀을 생략하고, lean 모드의 fields
+        마스크로 응답에서 범위 이름 등 사용하지 않는 필드를 제외해 응답 크기를
+        줄입니다. 날짜 문자열 파싱을 위해 값은 FORMATTED_VALUE로 받습니다.
+
+        Args:
+            tab_ranges: (탭 이름, 셀 범위) 목록 (예: [("2025년", "E5:M")])
+
+        Returns:
+            요청 순서와 같은 (탭 이름, 시트 데이터 목록) 목록
+        """
+        if not tab_ranges:
+            return []
+
+        request = (
+            self.service.spreadsheets()
+            .values()
+            .batchGet(
+                spreadsheetId=self.sheet_id,
+                ranges=[f"{tab}!{cell_range}" for tab, cell_range in tab_ranges],
+                majorDimension="ROWS",
+                valueRenderOption="FORMATTED_VALUE",
+                fields="valueRanges(values)" if self.lean else None,
+            )
+        )
+        result = self.governor.execute(request, self.API_SERVICE_NAME)
+        value_ranges = result.get("valueRanges", [])
+        return [
+            (tab, value_range.get("values", []))
+            for (tab, _), value_range in zip(tab_ranges, value_ranges)
+        ]
+
+    def get_row_counts(self) -> Dict[str, int]:
+        """시트 메타데이터에서 탭별 행 수(그리드 크기)를 가져옵니다. 셀 값은 받지
+        않으므로 탭 크기와 관계없이 응답이 작습니다.
+
+        Returns:
+            탭 이름 -> 행 수
+        """
+        request = self.service.spreadsheets().get(
+            spreadsheetId=self.sheet_id,
+            fields="sheets(properties(title,gridProperties(rowCount)))",
+        )
+        result = self.governor.execute(request, self.API_SERVICE_NAME)
+        return {
+            sheet["properties"]["title"]: sheet["properties"]
+            .get("gridProperties", {})
+            .get("rowCount", 0)
+            for sheet in result.get("sheets", [])
+        }
+
+    def get_sheet_data_chunked(
+        self,
+        tab_ranges: List[Tuple[str, str]],
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        max_workers: int = DEFAULT_CHUNK_WORKERS,
+    ) -> List[Tuple[str, Iterator[List]]]:
+        """여러 탭/범위의 데이터를 chunk_rows행씩 나눠 동시에 가져옵니다.
+
+        메타데이터로 탭의 행 수를 먼저 구한 뒤 행 블록을 values.get으로 동시에
+        요청하고, 받은 블록을 순서대로 이어 행 단위로 내보냅니다. 행이 많은 탭도
+        응답 하나를 기다리지 않고 첫 블록부터 변환/비교를 시작할 수 있습니다.
+        결과 행은 get_sheet_data_many와 같습니다 (중간의 빈 행은 [], 끝의 빈 행은
+        제외).
+
+        Args:
+            tab_ranges: (탭 이름, 셀 범위) 목록 (예: [("2025년", "E5:M")])
+            chunk_rows: 요청 하나로 가져올 행 수
+            max_workers: 탭마다 동시에 보낼 최대 요청 수
+
+        Returns:
+            요청 순서와 같은 (탭 이름, 시트 행 iterator) 목록
+
+        Raises:
+            ValueError: chunk_rows가 1보다 작거나 시트에 없는 탭을 지정한 경우
+        """
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows는 1 이상이어야 합니다.")
+        if not tab_ranges:
+            return []
+
+        row_counts = self.get_row_counts()
+        # values.get처럼 없는 탭은 오류로 처리 (빈 탭으로 보면 스냅샷 모드에서
+        # 탭의 모든 이벤트가 삭제 대상이 됨)
+        missing = [tab for tab, _ in tab_ranges if tab not in row_counts]
+        if missing:
+            raise ValueError(f"시트에 없는 탭입니다: {', '.join(missing)}")
+        return [
+            (
+                tab,
+                self._iter_chunks(
+                    tab, cell_range, row_counts[tab], chunk_rows, max_workers
+                ),
+            )
+            for tab, cell_range in tab_ranges
+        ]
+
+    def _iter_chunks(
+        self,
+        tab: str,
+        cell_range: str,
+        row_count: int,
+        chunk_rows: int,
+        max_workers: int,
+    ) -> Iterator[List]:
+        match = _CELL_RANGE.fullmatch(cell_range)
+        if match is None:
+            raise ValueError(f"나눠 읽을 수 없는 범위입니다: {cell_range}")
+        start_col, start_row, end_col, end_row = match.groups()
+        first_row = int(start_row or 1)
+        last_row = min(int(end_row), row_count) if end_row else row_count
+        blocks = iter(
+            [
+                (start, min(start + chunk_rows - 1, last_row))
+                for start in range(first_row, last_row + 1, chunk_rows)
+            ]
+        )
+
+        # 리소스 객체는 만들 때마다 API 문서 문자열을 새로 만들므로 한 번만 만듦
+        values = self.service.spreadsheets().values()
+        pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sheet")
+        pending = deque()
+
+        def submit() -> None:
+            block = next(blocks, None)
+            if block is not None:
+                block_range = f"{tab}!{start_col}{block[0]}:{end_col}{block[1]}"
+                future = pool.submit(self._get_block, values, block_range)
+                pending.append((block, future))
+
+        # 받은 블록을 쌓아 두지 않도록 앞선 블록 몇 개만 미리 요청
+        for _ in range(max_workers * 2):
+            submit()
+        empty_rows = 0
+        try:
+            while pending:
+                (start, end), future = pending.popleft()
+                rows = future.result()
+                submit()
+                # 블록 끝의 빈 행은 응답에서 생략되므로 채우고, 탭 끝의 빈 행은
+                # batchGet처럼 내보내지 않음
+                for row in rows + [[]] * (end - start + 1 - len(rows)):
+                    if not row:
+                        empty_rows += 1
+                        continue
+                    for _ in range(empty_rows):
+                        yield []
+                    empty_rows = 0
+                    yield row
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_block(self, values: Any, block_range: str) -> List:
+        request = values.get(
+            spreadsheetId=self.sheet_id,
+            range=block_range,
+            majorDimension="ROWS",
+            fields="values" if self.lean else None,
+        )
+        result = self.governor.execute(request, self.API_SERVICE_NAME)
+        return result.get("values", [])
+
+    @staticmethod
+    def transform_sheet_data(
+        sheet_events: List, source_tab: Optional[str] = None
+    ) -> List[SheetRow]:
+        """시트 데이터를 구조화된 형식으로 변환합니다.
+
+        시트 구성:
+        B    C         D       E      F      G       H      I          J       K         L        M
+        No	방문	블로그작성	사이트	구분	지역	체험 업체명	기간	방문일	제공내역	추가결재	비고
+
+        Args:
+            sheet_events: 시트에서 가져온 원본 데이터
+            source_tab: 데이터를 가져온 탭 이름 (지정하면 각 항목에 source_tab으로 기록)
+
+        Returns:
+            변환된 이벤트 목록 (summary, due_date, description 포함)
+        """
+        return list(
+            GoogleSheetManager.iter_transform_sheet_data(sheet_events, source_tab)
+        )
+
+    @staticmethod
+    def iter_transform_sheet_data(
+        sheet_events: Iterable[List], source_tab: Optional[str] = None
+    ) -> Iterator[SheetRow]:
+        """시트 행을 하나씩 변환합니다. transform_sheet_data와 같지만 결과 목록을
+        만들지 않으므로 필터링/인덱싱 단계에 바로 이어 붙일 수 있습니다.
+
+        Args:
+            sheet_events: 시트에서 가져온 원본 행
+            source_tab: 데이터를 가져온 탭 이름 (선택 사항)
+
+        Yields:
+            빈 행을 제외한 변환 결과
+        """
+        try:
+            for item in sheet_events:
+                transformed = GoogleSheetManager.transform_sheet_row(item, source_tab)
+                if transformed:
+                    yield transformed
+        except IndexError as e:
+            print(traceback.format_exc())
+
+    @staticmethod
+    def transform_sheet_row(
+        item: List, source_tab: Optional[str] = None
+    ) -> Optional[SheetRow]:
+        """시트 한 행을 구조화된 형식으로 변환합니다. 빈 행이면 None을 반환합니다.
+
+        Args:
+            item: 시트에서 가져온 원본 행
+            source_tab: 데이터를 가져온 탭 이름 (선택 사항)
+
+        Returns:
+            변환된 이벤트 (summary, due_date, description 포함)
+        """
+        if not item:
+            return None
+
+        due_date = item[4]
+        summary = remove_non_words(item[3])
+
+        # 제공 사이트
+        review_site = item[0]
+        # 지역
+        location = item[2]
+        # 제공내역
+        budget = item[6]
+        # 비고
+        notice = item[8] if len(item) > 8 else "없음"
+
+        # description은 SheetRow에서 필요할 때 만듦
+        return SheetRow(
+            summary,
+            transform_range_date_to_date(due_date),
+            review_site,
+            location,
+            budget,
+            notice,
+            source_tab,
+        )
+
+    @staticmethod
+    def transform_sheet_delta(
+        delta: RowDelta, source_tab: Optional[str] = None
+    ) -> Dict[int, Optional[SheetRow]]:
+        """추가/변경된 행만 변환합니다.
+
+        Args:
+            delta: SheetSnapshot.diff 결과
+            source_tab: 데이터를 가져온 탭 이름 (선택 사항)
+
+        Returns:
+            행 번호별 변환 결과 (빈 행이나 형식 오류 행은 None)
+        """
+        transformed = {}
+        for row_number, item in delta.dirty_rows.items():
+            try:
+                transformed[row_number] = GoogleSheetManager.transform_sheet_row(
+                    item, source_tab
+                )
+            except (IndexError, ValueError) as e:
+                print(f"{row_number}행 변환 오류: {e}")
+                transformed[row_number] = None
+        return transformed
+
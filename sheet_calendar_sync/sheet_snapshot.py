@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from sheet_calendar_sync.records import SheetRow
+
+SNAPSHOT_VERSION = 1
+
+
+class RowDelta(NamedTuple):
+    """지난 실행 이후 시트 행의 변경 내역 (key: 시트 행 번호)"""
+
+    added: Dict[int, List]
+    changed: Dict[int, List]
+    removed: Dict[int, Optional[Dict]]
+    unchanged: List[int]
+
+    @property
+    def dirty_rows(self) -> Dict[int, List]:
+        """추가되거나 변경된 행"""
+        return {**self.added, **self.changed}
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            "added": len(self.added),
+            "changed": len(self.changed),
+            "removed": len(self.removed),
+            "unchanged": len(self.unchanged),
+        }
+
+
+def compute_row_hash(row: List) -> str:
+    """시트 행 원본 값의 내용 해시를 계산합니다."""
+    serialized = json.dumps(row, ensure_ascii=False)
+    return hashlib.sha1(serialized.encode("utf-8")).hexdigest()
+
+
+class SheetSnapshot:
+    def __init__(self, path: str, sheet_range: str):
+        """시트 범위의 행별 해시와 변환 결과를 보관하는 스냅샷을 불러옵니다.
+
+        Args:
+            path: 스냅샷 JSON 파일 경로
+            sheet_range: 시트 범위 (예: "2025년!E5:M")
+        """
+        self.path = path
+        self.sheet_range = sheet_range
+        self._data = self._load()
+        ranges = self._data.setdefault("ranges", {})
+        self.rows: Dict[str, Dict] = ranges.setdefault(sheet_range, {})
+        # update로 바뀐 행의 이전 값 (revert로 되돌릴 때 사용, 없던 행은 None)
+        self._replaced: Dict[str, Optional[Dict]] = {}
+
+    def _load(self) -> Dict:
+        if not os.path.exists(self.path):
+            return {"version": SNAPSHOT_VERSION}
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != SNAPSHOT_VERSION:
+            return {"version": SNAPSHOT_VERSION}
+        return data
+
+    def diff(self, sheet_rows: List[List], start_row: int) -> RowDelta:
+        """현재 시트 행을 스냅샷과 비교합니다.
+
+        Args:
+            sheet_rows: get_sheet_data로 가져온 원본 행 목록
+            start_row: 첫 행의 시트 행 번호 (예: "E5:M"이면 5)
+
+        Returns:
+            추가/변경/삭제/변경없음 행 내역. 삭제된 행에는 이전 변환 결과가 담깁니다.
+        """
+        delta = RowDelta({}, {}, {}, [])
+        seen = set()
+        for offset, row in enumerate(sheet_rows):
+            row_number = start_row + offset
+            key = str(row_number)
+            seen.add(key)
+            previous = self.rows.get(key)
+            if previous is None:
+                delta.added[row_number] = row
+            elif previous["hash"] != compute_row_hash(row):
+                delta.changed[row_number] = row
+            else:
+                delta.unchanged.append(row_number)
+
+        for key, previous in self.rows.items():
+            if key not in seen:
+                delta.removed[int(key)] = previous.get("item")
+        return delta
+
+    def previous_item(self, row_number: int) -> Optional[Dict]:
+        """행의 이전 변환 결과를 반환합니다."""
+        previous = self.rows.get(str(row_number))
+        return previous.get("item") if previous else None
+
+    def update(
+        self, delta: RowDelta, transformed: Dict[int, Optional[Dict]]
+    ) -> None:
+        """변경 내역과 변환 결과를 스냅샷에 반영합니다 (저장은 save에서 수행).
+
+        Args:
+            delta: diff 결과
+            transformed: 추가/변경된 행의 변환 결과 (행 번호 -> 변환 결과)
+        """
+        for row_number in [*delta.dirty_rows, *delta.removed]:
+            key = str(row_number)
+            self._replaced.setdefault(key, self.rows.get(key))
+        for row_number, row in delta.dirty_rows.items():
+            item = transformed.get(row_number)
+            self.rows[str(row_number)] = {
+                "hash": compute_row_hash(row),
+                "item": item.to_dict() if isinstance(item, SheetRow) else item,
+            }
+        for row_number in delta.removed:
+            self.rows.pop(str(row_number), None)
+
+    def updated_items(self) -> Iterator[Tuple[int, List[Dict]]]:
+        """update로 바뀐 행마다 (행 번호, [새 변환 결과, 이전 변환 결과])를
+        반환합니다. 없는 결과(빈 행, 새로 추가되거나 삭제된 행)는 빠집니다."""
+        for key, previous in self._replaced.items():
+            current = self.rows.get(key)
+            items = [
+                entry["item"]
+                for entry in (current, previous)
+                if entry and entry.get("item")
+            ]
+            yield int(key), items
+
+    def revert(self, row_numbers: Iterable[int]) -> None:
+        """행을 update 전 상태로 되돌립니다. 캘린더 반영에 실패한 행을 되돌려
+        두면 나머지 행만 저장되고, 실패한 행은 다음 실행에서 다시 비교합니다.
+
+        Args:
+            row_numbers: 되돌릴 시트 행 번호
+        """
+        for row_number in row_numbers:
+            key = str(row_number)
+            if key not in self._replaced:
+                continue
+            previous = self._replaced.pop(key)
+            if previous is None:
+                self.rows.pop(key, None)
+            else:
+                self.rows[key] = previous
+
+    def items(self) -> List[Dict]:
+        """스냅샷에 보관된 모든 행의 변환 결과를 행 순서대로 반환합니다."""
+        return [
+            self.rows[key]["item"]
+            for key in sorted(self.rows, key=int)
+            if self.rows[key].get("item")
+        ]
+
+    def save(self) -> None:
+        """스냅샷을 파일에 저장합니다. 중간에 실패해도 기존 파일이 깨지지 않도록
+        임시 파일에 쓴 뒤 교체합니다."""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._replaced.clear()
@@ -0,0 +1,161 @@
+import os
+import tomllib
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Tuple
+
+DEFAULT_SHEET_RANGE = "E5:M"
+DEFAULT_MAX_WORKERS = 8
+# 현재 시점에서 과거로 몇 주 전까지의 이벤트를 비교할지
+DEFAULT_MIN_WEEK = 26
+# 경로 설정에서 pair 이름으로 바꿀 자리 (예: "snapshots/{name}.json")
+PATH_KEYS = ("mirror_path", "snapshot_path", "journal_path")
+
+
+class SyncPair(NamedTuple):
+    """동기화할 (시트, 캘린더) 한 쌍의 설정"""
+
+    name: str
+    sheet_id: str
+    calendar_id: str
+    sheet_range: str = DEFAULT_SHEET_RANGE
+    sheet_tabs: Tuple[str, ...] = ()
+    mirror_path: Optional[str] = None
+    snapshot_path: Optional[str] = None
+    journal_path: Optional[str] = None
+    write_concurrency: int = 0
+    list_concurrency: int = 0
+    # 0보다 크면 이름이 이 점수 이상 비슷한 이벤트를 같은 이벤트로 보고 수정
+    fuzzy_threshold: float = 0.0
+    # 0보다 크면 시트를 이 행 수씩 나눠 동시에 조회
+    sheet_chunk_rows: int = 0
+    min_week: int = DEFAULT_MIN_WEEK
+    # True이면 스냅샷 모드에서 시트에서 지운 행의 캘린더 이벤트도 삭제
+    delete_removed: bool = False
+
+
+def default_sheet_tabs(today: datetime) -> List[str]:
+    """올해 탭, 1월에는 작년 탭도 함께 반환합니다."""
+    sheet_tabs = [f"{today.year}년"]
+    if today.month == 1:
+        sheet_tabs.insert(0, f"{today.year - 1}년")
+    return sheet_tabs
+
+
+def load_pairs(path: str) -> Tuple[List[SyncPair], int]:
+    """여러 (시트, 캘린더) 쌍을 나열한 TOML 설정 파일을 읽습니다.
+
+    [defaults]의 값은 모든 pair에 적용되고 [[pairs]]의 값이 우선합니다. 경로
+    설정의 "{name}"은 pair 이름으로 바뀝니다. 스냅샷/작업 기록 파일은 pair마다
+    따로 써야 하므로 여러 pair가 같은 파일을 쓰도록 설정하면 오류로 봅니다.
+
+        max_workers = 8
+
+        [defaults]
+        sheet_range = "E5:M"
+        snapshot_path = "state/{name}-snapshot.json"
+
+        [[pairs]]
+        name = "team-a"
+        sheet_id = "..."
+        calendar_id = "...@group.calendar.google.com"
+        sheet_tabs = ["2025년"]
+
+    Args:
+        path: 설정 파일 경로
+
+    Returns:
+        (pair 목록, 동시에 동기화할 최대 pair 수)
+    """
+    with open(path, "rb") as f:
+        config = tomllib.load(f)
+
+    defaults = config.get("defaults", {})
+    pairs = []
+    for index, entry in enumerate(config.get("pairs", [])):
+        values = {**defaults, **entry}
+        name = values.get("name") or f"pair-{index + 1}"
+        for key in ("sheet_id", "calendar_id"):
+            if not values.get(key):
+                raise ValueError(f"{path}: pair <{name}>에 {key}가 없습니다.")
+        paths = {
+            key: values[key].format(name=name) if values.get(key) else None
+            for key in PATH_KEYS
+        }
+        pairs.append(
+            SyncPair(
+                name=name,
+                sheet_id=values["sheet_id"],
+                calendar_id=values["calendar_id"],
+                sheet_range=values.get("sheet_range", DEFAULT_SHEET_RANGE),
+                sheet_tabs=tuple(values.get("sheet_tabs", ())),
+                write_concurrency=int(values.get("write_concurrency", 0)),
+                list_concurrency=int(values.get("list_concurrency", 0)),
+                fuzzy_threshold=float(values.get("fuzzy_threshold", 0.0)),
+                sheet_chunk_rows=int(values.get("sheet_chunk_rows", 0)),
+                min_week=int(values.get("min_week", DEFAULT_MIN_WEEK)),
+                delete_removed=bool(values.get("delete_removed", False)),
+                **paths,
+            )
+        )
+
+    if not pairs:
+        raise ValueError(f"{path}: [[pairs]]에 동기화할 pair가 없습니다.")
+    names = [pair.name for pair in pairs]
+    if len(set(names)) != len(names):
+        raise ValueError(f"{path}: pair 이름이 중복되었습니다.")
+    for key in ("snapshot_path", "journal_path"):
+        used = [getattr(pair, key) for pair in pairs if getattr(pair, key)]
+        if len(set(used)) != len(used):
+            raise ValueError(
+                f"{path}: 여러 pair가 같은 {key}를 사용합니다. "
+                '경로에 "{name}"을 넣어 pair마다 다른 파일을 사용하세요.'
+            )
+    return pairs, int(config.get("max_workers", DEFAULT_MAX_WORKERS))
+
+
+def load_pairs_from_env() -> Tuple[List[SyncPair], int]:
+    """SYNC_PAIRS_CONFIG가 있으면 설정 파일의 pair 목록을, 없으면 SHEET_ID,
+    CALENDAR_ID 등의 환경 변수로 만든 pair 하나를 반환합니다.
+
+    Returns:
+        (pair 목록, 동시에 동기화할 최대 pair 수)
+    """
+    # SYNC_PAIRS_CONFIG가 있으면 설정 파일에 나열된 여러 (시트, 캘린더) 쌍을
+    # 한 프로세스에서 동시에 동기화
+    pairs_config = os.getenv("SYNC_PAIRS_CONFIG")
+    if pairs_config:
+        return load_pairs(pairs_config)
+
+    sheet_id = os.getenv("SHEET_ID")
+    if not sheet_id:
+        raise ValueError("SHEET_ID 환경 변수가 설정되지 않았습니다.")
+    calendar_id = os.getenv("CALENDAR_ID")
+    if not calendar_id:
+        raise ValueError("CALENDAR_ID 환경 변수가 설정되지 않았습니다.")
+    # SHEET_TABS(쉼표 구분)가 없으면 올해 탭, 1월에는 작년 탭도 함께 동기화
+    sheet_tabs = tuple(
+        tab.strip() for tab in os.getenv("SHEET_TABS", "").split(",") if tab.strip()
+    )
+    # WRITE_CONCURRENCY가 있으면 이벤트 추가/수정/삭제 배치를 동시에 실행하고,
+    # LIST_CONCURRENCY가 있으면 이벤트 목록을 월 단위로 나눠 동시에 조회
+    pair = SyncPair(
+        name="main",
+        sheet_id=sheet_id,
+        calendar_id=calendar_id,
+        sheet_range=os.getenv("SHEET_RANGE") or DEFAULT_SHEET_RANGE,
+        sheet_tabs=sheet_tabs,
+        mirror_path=os.getenv("CALENDAR_MIRROR_PATH") or None,
+        snapshot_path=os.getenv("SHEET_SNAPSHOT_PATH") or None,
+        journal_path=os.getenv("SYNC_JOURNAL_PATH") or None,
+        write_concurrency=int(os.getenv("WRITE_CONCURRENCY") or 0),
+        list_concurrency=int(os.getenv("LIST_CONCURRENCY") or 0),
+        # FUZZY_MATCH_THRESHOLD(0~1)가 있으면 이름이 조금 바뀐 행은 기존 이벤트를 수정
+        fuzzy_threshold=float(os.getenv("FUZZY_MATCH_THRESHOLD") or 0),
+        # SHEET_CHUNK_ROWS가 있으면 시트를 행 블록으로 나눠 동시에 조회
+        sheet_chunk_rows=int(os.getenv("SHEET_CHUNK_ROWS") or 0),
+        min_week=int(os.getenv("SYNC_MIN_WEEK") or DEFAULT_MIN_WEEK),
+        # SYNC_DELETE_REMOVED가 켜져 있으면 시트에서 지운 행의 이벤트도 삭제
+        delete_removed=os.getenv("SYNC_DELETE_REMOVED", "").lower()
+        in ("1", "true", "yes"),
+    )
+    return [pair], 1
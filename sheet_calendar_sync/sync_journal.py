@@ -0,0 +1,124 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+PLANNED = "planned"
+DONE = "done"
+FAILED = "failed"
+
+
+def make_event_id(calendar_id: str, key: Tuple[str, str]) -> str:
+    """캘린더와 이벤트 매칭 키로 항상 같은 이벤트 ID를 만듭니다.
+
+    캘린더 이벤트 ID는 base32hex 문자(a-v, 0-9)로 5~1024자여야 하므로 sha1 hex
+    값을 사용합니다. 같은 이벤트를 다시 추가하면 API가 409를 반환하므로 재실행해도
+    중복 이벤트가 생기지 않습니다.
+
+    Args:
+        calendar_id: 구글 캘린더 ID
+        key: (정규화된 summary, YYYY-MM-DD 날짜)
+
+    Returns:
+        40자리 hex 이벤트 ID
+    """
+    source = f"{calendar_id}|{key[0]}|{key[1]}"
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+
+class SyncJournal:
+    def __init__(self, path: str):
+        """캘린더 변경 작업의 append-only 작업 기록을 초기화합니다.
+
+        작업을 보내기 전에 planned로 기록하고, 결과가 나오면 done/failed를
+        덧붙입니다. 중간에 프로세스가 종료되면 마지막 상태가 planned인 작업만
+        다음 실행에서 이어서 처리합니다.
+
+        Args:
+            path: 작업 기록(JSON lines) 파일 경로
+        """
+        self.path = path
+
+    def record_planned(self, operations: Iterable[Dict]) -> None:
+        """보내기 전의 작업들을 planned 상태로 기록합니다."""
+        self._append(
+            {**operation, "status": PLANNED} for operation in operations
+        )
+
+    def record_result(
+        self, op_id: str, status: str, error: Optional[str] = None
+    ) -> None:
+        """작업 결과를 기록합니다."""
+        self.record_results([(op_id, status, error)])
+
+    def record_results(self, results: Iterable[Tuple[str, str, Optional[str]]]) -> None:
+        """여러 작업 결과를 한 번에 기록합니다.
+
+        Args:
+            results: (작업 ID, 상태, 오류 메시지) 목록
+        """
+        self._append(
+            {"op_id": op_id, "status": status, "error": error}
+            for op_id, status, error in results
+        )
+
+    def pending(self, calendar_id: Optional[str] = None) -> List[Dict]:
+        """마지막 상태가 planned인 (끝나지 않은) 작업을 기록 순서대로 반환합니다.
+
+        Args:
+            calendar_id: 지정하면 해당 캘린더의 작업만 반환
+
+        Returns:
+            planned로 기록된 작업 목록
+        """
+        operations: Dict[str, Dict] = {}
+        for entry in self._read():
+            op_id = entry["op_id"]
+            if entry["status"] == PLANNED:
+                operations[op_id] = entry
+            elif op_id in operations:
+                operations[op_id] = {**operations[op_id], "status": entry["status"]}
+        return [
+            operation
+            for operation in operations.values()
+            if operation["status"] == PLANNED
+            and (calendar_id is None or operation.get("calendar_id") == calendar_id)
+        ]
+
+    def compact(self) -> None:
+        """끝나지 않은 작업만 남기고 기록 파일을 다시 씁니다."""
+        pending = self.pending()
+        if not pending:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for operation in pending:
+                f.write(json.dumps(operation, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def _append(self, entries: Iterable[Dict]) -> None:
+        recorded_at = datetime.now().isoformat()
+        with open(self.path, "a", encoding="utf-8") as f:
+            for entry in entries:
+                entry = {**entry, "recorded_at": recorded_at}
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _read(self) -> List[Dict]:
+        if not os.path.exists(self.path):
+            return []
+        entries = []
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # 기록 도중 종료되어 잘린 마지막 줄은 무시
+                    continue
+        return entries
@@ -0,0 +1,195 @@
+import re
+import traceback
+from functools import lru_cache
+from typing import Iterable, List
+from datetime import date, timedelta
+
+# 날짜 문자열 파싱 결과 캐시 크기 (시트/캘린더에는 같은 날짜가 반복해서 나옴)
+DATE_CACHE_SIZE = 4096
+
+# RFC3339 날짜/시간 (Calendar API의 date, dateTime 값)
+_RFC3339_DATE = re.compile(r"(\d{4})-(\d{2})-(\d{2})(?:[T ]|$)")
+# 시트 기간 열 (예: "2025.03.01 ~ 2025.03.31", "2025.3.1")
+_SHEET_DATE_RANGE = re.compile(
+    r"\s*(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.?\s*"
+    r"(?:~\s*(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.?\s*)?"
+)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date(datetime_str: str) -> date:
+    """날짜/시간 문자열에서 날짜를 구합니다.
+
+    Calendar API가 반환하는 RFC3339 형식은 앞의 YYYY-MM-DD만 읽어 바로 처리하고,
+    그 밖의 형식만 dateutil로 파싱합니다. 결과는 입력값별로 캐시됩니다.
+
+    Args:
+        datetime_str: 변환할 날짜/시간 문자열
+
+    Returns:
+        날짜
+    """
+    match = _RFC3339_DATE.match(datetime_str)
+    if match:
+        try:
+            return date(*map(int, match.groups()))
+        except ValueError:
+            pass
+    from dateutil.parser import parse
+
+    return parse(datetime_str).date()
+
+
+def transform_datetime_to_date(datetime_str: str, time_delta: int = 0) -> str:
+    """날짜/시간 문자열을 날짜 형식으로 변환합니다.
+
+    Args:
+        datetime_str: 변환할 날짜/시간 문자열
+        time_delta: 날짜 조정값 (일 단위)
+
+    Returns:
+        ISO 형식의 날짜 문자열 (YYYY-MM-DD)
+    """
+    date_obj = parse_date(datetime_str)
+    if time_delta:
+        date_obj += timedelta(time_delta)
+    return date_obj.isoformat()
+
+
+def transform_datetimes_to_dates(
+    datetime_strs: Iterable[str], time_delta: int = 0
+) -> List[str]:
+    """날짜/시간 열 전체를 한 번에 날짜 형식으로 변환합니다. 같은 값은 한 번만
+    변환합니다.
+
+    Args:
+        datetime_strs: 변환할 날짜/시간 문자열 목록
+        time_delta: 날짜 조정값 (일 단위)
+
+    Returns:
+        입력 순서와 같은 ISO 형식 날짜 문자열 목록
+    """
+    converted = {}
+    result = []
+    for value in datetime_strs:
+        if value not in converted:
+            converted[value] = transform_datetime_to_date(value, time_delta)
+        result.append(converted[value])
+    return result
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def transform_range_date_to_date(date_range_str: str) -> str:
+    """날짜 범위 문자열을 단일 날짜로 변환합니다.
+
+    "YYYY.MM.DD ~ YYYY.MM.DD" 형식은 정규식으로 바로 처리하고, 그 밖의 형식은
+    기존 방식대로 구분자를 바꿔 처리합니다. 결과는 입력값별로 캐시됩니다.
+
+    Args:
+        date_range_str: 변환할 날짜 범위 문자열 (예: "2025.03.01 ~ 2025.03.31")
+
+    Returns:
+        ISO 형식의 날짜 문자열 (YYYY-MM-DD)
+    """
+    match = _SHEET_DATE_RANGE.fullmatch(date_range_str)
+    if match:
+        start = tuple(int(part) for part in match.groups()[:3])
+        end = start
+        if match.group(4):
+            end = tuple(int(part) for part in match.groups()[3:])
+            if start > end:
+                raise ValueError("시작 날짜가 종료 날짜보다 늦습니다.")
+        return f"{end[0]:04d}-{end[1]:02d}-{end[2]:02d}"
+
+    date_range_str_cleaned = (
+        remove_non_words(date_range_str).replace(" ", "").replace("  ", "")
+    )
+    # print(date_range_str_cleaned)
+
+    date_parts = date_range_str_cleaned.split("~")
+
+    if len(date_parts) == 1:
+        transformed_date = f"{date_parts[0].replace('.', '-')}"
+    else:
+        start_date = date_parts[0]
+        end_date = date_parts[1]
+
+        if start_date > end_date:
+            print(traceback.format_exc())
+            raise ValueError("시작 날짜가 종료 날짜보다 늦습니다.")
+
+        transformed_date = f"{end_date.replace('.', '-')}"
+
+    return transformed_date
+
+
+def remove_non_words(string: str) -> str:
+    """문자열에서 공백과 줄바꿈을 제거합니다.
+
+    Args:
+        string: 처리할 문자열
+
+    Returns:
+        공백과 줄바꿈이 제거된 문자열
+    """
+    # patterns = [" ", "\n"]
+    pattern = re.compile(r"\s+|\n")
+    # pattern_regex = "|".join(map(re.escape, patterns))
+    string = re.sub(pattern, "", string)
+
+    return string
+
+
+def normalize_date_str(date_str: str) -> str:
+    """YYYY-M-D, YYYY.M.D 형식의 날짜 문자열을 YYYY-MM-DD 형식으로 맞춥니다.
+
+    Args:
+        date_str: 정규화할 날짜 문자열
+
+    Returns:
+        YYYY-MM-DD 형식의 날짜 문자열 (형식이 다르면 입력값 그대로)
+    """
+    parts = re.split(r"[-.]", remove_non_words(date_str).strip("."))
+    if len(parts) != 3 or not all(part.isdigit() for part in parts):
+        return date_str
+    year, month, day = (int(part) for part in parts)
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+def get_range_start_row(sheet_range: str) -> int:
+    """A1 표기 범위에서 시작 행 번호를 구합니다.
+
+    Args:
+        sheet_range: 시트 범위 (예: "2025년!E5:M")
+
+    Returns:
+        시작 행 번호 (행 번호가 없으면 1)
+    """
+    cell_range = sheet_range.rsplit("!", 1)[-1]
+    match = re.match(r"[A-Za-z]*(\d+)", cell_range)
+    return int(match.group(1)) if match else 1
+
+
+def find_non_matched_items(new_items: List, existing_items: List) -> List:
+    """두 목록을 비교하여 일치하지 않는 항목을 찾습니다.
+
+    Args:
+        new_items: 새로운 항목 목록
+        existing_items: 기존 항목 목록
+
+    Returns:
+        일치하지 않는 항목 목록
+    """
+    non_matched_items = []
+    existing_set = set(existing_items)
+
+    for item in new_items:
+        if item not in existing_set:
+            non_matched_items.append(item)
+
+    return non_matched_items
+
+
+# if __name__ == "__main__":
+#     range_date = "2025.03.01 ~ 2025.03.31"
+#     print(transform_range_date_to_date(range_date))
@@ -0,0 +1,105 @@
+import json
+import pytest
+from googleapiclient.discovery import build
+from googleapiclient.errors import BatchError, HttpError
+from googleapiclient.http import HttpMockSequence
+from sheet_calendar_sync.batch_executor import BatchExecutor
+from sheet_calendar_sync.quota_governor import QuotaGovernor
+
+BATCH_HEADERS = {"status": "200", "content-type": 'multipart/mixed; boundary="b"'}
+
+
+def batch_reply(*parts):
+    """(Content-ID, 상태 코드, 응답 본문) 목록으로 배치 응답 본문을 만듭니다."""
+    body = "".join(
+        "--b\r\nContent-Type: application/http\r\n"
+        f"Content-ID: <{content_id}>\r\n\r\n"
+        f"HTTP/1.1 {status} X\r\nContent-Type: application/json\r\n\r\n"
+        f"{json.dumps(payload)}\r\n"
+        for content_id, status, payload in parts
+    )
+    return BATCH_HEADERS, body + "--b--"
+
+
+def error_payload(status, reason):
+    return {"error": {"code": status, "errors": [{"reason": reason}]}}
+
+
+@pytest.fixture
+def service():
+    return build("calendar", "v3", http=HttpMockSequence([]), cache_discovery=False)
+
+
+@pytest.fixture
+def governor():
+    return QuotaGovernor({"calendar": 1000}, sleep=lambda _: None)
+
+
+def insert_requests(service, count):
+    return [
+        (f"k{index}", service.events().insert(calendarId="c", body={}))
+        for index in range(count)
+    ]
+
+
+def test_failing_sub_response_fails_only_that_request(service):
+    http = HttpMockSequence(
+        [
+            batch_reply(
+                ("response-x + 0", 200, {"id": "a"}),
+                ("response-x + 1", 404, error_payload(404, "notFound")),
+            )
+        ]
+    )
+
+    results = BatchExecutor(service, http=http).execute(insert_requests(service, 2))
+
+    assert [result.key for result in results] == ["k0", "k1"]
+    assert results[0].ok and results[0].response == {"id": "a"}
+    assert isinstance(results[1].error, HttpError)
+    assert results[1].error.resp.status == 404
+
+
+def test_retries_only_failed_sub_responses(service, governor):
+    http = HttpMockSequence(
+        [
+            batch_reply(
+                ("response-x + 0", 200, {"id": "a"}),
+                ("response-x + 1", 503, error_payload(503, "backendError")),
+            ),
+            batch_reply(("response-x + 1", 200, {"id": "b"})),
+        ]
+    )
+
+    results = BatchExecutor(service, http=http, governor=governor).execute(
+        insert_requests(service, 2)
+    )
+
+    assert [result.response for result in results] == [{"id": "a"}, {"id": "b"}]
+    assert governor.counters()["calendar"]["retries"] == 1
+
+
+def test_missing_sub_response_fails_whole_batch(service, governor):
+    http = HttpMockSequence([batch_reply(("response-x + 0", 200, {"id": "a"}))])
+
+    results = BatchExecutor(service, http=http, governor=governor).execute(
+        insert_requests(service, 2)
+    )
+
+    assert len(results) == 2
+    assert not any(result.ok for result in results)
+    assert all(isinstance(result.error, BatchError) for result in results)
+
+
+def test_batch_error_without_response_is_not_retried(service, governor):
+    # "+"가 없는 Content-ID는 응답 객체가 없는 BatchError가 됨
+    http = HttpMockSequence([batch_reply(("response-0", 200, {"id": "a"}))])
+
+    results = BatchExecutor(service, http=http, governor=governor).execute(
+        insert_requests(service, 2)
+    )
+
+    assert not any(result.ok for result in results)
+    assert all(result.error.resp is None for result in results)
+    assert not governor.is_retryable(results[0].error)
+    assert governor.counters()["calendar"]["failures"] == 2
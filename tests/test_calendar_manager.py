@@ -0,0 +1,69 @@
+import json
+from datetime import date, timedelta
+from urllib.parse import parse_qs, urlsplit
+import pytest
+from googleapiclient.http import HttpMockSequence
+from sheet_calendar_sync.calendar_manager import GoogleCalendarManager
+from sheet_calendar_sync.calendar_mirror import CalendarMirror
+from sheet_calendar_sync.quota_governor import QuotaGovernor
+from sheet_calendar_sync.service import GoogleService
+
+CALENDAR_ID = "team@group.calendar.google.com"
+JSON_HEADERS = {"status": "200", "content-type": "application/json"}
+
+
+class RecordingHttp(HttpMockSequence):
+    """보낸 요청의 URI를 기록하는 HttpMockSequence"""
+
+    def __init__(self, iterable):
+        super().__init__(iterable)
+        self.uris = []
+
+    def request(self, uri, *args, **kwargs):
+        self.uris.append(uri)
+        return super().request(uri, *args, **kwargs)
+
+
+def make_event(event_id, day):
+    return {
+        "id": event_id,
+        "summary": event_id,
+        "start": {"date": day.isoformat()},
+        "end": {"date": (day + timedelta(days=1)).isoformat()},
+    }
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    mirror = CalendarMirror(CALENDAR_ID, str(tmp_path / "mirror.sqlite3"))
+    yield mirror
+    mirror.close()
+
+
+def make_manager(http):
+    google_service = GoogleService(
+        governor=QuotaGovernor({"calendar": 1000}, sleep=lambda _: None)
+    )
+    return GoogleCalendarManager(google_service, CALENDAR_ID, http=http)
+
+
+def test_expired_sync_token_resyncs_mirror(mirror):
+    today = date.today()
+    mirror.apply_events([make_event("stale", today)])
+    mirror.set_sync_token("expired-token")
+    gone = {"error": {"code": 410, "errors": [{"reason": "fullSyncRequired"}]}}
+    full = {"items": [make_event("fresh", today)], "nextSyncToken": "new-token"}
+    http = RecordingHttp(
+        [
+            ({"status": "410", "content-type": "application/json"}, json.dumps(gone)),
+            (JSON_HEADERS, json.dumps(full)),
+        ]
+    )
+
+    events = make_manager(http).get_calendar_data_incremental(mirror, 4)
+
+    assert [event["id"] for event in events] == ["fresh"]
+    assert mirror.get_sync_token() == "new-token"
+    queries = [parse_qs(urlsplit(uri).query) for uri in http.uris]
+    assert queries[0]["syncToken"] == ["expired-token"]
+    assert "syncToken" not in queries[1]
@@ -0,0 +1,36 @@
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# --help를 실행한 뒤 불러온 모듈 이름을 한 줄씩 출력
+HELP_MODULES = """
+import runpy, sys
+sys.argv = ["sheet-calendar-sync", "--help"]
+try:
+    runpy.run_module("sheet_calendar_sync.cli", run_name="__main__")
+except SystemExit:
+    pass
+print("\\n".join(sys.modules), file=sys.stderr)
+"""
+
+
+def help_modules():
+    process = subprocess.run(
+        [sys.executable, "-c", HELP_MODULES],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert "usage: sheet-calendar-sync" in process.stdout
+    return set(process.stderr.split())
+
+
+def test_help_does_not_import_api_client():
+    modules = help_modules()
+    assert not {
+        module for module in modules if module.split(".")[0] == "googleapiclient"
+    }
+    assert "sheet_calendar_sync.daemon" not in modules
+    assert "sheet_calendar_sync.sheet_manager" not in modules